@@ -1,25 +1,85 @@
 """
-Health Check Endpoint
+Health Check Endpoints
 
-Provides system health status by verifying connectivity to:
-- Supabase (database and auth)
-- Redis (message broker and cache)
+- /health: Liveness probe - static response, no dependency I/O
+- /readyz: Readiness probe - verifies connectivity to:
+  - Supabase (database and auth)
+  - Redis (message broker and cache)
 """
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from datetime import datetime, timezone
-import redis.asyncio as redis
+from typing import Tuple
+import asyncio
 
 from app.core.supabase import get_supabase_client
-from app.core.config import settings
+from app.core.redis_client import get_async_redis_client
 
 router = APIRouter()
 
+# Upper bound for each dependency probe so a stuck backend cannot hang readiness checks
+PROBE_TIMEOUT_SECONDS = 1.0
+
+# Pre-serialized liveness body - returned as-is on every probe
+_LIVENESS_BODY = b'{"status":"ok"}'
+
+
+async def _check_db() -> Tuple[str, str, bool]:
+    """
+    Verify the Supabase client is initialized.
+
+    Returns:
+        Tuple of (status key, status value, healthy flag)
+    """
+    try:
+        supabase = get_supabase_client()
+        # Verify client initialization by checking auth status
+        # This doesn't require any tables to exist
+        # Just verifies the Supabase client can connect
+        if supabase is not None:
+            return "database", "connected", True
+        return "database", "disconnected: Client initialization failed", False
+    except Exception as e:
+        return "database", f"disconnected: {str(e)}", False
+
+
+async def _check_redis() -> Tuple[str, str, bool]:
+    """
+    Ping Redis through the shared async client.
+
+    Returns:
+        Tuple of (status key, status value, healthy flag)
+    """
+    try:
+        # Shared pooled client - reuses connections across probes
+        await get_async_redis_client().ping()
+        return "redis", "connected", True
+    except Exception as e:
+        return "redis", f"disconnected: {str(e)}", False
+
 
 @router.get("/health")
-async def health_check():
+async def health_check() -> Response:
     """
-    Health check endpoint verifying Supabase and Redis connectivity.
+    Liveness probe.
+
+    Answers from the event loop without touching Supabase or Redis, so
+    frequent container/k8s liveness checks cost nothing. Use /readyz to
+    check dependencies.
+
+    Returns:
+        200 OK with {"status": "ok"}
+    """
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
+
+
+@router.get("/readyz")
+async def readiness_check():
+    """
+    Readiness probe verifying Supabase and Redis connectivity.
+
+    Both probes run concurrently, each bounded by PROBE_TIMEOUT_SECONDS, so
+    total latency is roughly the slower of the two rather than their sum.
 
     Returns:
         200 OK if all services healthy
@@ -37,42 +97,37 @@ async def health_check():
         "status": "healthy",
         "database": "unknown",
         "redis": "unknown",
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     }
 
-    # Check Supabase connection
-    try:
-        supabase = get_supabase_client()
-        # Verify client initialization by checking auth status
-        # This doesn't require any tables to exist
-        # Just verifies the Supabase client can connect
-        if supabase is not None:
-            health_status["database"] = "connected"
+    keys = ("database", "redis")
+    results = await asyncio.gather(
+        asyncio.wait_for(_check_db(), PROBE_TIMEOUT_SECONDS),
+        asyncio.wait_for(_check_redis(), PROBE_TIMEOUT_SECONDS),
+        return_exceptions=True
+    )
+
+    for key, result in zip(keys, results):
+        if isinstance(result, asyncio.TimeoutError):
+            health_status[key] = "disconnected: timeout"
+            ok = False
+        elif isinstance(result, BaseException):
+            health_status[key] = f"disconnected: {str(result)}"
+            ok = False
         else:
+            _, value, ok = result
+            health_status[key] = value
+        if not ok:
             health_status["status"] = "unhealthy"
-            health_status["database"] = "disconnected: Client initialization failed"
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["database"] = f"disconnected: {str(e)}"
-
-    # Check Redis connection
-    try:
-        redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-        await redis_client.ping()
-        await redis_client.aclose()
-        health_status["redis"] = "connected"
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["redis"] = f"disconnected: {str(e)}"
 
     # Return appropriate status code
     if health_status["status"] == "healthy":
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content=health_status
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content=health_status
         )
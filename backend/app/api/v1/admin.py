@@ -8,14 +8,17 @@ import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.dependencies.admin import require_superuser
-from app.core.supabase import get_supabase_client
+from app.dependencies.admin import require_superuser, get_admin_service
+from app.core.redis_client import get_async_redis_client
 from app.schemas.auth import AuthenticatedUser, SubscriptionTier
 from app.schemas.admin import (
     SystemStats,
     UserListResponse,
     TierUpdateRequest,
-    TierUpdateResponse
+    TierUpdateResponse,
+    TierFilter,
+    UserSortField,
+    SortOrder
 )
 from app.services.admin_service import AdminService
 
@@ -23,11 +26,39 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# Stats are global (no user dimension), so every admin shares one cache entry
+STATS_CACHE_KEY = "admin:stats"
+STATS_CACHE_TTL = 30
+
+
+async def _get_cached_stats() -> Optional[SystemStats]:
+    """Read cached system stats; returns None on cache miss or Redis failure."""
+    try:
+        cached = await get_async_redis_client().get(STATS_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Stats cache read failed: {str(e)}")
+        return None
+    if cached is None:
+        return None
+    try:
+        return SystemStats.model_validate_json(cached)
+    except ValueError as e:
+        logger.warning(f"Discarding malformed stats cache entry: {str(e)}")
+        return None
+
+
+async def _set_cached_stats(stats: SystemStats) -> None:
+    """Cache system stats; failures are logged and ignored."""
+    try:
+        await get_async_redis_client().setex(STATS_CACHE_KEY, STATS_CACHE_TTL, stats.model_dump_json())
+    except Exception as e:
+        logger.warning(f"Stats cache write failed: {str(e)}")
+
 
 @router.get("/stats", response_model=SystemStats)
 async def get_system_stats(
     user: AuthenticatedUser = Depends(require_superuser),
-    supabase = Depends(get_supabase_client)
+    admin_service: AdminService = Depends(get_admin_service)
 ) -> SystemStats:
     """
     Get system-wide statistics for admin dashboard.
@@ -44,6 +75,9 @@ async def get_system_stats(
     - `active_jobs`: Count of jobs in processing or pending status
     - `monthly_conversions`: Conversions completed in current month
 
+    Results are cached in Redis for STATS_CACHE_TTL seconds, so counters may
+    lag by up to that long.
+
     **Error Responses:**
     - 401 Unauthorized: Missing or invalid authentication token
     - 403 Forbidden: User does not have admin privileges
@@ -64,11 +98,12 @@ async def get_system_stats(
     }
     ```
     """
+    cached = await _get_cached_stats()
+    if cached is not None:
+        return cached
+
     try:
-        admin_service = AdminService(supabase)
         stats = await admin_service.get_system_stats()
-        return stats
-
     except Exception as e:
         logger.error(f"Failed to fetch system stats: {e}")
         raise HTTPException(
@@ -76,17 +111,27 @@ async def get_system_stats(
             detail="Failed to fetch system statistics"
         )
 
+    await _set_cached_stats(stats)
+    return stats
+
 
-@router.get("/users", response_model=UserListResponse)
+# Responses are assembled from already-validated models via model_construct;
+# response_model=None skips FastAPI's second validation pass while `responses`
+# keeps the schema in the OpenAPI docs.
+@router.get(
+    "/users",
+    response_model=None,
+    responses={200: {"model": UserListResponse}}
+)
 async def get_users(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Users per page (max 100)"),
     search: Optional[str] = Query(None, description="Filter by email (case-insensitive)"),
-    tier_filter: Optional[str] = Query(None, description="Filter by tier (ALL, FREE, PRO, PREMIUM)"),
-    sort_by: str = Query("created_at", description="Column to sort by"),
-    sort_order: str = Query("desc", description="Sort order (asc, desc)"),
+    tier_filter: Optional[TierFilter] = Query(None, description="Filter by tier (ALL, FREE, PRO, PREMIUM)"),
+    sort_by: UserSortField = Query("created_at", description="Column to sort by"),
+    sort_order: SortOrder = Query("desc", description="Sort order (asc, desc)"),
     user: AuthenticatedUser = Depends(require_superuser),
-    supabase = Depends(get_supabase_client)
+    admin_service: AdminService = Depends(get_admin_service)
 ) -> UserListResponse:
     """
     Get paginated list of users with filtering and sorting.
@@ -115,6 +160,7 @@ async def get_users(
     **Error Responses:**
     - 401 Unauthorized: Missing or invalid authentication token
     - 403 Forbidden: User does not have admin privileges
+    - 422 Unprocessable Entity: Unknown tier_filter, sort_by or sort_order value
     - 500 Internal Server Error: Database query failure
 
     **Example:**
@@ -144,8 +190,6 @@ async def get_users(
     ```
     """
     try:
-        admin_service = AdminService(supabase)
-
         result = await admin_service.get_users(
             page=page,
             page_size=page_size,
@@ -155,7 +199,8 @@ async def get_users(
             sort_order=sort_order
         )
 
-        return UserListResponse(**result)
+        # AdminUserInfo items are validated by the service - skip re-validation
+        return UserListResponse.model_construct(**result)
 
     except Exception as e:
         logger.error(f"Failed to fetch user list: {e}")
@@ -165,12 +210,16 @@ async def get_users(
         )
 
 
-@router.patch("/users/{user_id}/tier", response_model=TierUpdateResponse)
+@router.patch(
+    "/users/{user_id}/tier",
+    response_model=None,
+    responses={200: {"model": TierUpdateResponse}}
+)
 async def update_user_tier(
     user_id: str,
     request: TierUpdateRequest,
     admin_user: AuthenticatedUser = Depends(require_superuser),
-    supabase = Depends(get_supabase_client)
+    admin_service: AdminService = Depends(get_admin_service)
 ) -> TierUpdateResponse:
     """
     Update a user's subscription tier.
@@ -226,11 +275,10 @@ async def update_user_tier(
     - User will bypass tier limits on next request
     """
     try:
-        admin_service = AdminService(supabase)
-
         result = await admin_service.update_user_tier(user_id, request.tier)
 
-        return TierUpdateResponse(**result)
+        # Service output is trusted (all str fields) - skip re-validation
+        return TierUpdateResponse.model_construct(**result)
 
     except ValueError as e:
         # Invalid tier or user not found
@@ -4,12 +4,25 @@ Jobs API Endpoints
 Handles conversion job listing, details, deletion, and download operations.
 All business logic delegated to JobService (Service Pattern).
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from datetime import datetime
-from typing import Optional
-import logging
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from datetime import datetime, timezone
+from functools import lru_cache
+import hashlib
+import time
+from types import MappingProxyType
+from typing import Annotated, Dict, List, NamedTuple, Optional, Union
+from uuid import UUID
+
+import orjson
+import redis
+from pydantic import TypeAdapter
 
 from app.core.auth import get_current_user
+from app.dependencies.log_context import bind_log_context
+from app.middleware.rate_limit import limit_progress_polling
+from app.core.logging_config import get_logger
 from app.schemas.auth import AuthenticatedUser
 from app.schemas.job import (
     JobListResponse,
@@ -20,31 +33,297 @@ from app.schemas.progress import ProgressUpdate, ElementsDetected
 from app.schemas.feedback import FeedbackSubmitRequest, FeedbackResponse, FeedbackListResponse, FeedbackItem
 from app.schemas.issue import IssueReportRequest, IssueReportResponse, IssueListResponse, IssueItem
 from app.core.supabase import get_supabase_client
-from app.core.redis_client import init_redis_client
+from app.core.redis_client import init_redis_client, get_async_redis_client
+from app.core.celery_app import celery_app
 from app.services.storage.supabase_storage import SupabaseStorageService
-from app.services.job_service import JobService
-
-router = APIRouter()
-logger = logging.getLogger(__name__)
+from app.services.analytics_queue import get_analytics_queue
+from app.services.job_service import JobService, ProgressRow, progress_cache_key, progress_cache_ttl
+
+# user_id/job_id are bound to the structlog context for every route, so
+# handler log events don't pass them explicitly
+router = APIRouter(dependencies=[Depends(bind_log_context)])
+logger = get_logger(__name__)
+
+# Dispatched by name so the API process never imports task modules on the request path
+DELETE_TASK_NAME = "app.tasks.cleanup.delete_job_task"
+
+# Upper bound on job IDs accepted by the batch progress endpoint
+MAX_PROGRESS_BATCH = 50
+
+# Fallback progress descriptions when the pipeline hasn't set one in stage_metadata
+STAGE_DESCRIPTIONS = MappingProxyType({
+    "COMPLETED": "Conversion completed successfully!",
+    "FAILED": "Conversion failed",
+    "ANALYZING": "Analyzing document layout...",
+    "EXTRACTING": "Extracting content...",
+    "STRUCTURING": "Identifying document structure...",
+    "GENERATING": "Generating EPUB file...",
+    "PROCESSING": "Processing...",
+    "QUEUED": "Queued for processing...",
+})
+DEFAULT_STAGE_DESCRIPTION = "Waiting to start..."
+
+# Validate whole RPC result lists in one pydantic-core call instead of per row
+_FEEDBACK_LIST_ADAPTER = TypeAdapter(List[FeedbackItem])
+_ISSUE_LIST_ADAPTER = TypeAdapter(List[IssueItem])
 
 
 def get_job_service() -> JobService:
     """
-    Dependency for getting initialized JobService with Redis caching.
+    Dependency for getting the shared JobService with Redis caching.
+
+    JobService is stateless apart from its clients, which are process-wide
+    singletons, so one instance is reused for every request. The instance is
+    keyed on the Redis client: a service built while Redis was down is
+    replaced as soon as init_redis_client() reconnects, instead of running
+    uncached for the life of the process.
 
     Returns:
-        JobService: Configured job service instance with optional Redis cache
+        JobService: Shared job service instance with optional Redis cache
+    """
+    # Process-wide client on the shared pool; no per-request connection setup
+    return _job_service_for(init_redis_client())
+
+
+@lru_cache(maxsize=1)
+def _job_service_for(redis_client: Optional[redis.Redis]) -> JobService:
+    """
+    Build the shared JobService bound to redis_client.
+
+    Call _job_service_for.cache_clear() to rebuild it (e.g. in tests).
     """
     supabase = get_supabase_client()
-    storage_service = SupabaseStorageService(supabase)
-    redis_client = init_redis_client()
-    return JobService(supabase, storage_service, redis_client)
+    return JobService(supabase, SupabaseStorageService(supabase), redis_client)
+
+
+class JobContext(NamedTuple):
+    """Authenticated user plus the shared JobService for one request."""
+    user: AuthenticatedUser
+    job_service: JobService
+
+
+async def get_job_context(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
+) -> JobContext:
+    """
+    Composite dependency for the high-frequency polling endpoints.
+
+    The service is resolved through Depends(get_job_service) like every
+    other route in this router, so overriding get_job_service swaps it
+    here too.
+
+    Args:
+        current_user: Authenticated user from JWT token
+        job_service: Shared job service
+
+    Returns:
+        JobContext: The user and the shared job service
+    """
+    return JobContext(current_user, job_service)
+
+
+JobCtx = Annotated[JobContext, Depends(get_job_context)]
+
+
+def _build_progress_update(job: Union[ProgressRow, JobDetail]) -> ProgressUpdate:
+    """
+    Assemble the polling payload for a job from its row data.
+
+    Args:
+        job: Progress row or full job details (status, progress, stage_metadata, quality_report)
+
+    Returns:
+        ProgressUpdate: Progress payload for the job
+    """
+    # Extract progress metadata from stage_metadata JSONB field
+    progress_data = job.stage_metadata or {}
+
+    # Extract elements detected (nested in progress metadata or quality report)
+    elements = progress_data.get("elements_detected") or {}
+    if not elements and job.quality_report:
+        # Fallback: extract from quality report if available
+        quality_elements = job.quality_report.get("elements", {})
+        elements = {
+            "tables": quality_elements.get("tables", {}).get("count", 0),
+            "images": quality_elements.get("images", {}).get("count", 0),
+            "equations": quality_elements.get("equations", {}).get("count", 0),
+            "chapters": quality_elements.get("chapters", {}).get("count", 0)
+        }
+
+    # Extract quality confidence from quality report
+    quality_confidence = None
+    if job.quality_report:
+        quality_confidence = job.quality_report.get("overall_confidence")
+
+    # Extract estimated cost (priority: stage_metadata > quality_report)
+    estimated_cost = progress_data.get("estimated_cost")
+    if estimated_cost is None and job.quality_report:
+        estimated_cost = job.quality_report.get("estimated_cost")
+
+    # Determine stage description based on status if not in metadata
+    stage_description = (
+        progress_data.get("stage_description")
+        or STAGE_DESCRIPTIONS.get(job.status, DEFAULT_STAGE_DESCRIPTION)
+    )
+
+    # Inputs come from our own rows, so skip validation here; the values are
+    # coerced to the schema's types by hand and the response model still
+    # validates once at serialization.
+    estimated_time_remaining = progress_data.get("estimated_time_remaining")
+    timestamp = progress_data.get("timestamp")
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+
+    return ProgressUpdate.model_construct(
+        job_id=str(job.id),
+        status=job.status,
+        progress_percentage=int(job.progress or 0),
+        current_stage=progress_data.get("current_stage", job.status.lower()),
+        stage_description=stage_description,
+        elements_detected=ElementsDetected.model_construct(
+            tables=int(elements.get("tables", 0)),
+            images=int(elements.get("images", 0)),
+            equations=int(elements.get("equations", 0)),
+            chapters=int(elements.get("chapters", 0))
+        ),
+        estimated_time_remaining=int(estimated_time_remaining) if estimated_time_remaining is not None else None,
+        estimated_cost=float(estimated_cost) if estimated_cost is not None else None,
+        quality_confidence=int(quality_confidence) if quality_confidence else None,
+        timestamp=timestamp or datetime.utcnow()
+    )
+
+
+def _encode_progress_entry(user_id: str, payload: Dict) -> bytes:
+    """Serialize a JSON-mode progress payload together with its owner for caching."""
+    return orjson.dumps({"user_id": user_id, "progress": payload})
+
+
+def _decode_progress_payload(cached: Optional[str], user_id: str) -> Optional[Dict]:
+    """Deserialize a cached entry to its JSON payload; None on miss or if user_id is not the owner."""
+    if cached is None:
+        return None
+    entry = orjson.loads(cached)
+    if entry["user_id"] != user_id:
+        return None
+    return entry["progress"]
+
+
+def _decode_progress_entry(cached: Optional[str], user_id: str) -> Optional[ProgressUpdate]:
+    """Deserialize a cached entry; returns None on miss or if user_id is not the owner."""
+    payload = _decode_progress_payload(cached, user_id)
+    if payload is None:
+        return None
+    return ProgressUpdate.model_validate(payload)
+
+
+def _progress_etag(payload: Dict) -> str:
+    """
+    Weak ETag over the visible progress state of a JSON-mode payload.
+
+    The timestamp is left out so an unchanged job keeps the same tag even
+    when the payload is rebuilt (it falls back to "now" without metadata).
+    """
+    state = orjson.dumps({key: value for key, value in payload.items() if key != "timestamp"})
+    return f'W/"{hashlib.blake2b(state, digest_size=8).hexdigest()}"'
+
+
+def _progress_response(request: Request, payload: Dict) -> Response:
+    """
+    Render a progress payload, or a bodyless 304 if the client already has it.
+
+    The payload is already in JSON form (fresh model_dump or straight from
+    Redis), so it is written out with orjson without another Pydantic pass.
+    """
+    etag = _progress_etag(payload)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return ORJSONResponse(payload, headers={"ETag": etag})
+
+
+async def _get_cached_progress(job_id: str, user_id: str) -> Optional[Dict]:
+    """
+    Read a cached progress payload for the job owner.
+
+    Returns:
+        JSON-mode payload on a hit owned by user_id, None on miss, foreign
+        owner or Redis failure (the database path then applies the usual checks)
+    """
+    try:
+        cached = await get_async_redis_client().get(progress_cache_key(job_id))
+        return _decode_progress_payload(cached, user_id)
+    except Exception as e:
+        logger.warning("progress_cache_read_failed", job_id=job_id, error=str(e))
+        return None
+
+
+async def _set_cached_progress(job_id: str, user_id: str, payload: Dict) -> None:
+    """Cache a JSON-mode progress payload with its owner; failures are logged and ignored."""
+    try:
+        await get_async_redis_client().setex(
+            progress_cache_key(job_id),
+            progress_cache_ttl(payload["status"], payload.get("quality_confidence")),
+            _encode_progress_entry(user_id, payload)
+        )
+    except Exception as e:
+        logger.warning("progress_cache_write_failed", job_id=job_id, error=str(e))
+
+
+async def _get_cached_progress_many(job_ids: List[str], user_id: str) -> Dict[str, ProgressUpdate]:
+    """
+    Read cached progress payloads for several jobs with a single MGET.
+
+    Returns:
+        Mapping of job_id to ProgressUpdate for hits owned by user_id; empty on
+        Redis failure
+    """
+    try:
+        cached = await get_async_redis_client().mget([progress_cache_key(job_id) for job_id in job_ids])
+    except Exception as e:
+        logger.warning("progress_cache_read_failed", job_ids=job_ids, error=str(e))
+        return {}
+
+    hits = {}
+    for job_id, raw in zip(job_ids, cached):
+        try:
+            progress_update = _decode_progress_entry(raw, user_id)
+        except Exception as e:
+            logger.warning("progress_cache_entry_invalid", job_id=job_id, error=str(e))
+            continue
+        if progress_update is not None:
+            hits[job_id] = progress_update
+    return hits
+
+
+async def _set_cached_progress_many(user_id: str, updates: Dict[str, ProgressUpdate]) -> None:
+    """Cache several progress payloads in one pipelined round-trip; failures are ignored."""
+    if not updates:
+        return
+    try:
+        pipe = get_async_redis_client().pipeline(transaction=False)
+        for job_id, progress_update in updates.items():
+            pipe.setex(
+                progress_cache_key(job_id),
+                progress_cache_ttl(progress_update.status, progress_update.quality_confidence),
+                _encode_progress_entry(user_id, progress_update.model_dump(mode="json"))
+            )
+        await pipe.execute()
+    except Exception as e:
+        logger.warning("progress_cache_write_failed", job_ids=list(updates), error=str(e))
 
 
 @router.get(
     "/jobs",
     status_code=status.HTTP_200_OK,
-    response_model=JobListResponse,
+    # Built with model_construct from validated JobSummary items; skip FastAPI's
+    # response re-validation and keep the schema for OpenAPI via `responses`
+    response_model=None,
+    responses={200: {"model": JobListResponse}},
     summary="List conversion jobs",
     description="""
     List conversion jobs for the authenticated user with pagination and filtering.
@@ -92,37 +371,32 @@ async def list_jobs(
         HTTPException(401): Authentication failure
         HTTPException(500): Database error
     """
-    request_start = datetime.utcnow()
+    request_start = time.perf_counter_ns()
     logger.info(
         "list_jobs_request",
-        extra={
-            "user_id": current_user.user_id,
-            "limit": limit,
-            "offset": offset,
-            "status_filter": status_filter
-        }
+        limit=limit,
+        offset=offset,
+        status_filter=status_filter
     )
 
     try:
-        jobs, total = job_service.list_jobs(
+        jobs, total = await run_in_threadpool(
+            job_service.list_jobs,
             user_id=current_user.user_id,
             limit=limit,
             offset=offset,
             status=status_filter
         )
 
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
         logger.info(
             "list_jobs_success",
-            extra={
-                "user_id": current_user.user_id,
-                "jobs_returned": len(jobs),
-                "total_jobs": total,
-                "duration_ms": request_duration
-            }
+            jobs_returned=len(jobs),
+            total_jobs=total,
+            duration_ms=request_duration
         )
 
-        return JobListResponse(
+        return JobListResponse.model_construct(
             jobs=jobs,
             total=total,
             limit=limit,
@@ -132,10 +406,91 @@ async def list_jobs(
     except Exception as e:
         logger.error(
             "list_jobs_error",
-            extra={
-                "user_id": current_user.user_id,
-                "error": str(e)
-            },
+            error=str(e),
+            exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"detail": f"Database error: {str(e)}", "code": "DATABASE_ERROR"}
+        )
+
+
+@router.get(
+    "/jobs/progress",
+    status_code=status.HTTP_200_OK,
+    response_model=Dict[str, ProgressUpdate],
+    summary="Get progress for several jobs",
+    description="""
+    Get progress updates for up to 50 jobs in one request.
+
+    **Authentication Required:**
+    - Requires valid Supabase JWT token in Authorization header
+
+    **Query Parameters:**
+    - `ids`: Comma-separated job IDs (max 50)
+
+    **Returns:**
+    - 200 OK with a map of job ID to progress update
+    - Jobs that do not exist or are not owned by the user are omitted
+
+    **Designed for Dashboards:**
+    - Cached entries are read with a single Redis MGET
+    - Misses are loaded with one narrow database query and cached in one pipeline
+
+    **Error Codes:**
+    - `UNAUTHORIZED`: Missing or invalid JWT token
+    - `INVALID_JOB_IDS`: No IDs or more than 50 IDs supplied
+    - `DATABASE_ERROR`: Failed to query jobs
+    """
+)
+async def list_jobs_progress(
+    ctx: JobCtx,
+    ids: str = Query(..., description="Comma-separated job IDs (max 50)")
+) -> Dict[str, ProgressUpdate]:
+    """
+    Get progress updates for several jobs owned by the user.
+
+    Args:
+        ctx: Authenticated user and job service
+        ids: Comma-separated job identifiers
+
+    Returns:
+        Dict[str, ProgressUpdate]: Progress keyed by job ID (unknown jobs omitted)
+
+    Raises:
+        HTTPException(401): Authentication failure
+        HTTPException(422): Empty, oversized, or malformed ID list
+        HTTPException(500): Database error
+    """
+    current_user, job_service = ctx
+
+    # De-duplicate while keeping the caller's order
+    raw_ids = [job_id.strip() for job_id in ids.split(",") if job_id.strip()]
+    try:
+        job_ids = list(dict.fromkeys(str(UUID(job_id)) for job_id in raw_ids))
+    except ValueError:
+        job_ids = []
+    if not job_ids or len(job_ids) > MAX_PROGRESS_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "detail": f"ids must contain between 1 and {MAX_PROGRESS_BATCH} job UUIDs",
+                "code": "INVALID_JOB_IDS"
+            }
+        )
+
+    progress = await _get_cached_progress_many(job_ids, current_user.user_id)
+    missing_ids = [job_id for job_id in job_ids if job_id not in progress]
+    if not missing_ids:
+        return progress
+
+    try:
+        jobs = await run_in_threadpool(job_service.get_progress_rows, missing_ids, current_user.user_id)
+    except Exception as e:
+        logger.error(
+            "list_jobs_progress_error",
+            job_ids=missing_ids,
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -143,6 +498,11 @@ async def list_jobs(
             detail={"detail": f"Database error: {str(e)}", "code": "DATABASE_ERROR"}
         )
 
+    fetched = {job.id: _build_progress_update(job) for job in jobs}
+    await _set_cached_progress_many(current_user.user_id, fetched)
+    progress.update(fetched)
+    return progress
+
 
 @router.get(
     "/jobs/{job_id}",
@@ -167,7 +527,7 @@ async def list_jobs(
     """
 )
 async def get_job(
-    job_id: str,
+    job_id: UUID,
     include_quality_details: bool = Query(True, description="Include full quality report details"),
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
@@ -189,40 +549,26 @@ async def get_job(
         HTTPException(404): Job not found or user doesn't own job
         HTTPException(500): Database error
     """
-    request_start = datetime.utcnow()
-    logger.info(
-        "get_job_request",
-        extra={
-            "user_id": current_user.user_id,
-            "job_id": job_id
-        }
-    )
+    # Malformed IDs were already rejected with 422; services use the canonical string
+    job_id = str(job_id)
+    request_start = time.perf_counter_ns()
+    logger.info("get_job_request")
 
     try:
-        job = job_service.get_job(job_id, current_user.user_id)
+        job = await run_in_threadpool(job_service.get_job, job_id, current_user.user_id)
 
         if not job:
-            logger.warning(
-                "get_job_not_found",
-                extra={
-                    "user_id": current_user.user_id,
-                    "job_id": job_id
-                }
-            )
+            logger.warning("get_job_not_found")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "NOT_FOUND"}
             )
 
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
         logger.info(
             "get_job_success",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "duration_ms": request_duration,
-                "include_quality_details": include_quality_details
-            }
+            duration_ms=request_duration,
+            include_quality_details=include_quality_details
         )
 
         # Conditionally exclude quality report if not requested
@@ -233,14 +579,7 @@ async def get_job(
 
     except PermissionError as e:
         # Job exists but doesn't belong to user (403 Forbidden)
-        logger.warning(
-            "get_job_forbidden",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            }
-        )
+        logger.warning("get_job_forbidden", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={"detail": "You do not have permission to view this job", "code": "FORBIDDEN"}
@@ -248,15 +587,7 @@ async def get_job(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(
-            "get_job_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
-            exc_info=True
-        )
+        logger.error("get_job_error", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"detail": f"Database error: {str(e)}", "code": "DATABASE_ERROR"}
@@ -267,6 +598,7 @@ async def get_job(
     "/jobs/{job_id}/progress",
     status_code=status.HTTP_200_OK,
     response_model=ProgressUpdate,
+    dependencies=[Depends(limit_progress_polling)],
     summary="Get real-time conversion progress",
     description="""
     Get lightweight progress update for polling during conversion.
@@ -278,10 +610,15 @@ async def get_job(
     **Designed for Polling:**
     - Optimized for 2-second polling interval
     - Lightweight payload (<1KB) with only progress data
-    - Efficient database query (indexed job_id lookup)
+    - Served from a short-lived Redis cache; workers invalidate it on every update
+    - Completed/failed payloads stay cached for an hour and are returned pre-serialized
+    - Cache misses select only progress columns (no full quality report)
+    - Weak ETag on every response; send it back as If-None-Match to get 304 when unchanged
+    - Limited to 2 requests per second per user and job (429 with Retry-After beyond that)
 
     **Returns:**
     - 200 OK with current progress state
+    - 304 Not Modified (empty body) if the progress state matches If-None-Match
     - Includes: progress %, current stage, elements detected, cost estimate
 
     **Polling Behavior:**
@@ -292,43 +629,47 @@ async def get_job(
     **Error Codes:**
     - `UNAUTHORIZED`: Missing or invalid JWT token
     - `NOT_FOUND`: Job not found or user doesn't own job
+    - `RATE_LIMITED`: Polling faster than 2 requests per second
     - `DATABASE_ERROR`: Failed to query job
     """
 )
 async def get_job_progress(
-    job_id: str,
-    current_user: AuthenticatedUser = Depends(get_current_user),
-    job_service: JobService = Depends(get_job_service)
-) -> ProgressUpdate:
+    job_id: UUID,
+    ctx: JobCtx,
+    request: Request
+) -> Response:
     """
     Get real-time progress update for conversion job.
 
     Designed for efficient polling: returns only progress data, not full job object.
+    Responses carry a weak ETag; a matching If-None-Match gets a bodyless 304.
 
     Args:
         job_id: Job identifier (UUID)
-        current_user: Authenticated user from JWT token
-        job_service: Job service instance
+        ctx: Authenticated user and job service
+        request: Incoming request (for If-None-Match)
 
     Returns:
-        ProgressUpdate: Current progress state
+        Response: ProgressUpdate JSON with an ETag, or an empty 304 if unchanged
 
     Raises:
         HTTPException(401): Authentication failure
         HTTPException(404): Job not found or user doesn't own job
+        HTTPException(429): Polling rate limit exceeded
         HTTPException(500): Database error
     """
-    request_start = datetime.utcnow()
-    logger.debug(
-        "get_job_progress_request",
-        extra={
-            "user_id": current_user.user_id,
-            "job_id": job_id
-        }
-    )
+    job_id = str(job_id)
+    current_user, job_service = ctx
+    request_start = time.perf_counter_ns()
+    logger.debug("get_job_progress_request")
+
+    # Hits skip Pydantic entirely: the cached JSON payload is served as-is
+    cached = await _get_cached_progress(job_id, current_user.user_id)
+    if cached is not None:
+        return _progress_response(request, cached)
 
     try:
-        job = job_service.get_job(job_id, current_user.user_id)
+        job = await run_in_threadpool(job_service.get_progress_row, job_id, current_user.user_id)
 
         if not job:
             raise HTTPException(
@@ -336,93 +677,28 @@ async def get_job_progress(
                 detail={"detail": "Job not found", "code": "NOT_FOUND"}
             )
 
-        # Extract progress metadata from stage_metadata JSONB field
-        progress_data = job.stage_metadata or {}
-
-        # Extract elements detected (nested in progress metadata or quality report)
-        elements = progress_data.get("elements_detected", {})
-        if not elements and job.quality_report:
-            # Fallback: extract from quality report if available
-            quality_elements = job.quality_report.get("elements", {})
-            elements = {
-                "tables": quality_elements.get("tables", {}).get("count", 0),
-                "images": quality_elements.get("images", {}).get("count", 0),
-                "equations": quality_elements.get("equations", {}).get("count", 0),
-                "chapters": quality_elements.get("chapters", {}).get("count", 0)
-            }
+        progress_update = _build_progress_update(job)
 
-        # Extract quality confidence from quality report
-        quality_confidence = None
-        if job.quality_report:
-            quality_confidence = job.quality_report.get("overall_confidence")
-
-        # Extract estimated cost (priority: stage_metadata > quality_report)
-        estimated_cost = progress_data.get("estimated_cost")
-        if estimated_cost is None and job.quality_report:
-            estimated_cost = job.quality_report.get("estimated_cost")
-
-        # Determine stage description based on status if not in metadata
-        if progress_data.get("stage_description"):
-            stage_description = progress_data["stage_description"]
-        elif job.status == "COMPLETED":
-            stage_description = "Conversion completed successfully!"
-        elif job.status == "FAILED":
-            stage_description = "Conversion failed"
-        elif job.status == "ANALYZING":
-            stage_description = "Analyzing document layout..."
-        elif job.status == "EXTRACTING":
-            stage_description = "Extracting content..."
-        elif job.status == "STRUCTURING":
-            stage_description = "Identifying document structure..."
-        elif job.status == "GENERATING":
-            stage_description = "Generating EPUB file..."
-        elif job.status == "PROCESSING":
-            stage_description = "Processing..."
-        elif job.status == "QUEUED":
-            stage_description = "Queued for processing..."
-        else:
-            stage_description = "Waiting to start..."
-
-        # Build progress update response
-        progress_update = ProgressUpdate(
-            job_id=job.id,
-            status=job.status,
-            progress_percentage=job.progress,
-            current_stage=progress_data.get("current_stage", job.status.lower()),
-            stage_description=stage_description,
-            elements_detected=ElementsDetected(**elements) if elements else ElementsDetected(),
-            estimated_time_remaining=progress_data.get("estimated_time_remaining"),
-            estimated_cost=estimated_cost,
-            quality_confidence=int(quality_confidence) if quality_confidence else None,
-            timestamp=progress_data.get("timestamp", datetime.utcnow())
-        )
-
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
 
-        # Use debug logging to avoid overwhelming logs during polling
+        # Only slow polls are logged at INFO and above to keep polling quiet
         if request_duration > 200:
             logger.warning(
                 "get_job_progress_slow",
-                extra={
-                    "user_id": current_user.user_id,
-                    "job_id": job_id,
-                    "duration_ms": request_duration,
-                    "progress": job.progress
-                }
+                duration_ms=request_duration,
+                progress=job.progress
             )
 
-        return progress_update
+        payload = progress_update.model_dump(mode="json")
+        await _set_cached_progress(job_id, current_user.user_id, payload)
+        return _progress_response(request, payload)
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
             "get_job_progress_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -433,18 +709,19 @@ async def get_job_progress(
 
 @router.delete(
     "/jobs/{job_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    status_code=status.HTTP_202_ACCEPTED,
+    response_class=Response,  # Empty body - bypass the app's JSON response class
     summary="Delete job",
     description="""
-    Delete a conversion job (hard delete with async file cleanup).
+    Delete a conversion job (hard delete in the background).
 
     **Authentication Required:**
     - Requires valid Supabase JWT token in Authorization header
     - User must own the job (enforced by RLS)
 
     **Deletion Strategy:**
-    - Hard delete: Permanently removes job record from database
-    - Schedules asynchronous cleanup of associated files via Celery
+    - The job is marked DELETING and disappears from the job list immediately
+    - A Celery task permanently removes the job record and its files
     - Deleted jobs cannot be recovered
 
     **File Cleanup:**
@@ -453,7 +730,7 @@ async def get_job_progress(
     - Cleanup happens in background via Celery task
 
     **Returns:**
-    - 204 No Content on success
+    - 202 Accepted once deletion is scheduled
 
     **Error Codes:**
     - `UNAUTHORIZED`: Missing or invalid JWT token
@@ -462,12 +739,12 @@ async def get_job_progress(
     """
 )
 async def delete_job(
-    job_id: str,
+    job_id: UUID,
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
 ):
     """
-    Delete a conversion job (hard delete with async file cleanup).
+    Delete a conversion job (marked here, hard deleted by a Celery task).
 
     Args:
         job_id: Job identifier (UUID)
@@ -479,73 +756,52 @@ async def delete_job(
         HTTPException(404): Job not found or user doesn't own job
         HTTPException(500): Database error
     """
-    request_start = datetime.utcnow()
-    logger.info(
-        "delete_job_request",
-        extra={
-            "user_id": current_user.user_id,
-            "job_id": job_id
-        }
-    )
+    job_id = str(job_id)
+    request_start = time.perf_counter_ns()
+    logger.info("delete_job_request")
 
     try:
-        success, file_paths = job_service.delete_job(
-            job_id=job_id,
-            user_id=current_user.user_id,
-            async_cleanup=True
+        # Single UPDATE: hides the job and returns its storage paths
+        file_paths = await run_in_threadpool(
+            job_service.mark_for_deletion,
+            job_id,
+            current_user.user_id
         )
 
-        if not success:
-            logger.warning(
-                "delete_job_not_found",
-                extra={
-                    "user_id": current_user.user_id,
-                    "job_id": job_id
-                }
-            )
+        if file_paths is None:
+            logger.warning("delete_job_not_found")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "NOT_FOUND"}
             )
 
-        # Schedule async file cleanup via Celery
-        if file_paths:
-            from app.tasks.cleanup import cleanup_job_files_task
-            cleanup_job_files_task.delay(
-                job_id=job_id,
-                input_path=file_paths.get("input_path"),
-                output_path=file_paths.get("output_path")
-            )
-            logger.info(
-                "delete_job_cleanup_scheduled",
-                extra={
-                    "user_id": current_user.user_id,
-                    "job_id": job_id
-                }
-            )
+        await run_in_threadpool(
+            celery_app.send_task,
+            DELETE_TASK_NAME,
+            kwargs={
+                "job_id": job_id,
+                "user_id": current_user.user_id,
+                "input_path": file_paths.get("input_path"),
+                "output_path": file_paths.get("output_path")
+            }
+        )
 
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        logger.info("delete_job_scheduled")
+
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
         logger.info(
             "delete_job_success",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "duration_ms": request_duration
-            }
+            duration_ms=request_duration
         )
 
-        return None  # 204 No Content
+        return Response(status_code=status.HTTP_202_ACCEPTED)
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
             "delete_job_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -581,7 +837,7 @@ async def delete_job(
     """
 )
 async def download_job(
-    job_id: str,
+    job_id: UUID,
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
 ) -> DownloadUrlResponse:
@@ -601,26 +857,15 @@ async def download_job(
         HTTPException(404): Job not found, not completed, or output missing
         HTTPException(500): Storage error
     """
-    request_start = datetime.utcnow()
-    logger.info(
-        "download_job_request",
-        extra={
-            "user_id": current_user.user_id,
-            "job_id": job_id
-        }
-    )
+    job_id = str(job_id)
+    request_start = time.perf_counter_ns()
+    logger.info("download_job_request")
 
     try:
-        result = job_service.generate_download_url(job_id, current_user.user_id)
+        result = await run_in_threadpool(job_service.generate_download_url, job_id, current_user.user_id)
 
         if not result:
-            logger.warning(
-                "download_job_not_ready",
-                extra={
-                    "user_id": current_user.user_id,
-                    "job_id": job_id
-                }
-            )
+            logger.warning("download_job_not_ready")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found or conversion not complete", "code": "NOT_READY"}
@@ -628,14 +873,10 @@ async def download_job(
 
         signed_url, expires_at = result
 
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
         logger.info(
             "download_job_success",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "duration_ms": request_duration
-            }
+            duration_ms=request_duration
         )
 
         return DownloadUrlResponse(
@@ -648,11 +889,65 @@ async def download_job(
     except Exception as e:
         logger.error(
             "download_job_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
+            exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"detail": f"Storage error: {str(e)}", "code": "STORAGE_ERROR"}
+        )
+
+
+@router.get(
+    "/jobs/{job_id}/download/redirect",
+    status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+    response_class=RedirectResponse,
+    summary="Redirect to converted EPUB",
+    description="""
+    Redirect the browser straight to the signed download URL.
+
+    Same checks as `GET /jobs/{job_id}/download`, but answers with a
+    307 redirect instead of JSON so browser-initiated downloads start
+    without an extra client round-trip. API/SPA clients should keep
+    using the JSON endpoint.
+
+    **Error Codes:**
+    - `UNAUTHORIZED`: Missing or invalid JWT token
+    - `NOT_READY`: Job not found, job not completed, or output file missing
+    - `STORAGE_ERROR`: Failed to generate signed URL
+    """
+)
+async def download_job_redirect(
+    job_id: UUID,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
+) -> RedirectResponse:
+    """
+    Redirect to the signed download URL for a completed conversion job.
+
+    Signed URLs are cached in Redis by the job service, so repeat clicks
+    are answered without a Storage round-trip.
+
+    Args:
+        job_id: Job identifier (UUID)
+        current_user: Authenticated user from JWT token
+        job_service: Job service instance
+
+    Returns:
+        RedirectResponse: 307 redirect to the signed URL
+
+    Raises:
+        HTTPException(401): Authentication failure
+        HTTPException(404): Job not found, not completed, or output missing
+        HTTPException(500): Storage error
+    """
+    job_id = str(job_id)
+    try:
+        result = await run_in_threadpool(job_service.generate_download_url, job_id, current_user.user_id)
+    except Exception as e:
+        logger.error(
+            "download_job_redirect_error",
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -660,6 +955,23 @@ async def download_job(
             detail={"detail": f"Storage error: {str(e)}", "code": "STORAGE_ERROR"}
         )
 
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"detail": "Job not found or conversion not complete", "code": "NOT_READY"}
+        )
+
+    signed_url, expires_at = result
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    max_age = max(0, int((expires_at - datetime.now(timezone.utc)).total_seconds()))
+
+    return RedirectResponse(
+        url=signed_url,
+        status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+        headers={"Cache-Control": f"private, max-age={max_age}"}
+    )
+
 
 @router.get(
     "/jobs/{job_id}/files/input",
@@ -684,7 +996,7 @@ async def download_job(
     """
 )
 async def get_input_file(
-    job_id: str,
+    job_id: UUID,
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
 ) -> DownloadUrlResponse:
@@ -704,26 +1016,15 @@ async def get_input_file(
         HTTPException(404): Job not found or input missing
         HTTPException(500): Storage error
     """
-    request_start = datetime.utcnow()
-    logger.info(
-        "get_input_file_request",
-        extra={
-            "user_id": current_user.user_id,
-            "job_id": job_id
-        }
-    )
+    job_id = str(job_id)
+    request_start = time.perf_counter_ns()
+    logger.info("get_input_file_request")
 
     try:
-        result = job_service.generate_input_file_url(job_id, current_user.user_id)
+        result = await run_in_threadpool(job_service.generate_input_file_url, job_id, current_user.user_id)
 
         if not result:
-            logger.warning(
-                "get_input_file_not_found",
-                extra={
-                    "user_id": current_user.user_id,
-                    "job_id": job_id
-                }
-            )
+            logger.warning("get_input_file_not_found")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found or input file missing", "code": "NOT_FOUND"}
@@ -731,14 +1032,10 @@ async def get_input_file(
 
         signed_url, expires_at = result
 
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
         logger.info(
             "get_input_file_success",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "duration_ms": request_duration
-            }
+            duration_ms=request_duration
         )
 
         return DownloadUrlResponse(
@@ -751,11 +1048,7 @@ async def get_input_file(
     except Exception as e:
         logger.error(
             "get_input_file_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -795,7 +1088,7 @@ async def get_input_file(
     """
 )
 async def submit_feedback(
-    job_id: str,
+    job_id: UUID,
     feedback: FeedbackSubmitRequest,
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
@@ -817,62 +1110,35 @@ async def submit_feedback(
         HTTPException(404): Job not found
         HTTPException(500): Database error
     """
-    request_start = datetime.utcnow()
+    job_id = str(job_id)
+    request_start = time.perf_counter_ns()
     logger.info(
         "submit_feedback_request",
-        extra={
-            "user_id": current_user.user_id,
-            "job_id": job_id,
-            "rating": feedback.rating
-        }
+        rating=feedback.rating
     )
 
     try:
-        # Verify job exists and belongs to user
-        job = job_service.get_job(job_id, current_user.user_id)
-        if not job:
+        # Feedback row and analytics event are written atomically in one RPC,
+        # which also verifies the job exists and belongs to the user
+        feedback_record = await run_in_threadpool(
+            job_service.submit_feedback,
+            job_id,
+            current_user.user_id,
+            feedback.rating,
+            feedback.comment
+        )
+        if not feedback_record:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "NOT_FOUND"}
             )
 
-        # Get Supabase client
-        supabase = get_supabase_client()
-
-        # Create feedback record
-        feedback_data = {
-            "job_id": job_id,
-            "user_id": current_user.user_id,
-            "rating": feedback.rating,
-            "comment": feedback.comment
-        }
-
-        result = supabase.table("job_feedback").insert(feedback_data).execute()
-
-        if not result.data:
-            raise Exception("Failed to create feedback record")
-
-        feedback_record = result.data[0]
-
-        # Log analytics event
-        event_data = {
-            "job_id": job_id,
-            "user_id": current_user.user_id,
-            "event_type": f"feedback_{feedback.rating}",
-            "event_data": {"rating": feedback.rating, "has_comment": bool(feedback.comment)}
-        }
-        supabase.table("conversion_events").insert(event_data).execute()
-
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
         logger.info(
             "submit_feedback_success",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "feedback_id": feedback_record["id"],
-                "rating": feedback.rating,
-                "duration_ms": request_duration
-            }
+            feedback_id=feedback_record["id"],
+            rating=feedback.rating,
+            duration_ms=request_duration
         )
 
         return FeedbackResponse(
@@ -887,11 +1153,7 @@ async def submit_feedback(
     except Exception as e:
         logger.error(
             "submit_feedback_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -934,7 +1196,7 @@ async def submit_feedback(
     """
 )
 async def report_issue(
-    job_id: str,
+    job_id: UUID,
     issue: IssueReportRequest,
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
@@ -957,68 +1219,36 @@ async def report_issue(
         HTTPException(422): Validation error
         HTTPException(500): Database error
     """
-    request_start = datetime.utcnow()
+    job_id = str(job_id)
+    request_start = time.perf_counter_ns()
     logger.info(
         "report_issue_request",
-        extra={
-            "user_id": current_user.user_id,
-            "job_id": job_id,
-            "issue_type": issue.issue_type
-        }
+        issue_type=issue.issue_type
     )
 
     try:
-        # Verify job exists and belongs to user
-        job = job_service.get_job(job_id, current_user.user_id)
-        if not job:
+        # One RPC verifies ownership and writes the issue plus its analytics event
+        issue_record = await run_in_threadpool(
+            job_service.report_issue,
+            job_id,
+            current_user.user_id,
+            issue.issue_type,
+            issue.page_number,
+            issue.description,
+            issue.screenshot_url
+        )
+        if not issue_record:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "NOT_FOUND"}
             )
 
-        # Get Supabase client
-        supabase = get_supabase_client()
-
-        # Create issue record
-        issue_data = {
-            "job_id": job_id,
-            "user_id": current_user.user_id,
-            "issue_type": issue.issue_type,
-            "page_number": issue.page_number,
-            "description": issue.description,
-            "screenshot_url": issue.screenshot_url
-        }
-
-        result = supabase.table("job_issues").insert(issue_data).execute()
-
-        if not result.data:
-            raise Exception("Failed to create issue record")
-
-        issue_record = result.data[0]
-
-        # Log analytics event
-        event_data = {
-            "job_id": job_id,
-            "user_id": current_user.user_id,
-            "event_type": "issue_reported",
-            "event_data": {
-                "issue_type": issue.issue_type,
-                "has_page_number": bool(issue.page_number),
-                "description_length": len(issue.description)
-            }
-        }
-        supabase.table("conversion_events").insert(event_data).execute()
-
-        request_duration = (datetime.utcnow() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
         logger.info(
             "report_issue_success",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "issue_id": issue_record["id"],
-                "issue_type": issue.issue_type,
-                "duration_ms": request_duration
-            }
+            issue_id=issue_record["id"],
+            issue_type=issue.issue_type,
+            duration_ms=request_duration
         )
 
         return IssueReportResponse(
@@ -1028,16 +1258,18 @@ async def report_issue(
             created_at=issue_record["created_at"]
         )
 
+    except PermissionError:
+        # Don't reveal that another user's job exists
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"detail": "Job not found", "code": "NOT_FOUND"}
+        )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
             "report_issue_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -1058,8 +1290,9 @@ async def report_issue(
     tags=["jobs"]
 )
 async def log_download_event(
-    job_id: str,
-    current_user: dict = Depends(get_current_user)
+    job_id: UUID,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
 ):
     """
     Log a download event for analytics (AC #7 - Story 5.4)
@@ -1070,89 +1303,57 @@ async def log_download_event(
 
     **Authorization:** User must own the job being downloaded
 
-    **Analytics Event:** Logs to conversion_events table with:
+    **Analytics Event:** Queued for the conversion_events table (written in
+    the background, best-effort) with:
     - event_type: "download"
     - event_data: {"timestamp": ISO8601}
 
     **Story:** 5.4 - Download & Feedback Flow
     **AC:** #7 - "Download events tracked (job_id, user_id, timestamp)"
     """
-    request_start = datetime.now()
+    job_id = str(job_id)
+    request_start = time.perf_counter_ns()
 
     try:
-        logger.info(
-            "log_download_event_start",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "timestamp": request_start.isoformat()
-            }
-        )
+        # TimeStamper already stamps every event; no separate timestamp field
+        logger.info("log_download_event_start")
 
-        # Verify job exists and belongs to user
-        job_query = supabase.table("conversion_jobs") \
-            .select("id, user_id, status") \
-            .eq("id", job_id) \
-            .execute()
-
-        if not job_query.data:
+        # Ownership check is usually served from the in-process ownership cache
+        if not await run_in_threadpool(job_service.verify_job_owner, job_id, current_user.user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "JOB_NOT_FOUND"}
             )
 
-        job = job_query.data[0]
-
-        if job["user_id"] != current_user.user_id:
-            logger.warning(
-                "log_download_event_unauthorized",
-                extra={
-                    "user_id": current_user.user_id,
-                    "job_id": job_id,
-                    "job_owner": job["user_id"]
-                }
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"detail": "Not authorized to access this job", "code": "FORBIDDEN"}
-            )
-
-        # Log download event to conversion_events table
-        event_data = {
-            "timestamp": datetime.now().isoformat()
-        }
-
-        event_record = supabase.table("conversion_events").insert({
+        # The analytics write happens off the request path
+        get_analytics_queue().enqueue({
             "job_id": job_id,
             "user_id": current_user.user_id,
             "event_type": "download",
-            "event_data": event_data
-        }).execute()
+            "event_data": {"timestamp": datetime.now().isoformat()}
+        })
 
-        request_duration = (datetime.now() - request_start).total_seconds() * 1000
+        request_duration = (time.perf_counter_ns() - request_start) / 1e6
 
         logger.info(
             "log_download_event_success",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "event_id": event_record.data[0]["id"],
-                "duration_ms": request_duration
-            }
+            duration_ms=request_duration
         )
 
         return {"message": "Download event logged successfully"}
 
+    except PermissionError:
+        logger.warning("log_download_event_unauthorized")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"detail": "Not authorized to access this job", "code": "FORBIDDEN"}
+        )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
             "log_download_event_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -1172,8 +1373,9 @@ async def log_download_event(
     tags=["jobs"]
 )
 async def check_existing_feedback(
-    job_id: str,
-    current_user: dict = Depends(get_current_user)
+    job_id: UUID,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
 ):
     """
     Check if user has already submitted feedback for this job (AC #10 - Story 5.4)
@@ -1191,54 +1393,32 @@ async def check_existing_feedback(
     **Story:** 5.4 - Download & Feedback Flow
     **AC:** #10 - "Duplicate feedback prevention (disable buttons after submission)"
     """
-    supabase = get_supabase_client()
-
+    job_id = str(job_id)
     try:
-        # Verify job exists and belongs to user
-        job_query = supabase.table("conversion_jobs") \
-            .select("id, user_id") \
-            .eq("id", job_id) \
-            .execute()
-
-        if not job_query.data:
+        # One RPC verifies ownership and looks up the user's feedback
+        feedback_status = await run_in_threadpool(job_service.get_feedback_status, job_id, current_user.user_id)
+        if not feedback_status:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "JOB_NOT_FOUND"}
             )
 
-        job = job_query.data[0]
-
-        if job["user_id"] != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"detail": "Not authorized to access this job", "code": "FORBIDDEN"}
-            )
-
-        # Check for existing feedback
-        feedback_query = supabase.table("job_feedback") \
-            .select("id, rating") \
-            .eq("job_id", job_id) \
-            .eq("user_id", current_user.user_id) \
-            .execute()
-
-        has_feedback = len(feedback_query.data) > 0
-        feedback_rating = feedback_query.data[0]["rating"] if has_feedback else None
-
         return {
-            "has_feedback": has_feedback,
-            "feedback_rating": feedback_rating
+            "has_feedback": feedback_status["has_feedback"],
+            "feedback_rating": feedback_status["feedback_rating"]
         }
 
+    except PermissionError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"detail": "Not authorized to access this job", "code": "FORBIDDEN"}
+        )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
             "check_existing_feedback_error",
-            extra={
-                "user_id": current_user.user_id,
-                "job_id": job_id,
-                "error": str(e)
-            },
+            error=str(e),
             exc_info=True
         )
         raise HTTPException(
@@ -1255,7 +1435,7 @@ async def check_existing_feedback(
     description="Retrieve all feedback submissions for a specific job"
 )
 async def get_job_feedback(
-    job_id: str,
+    job_id: UUID,
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
 ) -> FeedbackListResponse:
@@ -1270,33 +1450,22 @@ async def get_job_feedback(
     Returns:
         FeedbackListResponse: List of feedback items
     """
-    supabase = get_supabase_client()
+    job_id = str(job_id)
 
     try:
-        # Verify job exists and belongs to user
-        job = job_service.get_job(job_id, current_user.user_id)
-        if not job:
+        # One RPC checks ownership and lists the rows; another user's job
+        # is reported as not found
+        try:
+            rows = await run_in_threadpool(job_service.list_feedback, job_id, current_user.user_id)
+        except PermissionError:
+            rows = None
+        if rows is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "NOT_FOUND"}
             )
 
-        # Fetch feedback
-        response = supabase.table("job_feedback") \
-            .select("*") \
-            .eq("job_id", job_id) \
-            .order("created_at", desc=True) \
-            .execute()
-
-        feedback_items = [
-            FeedbackItem(
-                id=item["id"],
-                rating=item["rating"],
-                comment=item.get("comment"),
-                created_at=item["created_at"]
-            )
-            for item in response.data
-        ]
+        feedback_items = _FEEDBACK_LIST_ADAPTER.validate_python(rows)
 
         return FeedbackListResponse(
             feedback=feedback_items,
@@ -1306,7 +1475,7 @@ async def get_job_feedback(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get job feedback: {str(e)}", exc_info=True)
+        logger.error("get_job_feedback_error", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"detail": f"Failed to get feedback: {str(e)}", "code": "DATABASE_ERROR"}
@@ -1321,7 +1490,7 @@ async def get_job_feedback(
     description="Retrieve all reported issues for a specific job"
 )
 async def get_job_issues(
-    job_id: str,
+    job_id: UUID,
     current_user: AuthenticatedUser = Depends(get_current_user),
     job_service: JobService = Depends(get_job_service)
 ) -> IssueListResponse:
@@ -1336,35 +1505,22 @@ async def get_job_issues(
     Returns:
         IssueListResponse: List of issue items
     """
-    supabase = get_supabase_client()
+    job_id = str(job_id)
 
     try:
-        # Verify job exists and belongs to user
-        job = job_service.get_job(job_id, current_user.user_id)
-        if not job:
+        # One RPC checks ownership and lists the rows; another user's job
+        # is reported as not found
+        try:
+            rows = await run_in_threadpool(job_service.list_issues, job_id, current_user.user_id)
+        except PermissionError:
+            rows = None
+        if rows is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": "Job not found", "code": "NOT_FOUND"}
             )
 
-        # Fetch issues
-        response = supabase.table("job_issues") \
-            .select("*") \
-            .eq("job_id", job_id) \
-            .order("created_at", desc=True) \
-            .execute()
-
-        issue_items = [
-            IssueItem(
-                id=item["id"],
-                issue_type=item["issue_type"],
-                page_number=item.get("page_number"),
-                description=item["description"],
-                screenshot_url=item.get("screenshot_url"),
-                created_at=item["created_at"]
-            )
-            for item in response.data
-        ]
+        issue_items = _ISSUE_LIST_ADAPTER.validate_python(rows)
 
         return IssueListResponse(
             issues=issue_items,
@@ -1374,7 +1530,7 @@ async def get_job_issues(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get job issues: {str(e)}", exc_info=True)
+        logger.error("get_job_issues_error", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"detail": f"Failed to get issues: {str(e)}", "code": "DATABASE_ERROR"}
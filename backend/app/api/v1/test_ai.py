@@ -4,7 +4,10 @@ Test AI Endpoints
 API endpoints for testing AI connectivity through Celery workers.
 Provides task dispatch and status checking.
 """
-from fastapi import APIRouter, HTTPException
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from typing import Literal, Optional
 from celery.result import AsyncResult
@@ -13,6 +16,17 @@ from app.core.celery_app import celery_app
 
 router = APIRouter(prefix="/test-ai", tags=["Test AI"])
 
+# Longest a status request may block waiting for the task (kept under typical proxy timeouts)
+MAX_STATUS_WAIT_SECONDS = 25
+
+# States worth waiting on; anything else is already final
+UNFINISHED_STATES = frozenset({"PENDING", "STARTED", "RETRY"})
+
+# Delay before the second result backend read while long-polling; doubles
+# after every read up to STATUS_POLL_MAX_INTERVAL_SECONDS
+STATUS_POLL_INTERVAL_SECONDS = 0.5
+STATUS_POLL_MAX_INTERVAL_SECONDS = 4.0
+
 
 class TestAIRequest(BaseModel):
     """Request model for AI test"""
@@ -67,10 +81,55 @@ async def trigger_test_ai(request: TestAIRequest = TestAIRequest()):
         raise HTTPException(status_code=500, detail=f"Failed to dispatch task: {str(e)}")
 
 
+async def _read_state(task_result: AsyncResult) -> str:
+    """Read the task state from the result backend (one blocking round-trip, in the threadpool)."""
+    return await run_in_threadpool(getattr, task_result, "state")
+
+
+async def _wait_for_task(task_result: AsyncResult, timeout: float) -> str:
+    """
+    Poll the task state until it is final or `timeout` elapses.
+
+    The wait between reads is an asyncio.sleep, so a long poll only holds a
+    threadpool slot for each backend read, not for the whole wait; the
+    threadpool is shared with every Supabase call. The interval backs off
+    exponentially, so a 25s poll makes about ten backend reads instead of
+    fifty while short tasks are still picked up quickly.
+
+    Returns:
+        str: Last state read
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    interval = STATUS_POLL_INTERVAL_SECONDS
+    state = await _read_state(task_result)
+    while state in UNFINISHED_STATES:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, STATUS_POLL_MAX_INTERVAL_SECONDS)
+        state = await _read_state(task_result)
+    return state
+
+
 @router.get("/{task_id}", response_model=TaskStatusResponse)
-async def get_task_status(task_id: str):
+async def get_task_status(
+    task_id: str,
+    wait: float = Query(
+        0,
+        ge=0,
+        le=MAX_STATUS_WAIT_SECONDS,
+        description="Seconds to wait for an unfinished task to complete before answering (long polling)"
+    )
+):
     """
     Check Celery task status and retrieve result.
+
+    With `wait` > 0 the request long-polls: it returns as soon as the task
+    finishes, or with the current status once `wait` seconds pass, so
+    clients need one request per state change instead of polling every
+    few hundred milliseconds.
     
     Possible statuses:
     - PENDING: Task waiting to be executed
@@ -98,18 +157,20 @@ async def get_task_status(task_id: str):
     try:
         # Get task result from Celery
         task_result = AsyncResult(task_id, app=celery_app)
-        
+
+        state = await _wait_for_task(task_result, wait)
+
         response = TaskStatusResponse(
             task_id=task_id,
-            status=task_result.status,
+            status=state,
             result=None,
             error=None
         )
         
-        # Add result or error based on status
-        if task_result.status == "SUCCESS":
+        # Add result or error based on status (cached by AsyncResult once final)
+        if state == "SUCCESS":
             response.result = task_result.result
-        elif task_result.status == "FAILURE":
+        elif state == "FAILURE":
             response.error = str(task_result.info)
         
         return response
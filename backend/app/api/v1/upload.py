@@ -3,8 +3,10 @@ Upload API Endpoint
 
 Handles PDF file uploads to Supabase Storage with authentication and validation.
 """
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, UploadFile, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime
+from functools import lru_cache
 import uuid
 import logging
 
@@ -23,7 +25,8 @@ from app.services.storage.supabase_storage import (
 )
 from app.core.supabase import get_supabase_client
 from app.core.redis_client import get_cached_redis_client
-from app.services.usage_tracker import UsageTracker
+from app.services.usage_batcher import get_usage_batcher
+from app.services.job_service import invalidate_job_list_cache
 from celery import chain
 from app.tasks.conversion_pipeline import (
     convert_to_html,
@@ -36,18 +39,69 @@ from app.tasks.conversion_pipeline import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Leading bytes read for type validation (the PDF check needs 5; rejects are
+# identified by libmagic from this header)
+PDF_SNIFF_BYTES = 2048
 
+# FileValidationService holds no per-call state, so one instance serves every upload
+_VALIDATOR = FileValidationService()
+
+# Pipeline stages after the first: they take the previous stage's result, so
+# only convert_to_html needs the job_id. Built once and cloned per dispatch.
+_PIPELINE_TAIL = (
+    extract_content.s(),
+    identify_structure.s(),
+    generate_epub.s(),
+    calculate_quality_score.s()
+)
+
+
+@lru_cache(maxsize=1)
 def get_storage_service() -> SupabaseStorageService:
     """
-    Dependency for getting initialized SupabaseStorageService.
+    Dependency for getting the shared SupabaseStorageService.
+
+    The service only wraps the process-wide Supabase client, so one instance
+    is built and reused for every upload, matching get_job_service().
+    Call get_storage_service.cache_clear() to rebuild it (e.g. in tests).
 
     Returns:
-        SupabaseStorageService: Configured storage service instance
+        SupabaseStorageService: Shared storage service instance
     """
     supabase = get_supabase_client()
     return SupabaseStorageService(supabase)
 
 
+def _dispatch_pipeline(job_id: str) -> None:
+    """
+    Dispatch the Celery conversion chain for a job.
+
+    Runs as a background task after the response. If the broker is down the
+    job stays in UPLOADED status and can be retried manually.
+    """
+    try:
+        logger.info(f"Dispatching conversion pipeline for job {job_id}")
+
+        # Build the conversion chain directly (avoid orchestrator task anti-pattern)
+        workflow = chain(
+            convert_to_html.s(job_id),
+            *(signature.clone() for signature in _PIPELINE_TAIL)
+        )
+
+        # Execute the chain asynchronously (no .get() - fire and forget)
+        workflow.apply_async()
+
+        logger.info(f"Successfully dispatched pipeline for job {job_id}")
+    except Exception as e:
+        logger.error(f"Failed to dispatch conversion pipeline for job {job_id}: {str(e)}", exc_info=True)
+
+
+def _spooled_size(file: UploadFile) -> int:
+    """Return the byte length of an upload whose size the parser did not record."""
+    file.file.seek(0, 2)
+    return file.file.tell()
+
+
 @router.post(
     "/upload",
     status_code=status.HTTP_202_ACCEPTED,
@@ -86,6 +140,7 @@ def get_storage_service() -> SupabaseStorageService:
     """
 )
 async def upload_pdf(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="PDF file to upload"),
     current_user: AuthenticatedUser = Depends(get_current_user),
     storage_service: SupabaseStorageService = Depends(get_storage_service),
@@ -97,6 +152,7 @@ async def upload_pdf(
     Tier limits are enforced BEFORE file processing via check_tier_limits dependency.
 
     Args:
+        background_tasks: Post-response work (pipeline dispatch)
         file: Uploaded PDF file (multipart/form-data)
         current_user: Authenticated user from JWT token
         storage_service: Supabase storage service
@@ -112,17 +168,17 @@ async def upload_pdf(
         HTTPException(413): File too large for user's tier
         HTTPException(500): Storage or database error
     """
-    # Read file content
-    file_data = await file.read()
-    file_size = len(file_data)
+    # The multipart parser has already spooled the body to a temp file
+    # (in memory only up to 1MB), so validate from its header and size
+    # instead of reading the whole PDF into memory
+    header = await file.read(PDF_SNIFF_BYTES)
+    file_size = file.size if file.size is not None else await run_in_threadpool(_spooled_size, file)
     filename = file.filename or "unknown.pdf"
 
     # Validate file type and size
-    validator = FileValidationService()
-
     try:
-        validator.validate_pdf(file_data)
-        validator.validate_file_size(file_size, current_user.tier)
+        _VALIDATOR.validate_pdf(header)
+        _VALIDATOR.validate_file_size(file_size, current_user.tier)
     except InvalidFileTypeError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -138,12 +194,15 @@ async def upload_pdf(
     job_id = str(uuid.uuid4())
     storage_path = f"{current_user.user_id}/{job_id}/input.pdf"
 
-    # Upload to Supabase Storage
+    # Stream to Supabase Storage in chunks
+    await file.seek(0)
     try:
-        storage_service.upload_file(
+        await run_in_threadpool(
+            storage_service.upload_stream,
             bucket="uploads",
             path=storage_path,
-            file_data=file_data,
+            stream=file.file,
+            size=file_size,
             content_type="application/pdf"
         )
     except StorageUploadError as e:
@@ -166,11 +225,11 @@ async def upload_pdf(
     }
 
     try:
-        supabase.table("conversion_jobs").insert(job_data).execute()
+        await run_in_threadpool(supabase.table("conversion_jobs").insert(job_data).execute)
     except Exception as e:
         # If database insert fails, try to clean up uploaded file
         try:
-            storage_service.delete_file("uploads", storage_path)
+            await run_in_threadpool(storage_service.delete_file, "uploads", storage_path)
         except:
             pass  # Ignore cleanup errors
 
@@ -179,40 +238,15 @@ async def upload_pdf(
             detail={"detail": f"Database error: {str(e)}", "code": "DATABASE_ERROR"}
         )
 
-    # Increment usage count (after successful job creation)
-    # IMPORTANT: Increment failures should NOT block conversion
-    try:
-        redis_client = get_cached_redis_client()
-        usage_tracker = UsageTracker(supabase, redis_client)
-        new_count = usage_tracker.increment_usage(current_user.user_id)
-        logger.info(f"Incremented usage for user {current_user.user_id} to {new_count}")
-    except Exception as e:
-        # Log error but don't fail the request - usage tracking is non-critical
-        logger.error(f"Failed to increment usage for user {current_user.user_id}: {str(e)}", exc_info=True)
-        # Continue with conversion even if usage tracking fails
+    # New job must show up in the user's job list immediately
+    redis_client = get_cached_redis_client()
+    await run_in_threadpool(invalidate_job_list_cache, redis_client, current_user.user_id)
 
-    # Dispatch Celery pipeline for async conversion
-    try:
-        logger.info(f"Dispatching conversion pipeline for job {job_id}")
-
-        # Build the conversion chain directly (avoid orchestrator task anti-pattern)
-        workflow = chain(
-            convert_to_html.s(job_id),
-            extract_content.s(),
-            identify_structure.s(),
-            generate_epub.s(),
-            calculate_quality_score.s()
-        )
-
-        # Execute the chain asynchronously (no .get() - fire and forget)
-        workflow.apply_async()
-
-        logger.info(f"Successfully dispatched pipeline for job {job_id}")
-    except Exception as e:
-        # Log error but don't fail the request - job can be retried manually
-        logger.error(f"Failed to dispatch conversion pipeline for job {job_id}: {str(e)}", exc_info=True)
-        # Note: We could update job status to FAILED here, but let's allow retry
-        # If Celery is down, the job will remain in UPLOADED status
+    # Usage is coalesced per user and written by the batcher within one flush
+    # interval; pipeline dispatch runs after the 202 is sent
+    pending = get_usage_batcher().enqueue(current_user.user_id)
+    logger.debug(f"Queued usage increment for user {current_user.user_id} ({pending} pending)")
+    background_tasks.add_task(_dispatch_pipeline, job_id)
 
     # Return success response
     return UploadResponse(
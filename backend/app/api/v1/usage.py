@@ -5,13 +5,12 @@ Provides endpoints for querying user conversion usage statistics.
 """
 import logging
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.auth import get_current_user
-from app.core.supabase import get_supabase_client
-from app.core.redis_client import get_cached_redis_client
 from app.schemas.auth import AuthenticatedUser
 from app.schemas.usage import UsageResponse
-from app.services.usage_tracker import UsageTracker
+from app.services.usage_tracker import get_usage_tracker
 
 logger = logging.getLogger(__name__)
 
@@ -58,15 +57,10 @@ async def get_current_usage(
     ```
     """
     try:
-        # Initialize clients
-        supabase = get_supabase_client()
-        redis = get_cached_redis_client()  # May be None if Redis unavailable
-
-        # Create UsageTracker service
-        tracker = UsageTracker(supabase, redis)
+        tracker = await run_in_threadpool(get_usage_tracker)
 
         # Query usage stats for authenticated user
-        usage_data = tracker.get_usage(user.user_id)
+        usage_data = await run_in_threadpool(tracker.get_usage, user.user_id)
 
         return UsageResponse(**usage_data)
 
@@ -3,10 +3,21 @@ Authentication Middleware
 
 JWT validation for Supabase Auth tokens.
 Extracts user information from Bearer tokens and provides FastAPI dependency.
+
+Verified tokens are memoized in a bounded in-process LRU keyed by the
+token's SHA-256 digest, so repeat requests with the same token skip
+decoding and claim parsing until the token's own expiry or JWT_CACHE_TTL,
+whichever comes first.
 """
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError
 
 from app.core.config import settings
 from app.schemas.auth import AuthenticatedUser, SubscriptionTier
@@ -14,6 +25,65 @@ from app.schemas.auth import AuthenticatedUser, SubscriptionTier
 # HTTP Bearer scheme for Authorization header
 security = HTTPBearer()
 
+# Max verified tokens kept in memory per process
+TOKEN_CACHE_MAX_SIZE = 10_000
+
+# Max seconds a verified token is reused before being decoded again; bounds
+# how long a cached identity (e.g. tier claims) can lag behind a refresh
+TOKEN_CACHE_TTL = settings.JWT_CACHE_TTL
+
+# Supabase signs access tokens with the project JWT secret (HS256)
+JWT_ALGORITHMS = ["HS256"]
+
+# Verified in the single decode: tokens without an expiry are rejected
+JWT_DECODE_OPTIONS = {"require": ["exp"]}
+
+# Supabase access tokens are issued for the "authenticated" role
+JWT_AUDIENCE = "authenticated"
+
+# Everything jwt.decode needs except the token and secret, built once
+_JWT_DECODE_KWARGS = {
+    "algorithms": JWT_ALGORITHMS,
+    "audience": JWT_AUDIENCE,
+    "options": JWT_DECODE_OPTIONS
+}
+
+# sha256(token) -> (user, exp timestamp); ordered oldest-used first
+_token_cache: "OrderedDict[str, Tuple[AuthenticatedUser, float]]" = OrderedDict()
+
+
+def _token_cache_key(token: str) -> str:
+    """Full SHA-256 digest - never a truncated prefix, a collision would be an auth bypass."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _get_cached_user(key: str) -> Optional[AuthenticatedUser]:
+    """Return the cached user for a token digest if present and not expired."""
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    user, exp = entry
+    if exp <= time.time():
+        _token_cache.pop(key, None)
+        return None
+
+    _token_cache.move_to_end(key)
+    return user
+
+
+def _cache_user(key: str, user: AuthenticatedUser, exp: float) -> None:
+    """Store a verified user until exp, evicting the least recently used entry."""
+    _token_cache[key] = (user, exp)
+    _token_cache.move_to_end(key)
+    if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+        _token_cache.popitem(last=False)
+
+
+def clear_token_cache() -> None:
+    """Drop all memoized tokens (e.g. after rotating the JWT secret, or in tests)."""
+    _token_cache.clear()
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Security(security)
@@ -41,16 +111,16 @@ async def get_current_user(
             return {"user_id": user.user_id}
     """
     token = credentials.credentials
-    
+    cache_key = _token_cache_key(token)
+
+    cached_user = _get_cached_user(cache_key)
+    if cached_user is not None:
+        return cached_user
+
     try:
         # Supabase JWT uses HS256 algorithm with the JWT secret
         # Get JWT secret from Supabase project settings → API → JWT Secret
-        payload = jwt.decode(
-            token,
-            settings.SUPABASE_JWT_SECRET,
-            algorithms=["HS256"],
-            audience="authenticated"
-        )
+        payload = jwt.decode(token, settings.SUPABASE_JWT_SECRET, **_JWT_DECODE_KWARGS)
         
         # Extract user information from JWT payload
         user_id = payload.get("sub")
@@ -70,13 +140,20 @@ async def get_current_user(
         except ValueError:
             tier = SubscriptionTier.FREE
             
-        return AuthenticatedUser(
+        user = AuthenticatedUser(
             user_id=user_id,
             email=email or "",
             tier=tier
         )
+
+        # exp is guaranteed by JWT_DECODE_OPTIONS
+        if TOKEN_CACHE_TTL > 0:
+            _cache_user(cache_key, user, min(float(payload["exp"]), time.time() + TOKEN_CACHE_TTL))
+
+        return user
         
-    except JWTError as e:
+    except PyJWTError:
+        _token_cache.pop(cache_key, None)
         raise HTTPException(
             status_code=401,
             detail="Invalid or expired token"
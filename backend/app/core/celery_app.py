@@ -14,15 +14,27 @@ celery_app = Celery(
     "transfer2read",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=['app.tasks.ai_tasks', 'app.tasks.conversion_pipeline', 'app.tasks.usage_tasks']
+    include=['app.tasks.ai_tasks', 'app.tasks.conversion_pipeline', 'app.tasks.usage_tasks', 'app.tasks.cleanup']
 )
 
 # Configure Celery settings
 celery_app.conf.update(
     # Serialization
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # msgpack is faster and more compact than JSON and carries bytes natively
+    # (the pipeline passes the source PDF between stages). Task args and
+    # results must be msgpack types: str/bytes/int/float/bool/None plus
+    # lists and dicts with str keys - send datetimes as ISO strings.
+    # JSON stays accepted so messages queued before the switch still run.
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
+    result_accept_content=['msgpack', 'json'],
+
+    # Compression
+    # Pipeline results carry the source PDF, HTML and structure JSON through
+    # Redis between stages; zstd shrinks that text several-fold for little CPU
+    task_compression='zstd',
+    result_compression='zstd',
     
     # Timezone
     timezone='UTC',
@@ -38,9 +50,52 @@ celery_app.conf.update(
     # Retry configuration
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+
+    # Queues
+    # Conversion stages and AI calls run for minutes; cleanup and usage tasks
+    # finish in milliseconds. Separate queues keep quick tasks from waiting
+    # behind a conversion, and each worker pool is sized for its workload:
+    #   celery -A app.worker worker -Q slow -c 2 --prefetch-multiplier=1
+    #   celery -A app.worker worker -Q fast -c 8 --prefetch-multiplier=8
+    task_routes={
+        'conversion_pipeline': {'queue': 'slow'},
+        'convert_to_html': {'queue': 'slow'},
+        'extract_content': {'queue': 'slow'},
+        'identify_structure': {'queue': 'slow'},
+        'generate_epub': {'queue': 'slow'},
+        'calculate_quality_score': {'queue': 'slow'},
+        'test_ai_connection': {'queue': 'slow'},
+        'app.tasks.cleanup.*': {'queue': 'fast'},
+        'app.tasks.usage_tasks.*': {'queue': 'fast'},
+    },
+    # Reserve one task per process so a long conversion never holds queued
+    # tasks that an idle process could start (fast workers raise it on the CLI)
+    worker_prefetch_multiplier=1,
     
     # Result expiration
     result_expires=3600,  # 1 hour
+
+    # Broker connections
+    # API processes publish through a shared pool of broker connections
+    # instead of connecting per dispatch
+    broker_pool_limit=50,
+    broker_connection_retry_on_startup=True,
+    broker_transport_options={
+        'visibility_timeout': 3600,  # Must exceed task_time_limit (acks_late redelivery)
+        'socket_keepalive': True,
+    },
+    result_backend_transport_options={
+        'socket_keepalive': True,
+    },
+
+    # Retry publishing on transient broker errors instead of failing the request
+    task_publish_retry=True,
+    task_publish_retry_policy={
+        'max_retries': 3,
+        'interval_start': 0,
+        'interval_step': 0.2,
+        'interval_max': 1,
+    },
 )
 
 # Configure Celery Beat for periodic tasks
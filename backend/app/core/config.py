@@ -4,6 +4,7 @@ Application Configuration
 Pydantic-based configuration management for environment variables.
 Loads from .env file in development and from environment in production.
 """
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 from typing import Optional
@@ -16,6 +17,10 @@ class Settings(BaseSettings):
     SUPABASE_URL: str
     SUPABASE_SERVICE_KEY: str  # Use service_role key for backend (bypasses RLS)
     SUPABASE_JWT_SECRET: str   # JWT secret for validating access tokens
+    JWT_CACHE_TTL: int = 300  # Max seconds a verified token is served from the in-process cache (0 disables)
+    SUPABASE_HTTP_MAX_CONNECTIONS: int = 100  # Shared HTTP/2 pool size for Supabase calls
+    SUPABASE_HTTP_MAX_KEEPALIVE: int = 50  # Idle connections kept open for reuse
+    SUPABASE_HTTP_TIMEOUT: float = 120.0  # Request timeout in seconds (matches supabase-py default)
 
     # AI API Keys
     OPENAI_API_KEY: str  # Required for GPT-4o layout analysis
@@ -59,13 +64,24 @@ class Settings(BaseSettings):
 
     # Redis Configuration
     REDIS_URL: str = "redis://localhost:6379"
+    REDIS_MAX_CONNECTIONS: int = 32  # Shared connection pool size per process
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # Seconds before idle connections are re-checked
+    REDIS_POOL_TIMEOUT: int = 5  # Seconds to wait for a free pooled connection before erroring
 
     # Celery Configuration (for future async tasks)
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/0"
 
+    # Analytics event batching
+    ANALYTICS_MAX_BATCH: int = 64  # Max conversion_events rows per insert
+    ANALYTICS_FLUSH_INTERVAL_MS: int = 100  # Max time an event waits for a batch to fill
+
+    # Usage counter batching
+    USAGE_FLUSH_INTERVAL_MS: int = 50  # Window over which upload usage increments are coalesced
+
     # Application Configuration
     ENVIRONMENT: str = "development"
+    THREADPOOL_MAX_WORKERS: int = 64  # Worker threads for blocking Supabase calls (AnyIO default is 40)
     DEBUG: bool = False
 
     # CORS Configuration (Story 7.1)
@@ -80,5 +96,18 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide settings, parsing the environment and .env once.
+
+    Call get_settings.cache_clear() to reload them (e.g. in tests).
+
+    Returns:
+        Settings: Shared settings instance
+    """
+    return Settings()
+
+
+# Global settings instance (same object as get_settings())
+settings = get_settings()
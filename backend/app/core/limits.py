@@ -23,6 +23,18 @@ TIER_LIMITS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Per-tier limits in the units callers need, precomputed so each lookup on
+# the upload path is a single dict get. Keys are upper-case tier names;
+# callers holding an unnormalized tier should use the getters below.
+FILE_SIZE_LIMITS: Dict[str, Optional[int]] = {
+    tier: limits["max_file_size_mb"] * 1024 * 1024 if limits["max_file_size_mb"] else None
+    for tier, limits in TIER_LIMITS.items()
+}
+CONVERSION_LIMITS: Dict[str, Optional[int]] = {
+    tier: limits["max_conversions_per_month"] for tier, limits in TIER_LIMITS.items()
+}
+
+
 def get_file_size_limit(tier: str) -> Optional[int]:
     """
     Get maximum file size limit in bytes for given tier.
@@ -35,11 +47,7 @@ def get_file_size_limit(tier: str) -> Optional[int]:
         
     Defaults to FREE tier limits if tier is unrecognized.
     """
-    tier = tier.upper() if tier else "FREE"
-    if tier not in TIER_LIMITS:
-        tier = "FREE"
-    limit_mb = TIER_LIMITS[tier]["max_file_size_mb"]
-    return limit_mb * 1024 * 1024 if limit_mb else None
+    return FILE_SIZE_LIMITS.get((tier or "FREE").upper(), FILE_SIZE_LIMITS["FREE"])
 
 
 def get_conversion_limit(tier: str) -> Optional[int]:
@@ -54,7 +62,4 @@ def get_conversion_limit(tier: str) -> Optional[int]:
         
     Defaults to FREE tier limits if tier is unrecognized.
     """
-    tier = tier.upper() if tier else "FREE"
-    if tier not in TIER_LIMITS:
-        tier = "FREE"
-    return TIER_LIMITS[tier]["max_conversions_per_month"]
+    return CONVERSION_LIMITS.get((tier or "FREE").upper(), CONVERSION_LIMITS["FREE"])
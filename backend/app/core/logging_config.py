@@ -0,0 +1,59 @@
+"""
+Structured Logging Configuration
+
+Configures structlog to render each event as a single pre-serialized JSON
+line (via orjson) and hand it to the standard library logging handlers, so
+uvicorn handlers, log levels and log shipping keep working unchanged.
+"""
+import logging
+from typing import Any
+
+import orjson
+import structlog
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event dict with orjson; unknown types fall back to str()."""
+    return orjson.dumps(obj, default=str).decode()
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure structlog for JSON event logging.
+
+    Events below `level` are dropped by the bound logger before any
+    processor runs, so disabled debug calls cost a single method call.
+
+    Args:
+        level: Minimum log level to emit (default: INFO)
+    """
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
+    """
+    Get a structured logger.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        Bound structlog logger; pass event fields as keyword arguments
+
+    Example:
+        >>> logger = get_logger(__name__)
+        >>> logger.info("list_jobs_success", user_id=user_id, duration_ms=12.5)
+    """
+    return structlog.get_logger(name)
@@ -2,8 +2,13 @@
 Redis Client Configuration
 
 Provides Redis client for caching and session management.
+
+Connections are drawn from process-wide pools (one sync, one async) so
+request handlers reuse established TCP connections instead of opening a
+new one per call. Pools are closed by the FastAPI lifespan handler.
 """
 import redis
+import redis.asyncio as aioredis
 import logging
 from typing import Optional
 from app.core.config import settings
@@ -11,24 +16,38 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+# Shared connection pool for the sync client (services, Celery tasks).
+# Blocking: when all connections are checked out, callers wait up to
+# REDIS_POOL_TIMEOUT for one to be returned instead of failing immediately
+_pool: redis.BlockingConnectionPool = redis.BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT,
+    health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    socket_keepalive=True,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+    decode_responses=True  # Automatically decode bytes to strings
+)
+
+# Shared async client (health checks and other async handlers), created lazily
+_async_client: Optional[aioredis.Redis] = None
+
+
 def get_redis_client() -> Optional[redis.Redis]:
     """
     Get Redis client for caching operations.
 
     Returns:
-        redis.Redis: Configured Redis client, or None if connection fails
+        redis.Redis: Client backed by the shared connection pool, or None if
+            connection fails
 
     Note:
         Gracefully handles connection failures - returns None to allow
         application to continue without caching.
     """
     try:
-        client = redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,  # Automatically decode bytes to strings
-            socket_connect_timeout=5,
-            socket_timeout=5
-        )
+        client = redis.Redis(connection_pool=_pool)
 
         # Test connection
         client.ping()
@@ -69,3 +88,45 @@ def get_cached_redis_client() -> Optional[redis.Redis]:
     """
     global _redis_client
     return _redis_client
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """
+    Get the process-wide async Redis client.
+
+    The client is created on first use and shares a single connection pool
+    across all callers. Callers must not close it; shutdown is handled by
+    close_redis_clients().
+
+    Returns:
+        redis.asyncio.Redis: Shared async Redis client
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = aioredis.Redis(
+            connection_pool=aioredis.BlockingConnectionPool.from_url(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                socket_keepalive=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                decode_responses=True
+            )
+        )
+    return _async_client
+
+
+async def close_redis_clients() -> None:
+    """
+    Close shared Redis clients and disconnect their pools.
+
+    Called from the FastAPI lifespan handler on shutdown.
+    """
+    global _async_client, _redis_client
+    if _async_client is not None:
+        await _async_client.aclose(close_connection_pool=True)
+        _async_client = None
+    _redis_client = None
+    _pool.disconnect()
@@ -3,31 +3,98 @@ Supabase Client Configuration
 
 Initializes and provides access to the Supabase client for backend operations.
 Uses service_role key for admin access (bypasses Row Level Security policies).
+
+The client is created once per process and reused by every request, so the
+underlying HTTP connection pool and auth state are shared instead of rebuilt
+on each FastAPI dependency resolution.
+
+All PostgREST, Auth and Storage calls go through one shared httpx client
+with HTTP/2 and a keep-alive pool, so requests multiplex over persistent
+TLS connections instead of paying a handshake per call.
 """
+from functools import lru_cache
+from typing import Optional
+
+import httpx
 from supabase import create_client, Client
+from supabase.lib.client_options import SyncClientOptions
 from app.core.config import settings
 
+# Shared HTTP transport for the Supabase client (created with the client)
+_http_client: Optional[httpx.Client] = None
+
+
+def _build_http_client() -> httpx.Client:
+    """
+    Build the pooled HTTP/2 client used under supabase-py.
+
+    Returns:
+        httpx.Client: Client with keep-alive limits from settings
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_HTTP_MAX_KEEPALIVE
+        ),
+        timeout=httpx.Timeout(settings.SUPABASE_HTTP_TIMEOUT, connect=10.0)
+    )
+
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """
-    Initialize Supabase client with service role key for admin operations.
+    Get the process-wide Supabase client with service role key for admin operations.
 
     IMPORTANT: Use service_role key for backend (not anon key - that's for frontend).
     The service_role key bypasses Row Level Security policies and has full access.
 
+    The first call creates the client; subsequent calls return the same instance.
+
     Returns:
-        Client: Configured Supabase client instance
+        Client: Shared Supabase client instance
 
     Example:
         >>> supabase = get_supabase_client()
         >>> result = supabase.table("users").select("*").execute()
     """
+    global _http_client
+    _http_client = _build_http_client()
     return create_client(
         supabase_url=settings.SUPABASE_URL,
-        supabase_key=settings.SUPABASE_SERVICE_KEY
+        supabase_key=settings.SUPABASE_SERVICE_KEY,
+        options=SyncClientOptions(httpx_client=_http_client)
     )
 
 
+def get_supabase_http_client() -> httpx.Client:
+    """
+    Get the pooled HTTP client shared with the Supabase client.
+
+    Used for Storage REST calls supabase-py cannot make itself (e.g. streamed
+    uploads), so they reuse the same keep-alive connections.
+
+    Returns:
+        httpx.Client: Shared HTTP/2 client (created with the Supabase client)
+    """
+    get_supabase_client()
+    return _http_client
+
+
+def reset_supabase_client() -> None:
+    """
+    Drop the cached Supabase client so the next call builds a fresh one.
+
+    Closes the shared HTTP pool. Called on application shutdown and by tests
+    that patch settings or swap the client between cases.
+    """
+    global _http_client
+    get_supabase_client.cache_clear()
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+
+
 async def verify_supabase_connection() -> dict:
     """
     Verify Supabase connection by attempting a simple query.
@@ -3,16 +3,69 @@ Admin Authorization Dependencies
 
 FastAPI dependencies for admin-only route protection.
 Validates superuser status from Supabase JWT user_metadata.
+
+Superuser grants are cached in Redis per access token so admin dashboards
+polling /admin/stats don't pay a Supabase Auth Admin API round-trip per
+request. An entry never outlives its token, and denials are never cached.
 """
+import hashlib
+import logging
+import time
+from functools import lru_cache
+
+import jwt
 from fastapi import Depends, HTTPException, status
-from app.core.auth import get_current_user
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPAuthorizationCredentials
+from app.core.auth import get_current_user, security
 from app.schemas.auth import AuthenticatedUser
 from app.core.supabase import get_supabase_client
+from app.core.redis_client import get_async_redis_client
+from app.services.admin_service import AdminService
+
+logger = logging.getLogger(__name__)
+
+# Max staleness of a cached superuser grant (seconds); also capped by token exp
+SUPERUSER_CACHE_TTL = 300
+
+
+def _superuser_cache_key(token: str) -> str:
+    """Redis key holding a token's superuser grant (full SHA-256 of the token)."""
+    return f"superuser:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+async def _is_cached_superuser(token: str, user_id: str) -> bool:
+    """
+    Check for a cached superuser grant.
+
+    Returns:
+        True if the token holds a cached grant; False on miss or Redis failure
+    """
+    try:
+        cached = await get_async_redis_client().get(_superuser_cache_key(token))
+    except Exception as e:
+        logger.warning(f"Superuser cache read failed for user {user_id}: {str(e)}")
+        return False
+    return cached == "1"
+
+
+async def _cache_superuser(token: str, user_id: str) -> None:
+    """Cache a superuser grant until min(SUPERUSER_CACHE_TTL, token exp); failures are logged and ignored."""
+    try:
+        # Signature and exp were already verified by get_current_user
+        exp = jwt.decode(token, options={"verify_signature": False})["exp"]
+        ttl = min(SUPERUSER_CACHE_TTL, int(exp - time.time()))
+        if ttl <= 0:
+            return
+        await get_async_redis_client().setex(_superuser_cache_key(token), ttl, "1")
+    except Exception as e:
+        logger.warning(f"Superuser cache write failed for user {user_id}: {str(e)}")
 
 
 async def require_superuser(
     user: AuthenticatedUser = Depends(get_current_user),
-    supabase = Depends(get_supabase_client)
+    supabase = Depends(get_supabase_client),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> AuthenticatedUser:
     """
     Dependency to enforce superuser access.
@@ -31,6 +84,7 @@ async def require_superuser(
     Args:
         user: Authenticated user from JWT token (provided by get_current_user dependency)
         supabase: Supabase client (provided by get_supabase_client dependency)
+        credentials: Bearer token the user authenticated with (cache key)
 
     Returns:
         AuthenticatedUser: The authenticated user if they are a superuser
@@ -42,16 +96,24 @@ async def require_superuser(
         - Backend enforcement ONLY - frontend checks are UX-only
         - All admin endpoints MUST use this dependency
         - Non-superusers receive 403 Forbidden
+        - The JWT itself is still verified on every request by get_current_user;
+          only grants are cached, per token, for at most SUPERUSER_CACHE_TTL
+          seconds and never past the token's exp. Denials always re-check
+          Supabase, so a new token sees a promotion immediately.
 
     Example:
         @router.get("/admin/stats")
         async def get_stats(user: AuthenticatedUser = Depends(require_superuser)):
             return {"total_users": 150}
     """
+    token = credentials.credentials
+    if await _is_cached_superuser(token, user.user_id):
+        return user
+
     # Fetch user metadata from Supabase to check is_superuser flag
     # Note: JWT may not have is_superuser in payload, so we fetch from Supabase Auth
     try:
-        response = supabase.auth.admin.get_user_by_id(user.user_id)
+        response = await run_in_threadpool(supabase.auth.admin.get_user_by_id, user.user_id)
 
         if not response or not response.user:
             raise HTTPException(
@@ -60,7 +122,7 @@ async def require_superuser(
             )
 
         user_metadata = response.user.user_metadata or {}
-        is_superuser = user_metadata.get('is_superuser', False)
+        is_superuser = bool(user_metadata.get('is_superuser', False))
 
         if not is_superuser:
             raise HTTPException(
@@ -68,6 +130,7 @@ async def require_superuser(
                 detail="Admin access required"
             )
 
+        await _cache_superuser(token, user.user_id)
         return user
 
     except HTTPException:
@@ -78,3 +141,18 @@ async def require_superuser(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
+
+
+@lru_cache(maxsize=1)
+def get_admin_service() -> AdminService:
+    """
+    Dependency for getting the shared AdminService.
+
+    AdminService only holds the process-wide Supabase client, so one
+    instance is built and reused for every request.
+    Call get_admin_service.cache_clear() to rebuild it (e.g. in tests).
+
+    Returns:
+        AdminService: Shared admin service instance
+    """
+    return AdminService(get_supabase_client())
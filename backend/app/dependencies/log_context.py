@@ -0,0 +1,34 @@
+"""
+Log Context Dependencies
+
+Binds per-request identifiers into structlog's context variables so every
+event logged while handling the request carries them, without each handler
+repeating user_id=/job_id= keyword arguments.
+"""
+import structlog
+from fastapi import Depends, Request
+
+from app.core.auth import get_current_user
+from app.schemas.auth import AuthenticatedUser
+
+
+async def bind_log_context(
+    request: Request,
+    current_user: AuthenticatedUser = Depends(get_current_user)
+) -> None:
+    """
+    Bind user_id (and job_id, when the route has one) to the log context.
+
+    Must be an async dependency: sync dependencies run in a worker thread
+    whose context changes are not visible to the endpoint.
+
+    Args:
+        request: Incoming request (for path parameters)
+        current_user: Authenticated user from JWT token (resolved once per request)
+    """
+    structlog.contextvars.clear_contextvars()
+    job_id = request.path_params.get("job_id")
+    if job_id is not None:
+        structlog.contextvars.bind_contextvars(user_id=current_user.user_id, job_id=job_id)
+    else:
+        structlog.contextvars.bind_contextvars(user_id=current_user.user_id)
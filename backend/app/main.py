@@ -3,18 +3,94 @@ Transfer2Read Backend API
 
 FastAPI application entrypoint with CORS configuration and route registration.
 """
+from contextlib import asynccontextmanager
+import logging
+import anyio.to_thread
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 from app.core.config import settings
+from app.core.logging_config import configure_logging
+from app.core.supabase import get_supabase_client, reset_supabase_client
+from app.core.redis_client import init_redis_client, get_async_redis_client, close_redis_clients
+from app.services.analytics_queue import get_analytics_queue
+from app.services.usage_batcher import get_usage_batcher
+from app.services.validation import (
+    InvalidFileTypeError,
+    FileTooLargeError,
+    ValidationError
+)
+from app.services.storage.supabase_storage import StorageUploadError
+from app.api import health
+from app.api.v1 import admin, auth, jobs, test_ai, upload, usage, users
+from app.middleware.upload_size import UploadSizeLimitMiddleware
+
+configure_logging(logging.DEBUG if settings.DEBUG else logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
+
+    Startup:
+    - Sizes the threadpool used for blocking Supabase calls
+    - Builds the shared Supabase and Redis clients so the first request
+      after a cold start doesn't pay connection setup cost
+    - Starts the background analytics event writer and usage increment batcher
+
+    Shutdown:
+    - Stops the analytics writer and usage batcher, flushing what is pending
+    - Releases shared connection pools and drops cached clients
+
+    Client failures are logged, not raised: the app still boots and
+    /api/readyz reports the degraded dependency.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+
+    try:
+        app.state.supabase = get_supabase_client()
+    except Exception as e:
+        logger.error(f"Supabase client initialization failed at startup: {str(e)}")
+        app.state.supabase = None
+
+    # Sync client pings on init - keep it off the event loop
+    app.state.redis = await run_in_threadpool(init_redis_client)
+
+    try:
+        await get_async_redis_client().ping()
+    except Exception as e:
+        logger.warning(f"Async Redis warm-up failed at startup: {str(e)}")
+
+    if app.state.supabase is not None:
+        get_analytics_queue().start()
+
+    # Always started: uploads enqueue increments even while Supabase is down,
+    # and they must still be written once it recovers
+    get_usage_batcher().start()
+
+    yield
+
+    await get_analytics_queue().stop()
+    await get_usage_batcher().stop()
+    await close_redis_clients()
+    reset_supabase_client()
+
 
 app = FastAPI(
     title="Transfer2Read API",
     description="AI-powered PDF to EPUB converter with 95%+ fidelity",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes response bodies straight to bytes, several times
+    # faster than the stdlib json encoder behind JSONResponse
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Security Headers Middleware
@@ -36,6 +112,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["X-XSS-Protection"] = "1; mode=block"
         return response
 
+# Oversized uploads are rejected before FastAPI reads the multipart body
+app.add_middleware(UploadSizeLimitMiddleware, paths={"/api/v1/upload"})
 app.add_middleware(SecurityHeadersMiddleware)
 
 # CORS Configuration
@@ -61,54 +139,26 @@ async def root():
         "status": "operational"
     }
 
-# Register health check routes
-from app.api.health import router as health_router
-app.include_router(health_router, prefix="/api", tags=["health"])
-
-# Register test AI routes
-from app.api.v1.test_ai import router as test_ai_router
-app.include_router(test_ai_router, prefix="/api/v1", tags=["test-ai"])
-
-# Register auth routes
-from app.api.v1.auth import router as auth_router
-app.include_router(auth_router, prefix="/api/v1", tags=["auth"])
-
-# Register users routes
-from app.api.v1.users import router as users_router
-app.include_router(users_router, prefix="/api/v1", tags=["users"])
-
-# Register upload routes
-from app.api.v1.upload import router as upload_router
-app.include_router(upload_router, prefix="/api/v1", tags=["upload"])
-
-# Register jobs routes
-from app.api.v1.jobs import router as jobs_router
-app.include_router(jobs_router, prefix="/api/v1", tags=["jobs"])
+# Register routes (health probes under /api, everything else under /api/v1)
+app.include_router(health.router, prefix="/api", tags=["health"])
 
-# Register usage routes
-from app.api.v1.usage import router as usage_router
-app.include_router(usage_router, prefix="/api/v1", tags=["usage"])
-
-# Register admin routes
-from app.api.v1.admin import router as admin_router
-app.include_router(admin_router, prefix="/api/v1", tags=["admin"])
+for router, tag in (
+    (test_ai.router, "test-ai"),
+    (auth.router, "auth"),
+    (users.router, "users"),
+    (upload.router, "upload"),
+    (jobs.router, "jobs"),
+    (usage.router, "usage"),
+    (admin.router, "admin"),
+):
+    app.include_router(router, prefix="/api/v1", tags=[tag])
 
 
 # Global Exception Handlers
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from app.services.validation import (
-    InvalidFileTypeError,
-    FileTooLargeError,
-    ValidationError
-)
-from app.services.storage.supabase_storage import StorageUploadError
-
-
 @app.exception_handler(InvalidFileTypeError)
 async def invalid_file_type_handler(request: Request, exc: InvalidFileTypeError):
     """Handle invalid file type errors (non-PDF files)"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": str(exc), "code": "INVALID_FILE_TYPE"}
     )
@@ -117,7 +167,7 @@ async def invalid_file_type_handler(request: Request, exc: InvalidFileTypeError)
 @app.exception_handler(FileTooLargeError)
 async def file_too_large_handler(request: Request, exc: FileTooLargeError):
     """Handle file size limit errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=413,
         content={"detail": str(exc), "code": "FILE_TOO_LARGE"}
     )
@@ -126,7 +176,7 @@ async def file_too_large_handler(request: Request, exc: FileTooLargeError):
 @app.exception_handler(StorageUploadError)
 async def storage_upload_error_handler(request: Request, exc: StorageUploadError):
     """Handle Supabase Storage upload errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": str(exc), "code": "STORAGE_ERROR"}
     )
@@ -4,19 +4,99 @@ Limit Enforcement Middleware
 FastAPI dependency for checking subscription tier limits before processing uploads.
 Enforces file size and monthly conversion limits based on user tier.
 """
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 import logging
 
 from app.core.auth import get_current_user
-from app.core.limits import get_file_size_limit, get_conversion_limit
-from app.core.supabase import get_supabase_client
-from app.core.redis_client import get_cached_redis_client
+from app.core.limits import CONVERSION_LIMITS, FILE_SIZE_LIMITS
 from app.schemas.auth import AuthenticatedUser, SubscriptionTier
-from app.services.usage_tracker import UsageTracker
+from app.services.usage_tracker import get_usage_tracker
 
 logger = logging.getLogger(__name__)
 
+# Max users with an exhausted quota remembered per process
+QUOTA_CACHE_MAX_SIZE = 10_000
+
+# Seconds a "limit reached" result is reused before usage is looked up again
+QUOTA_CACHE_TTL = 5
+
+# user_id -> (conversion count, limit, monotonic expiry); oldest-used first.
+# Only exhausted quotas are cached: counts never go down within a month, so
+# a rejection stays correct, while an under-limit count goes stale as soon
+# as the user's next upload is recorded.
+_exhausted_quota_cache: "OrderedDict[str, Tuple[int, int, float]]" = OrderedDict()
+
+
+def _get_exhausted_quota(user_id: str) -> Optional[Tuple[int, int]]:
+    """Return (count, limit) if the user recently hit their limit and the entry is fresh."""
+    entry = _exhausted_quota_cache.get(user_id)
+    if entry is None:
+        return None
+    count, limit, expires_at = entry
+    if expires_at <= time.monotonic():
+        _exhausted_quota_cache.pop(user_id, None)
+        return None
+    return count, limit
+
+
+def _cache_exhausted_quota(user_id: str, count: int, limit: int) -> None:
+    """Remember that a user has reached their limit, evicting the oldest entry if full."""
+    _exhausted_quota_cache[user_id] = (count, limit, time.monotonic() + QUOTA_CACHE_TTL)
+    _exhausted_quota_cache.move_to_end(user_id)
+    if len(_exhausted_quota_cache) > QUOTA_CACHE_MAX_SIZE:
+        _exhausted_quota_cache.popitem(last=False)
+
+
+def clear_quota_cache() -> None:
+    """Drop all cached quota rejections (e.g. in tests)."""
+    _exhausted_quota_cache.clear()
+
+
+# (year, month) -> first day of the following month (YYYY-MM-DD); holds the
+# current month only
+_reset_date_cache: Tuple[Tuple[int, int], str] = ((0, 0), "")
+
+
+def _next_reset_date(now: datetime) -> str:
+    """Return the date usage resets after now's month, formatted once per month."""
+    global _reset_date_cache
+    key = (now.year, now.month)
+    if _reset_date_cache[0] != key:
+        year, month = (now.year + 1, 1) if now.month == 12 else (now.year, now.month + 1)
+        _reset_date_cache = (key, f"{year:04d}-{month:02d}-01")
+    return _reset_date_cache[1]
+
+
+def file_size_limit_detail(tier: str, file_size: int, max_size: int) -> dict:
+    """
+    Build the FILE_SIZE_LIMIT_EXCEEDED error body for an oversized upload.
+
+    Shared by check_tier_limits and the upload size middleware so both
+    rejections look the same to the client.
+
+    Args:
+        tier: User's tier (upper-case)
+        file_size: Request size in bytes
+        max_size: Tier limit in bytes
+
+    Returns:
+        dict: HTTPException detail payload
+    """
+    max_size_mb = max_size // (1024 * 1024)
+    return {
+        "detail": f"File size exceeds your tier limit. Maximum allowed: {max_size_mb}MB for {tier} tier.",
+        "code": "FILE_SIZE_LIMIT_EXCEEDED",
+        "current_size_mb": round(file_size / (1024 * 1024), 2),
+        "max_size_mb": max_size_mb,
+        "tier": tier,
+        "upgrade_url": "/pricing"
+    }
+
 
 async def check_tier_limits(
     request: Request,
@@ -76,58 +156,46 @@ async def check_tier_limits(
     content_length = request.headers.get("content-length")
     if content_length:
         file_size = int(content_length)
-        max_size = get_file_size_limit(tier)
+        max_size = FILE_SIZE_LIMITS[tier]
         
         if max_size and file_size > max_size:
-            max_size_mb = max_size // (1024 * 1024)
-            current_size_mb = round(file_size / (1024 * 1024), 2)
-            
+            detail = file_size_limit_detail(tier, file_size, max_size)
+
             logger.warning(
                 f"User {user_id} exceeded file size limit: "
-                f"{current_size_mb}MB > {max_size_mb}MB (tier: {tier})"
-            )
-            
-            raise HTTPException(
-                status_code=403,
-                detail={
-                    "detail": f"File size exceeds your tier limit. Maximum allowed: {max_size_mb}MB for {tier} tier.",
-                    "code": "FILE_SIZE_LIMIT_EXCEEDED",
-                    "current_size_mb": current_size_mb,
-                    "max_size_mb": max_size_mb,
-                    "tier": tier,
-                    "upgrade_url": "/pricing"
-                }
+                f"{detail['current_size_mb']}MB > {detail['max_size_mb']}MB (tier: {tier})"
             )
+
+            raise HTTPException(status_code=403, detail=detail)
     
     # Check 2: Monthly Conversion Limit
-    supabase = get_supabase_client()
-    redis = get_cached_redis_client()  # May be None if Redis unavailable
-    
-    tracker = UsageTracker(supabase, redis)
-    
-    try:
-        usage = tracker.get_usage(user_id)
-    except Exception as e:
-        logger.error(f"Failed to get usage for user {user_id}: {e}", exc_info=True)
-        # CRITICAL DECISION: Fail open or fail closed?
-        # Failing open (allow upload) risks abuse but maintains availability
-        # Failing closed (block upload) is more secure but impacts UX
-        # For now, fail open with warning
-        logger.warning(f"Usage check failed for user {user_id}, allowing upload (fail-open policy)")
-        return None
-    
-    current_count = usage.get("conversion_count", 0)
-    limit = usage.get("tier_limit")
+    # Users retrying after a rejection are answered from memory
+    exhausted = _get_exhausted_quota(user_id)
+    if exhausted is not None:
+        current_count, limit = exhausted
+    else:
+        # The limit comes from the JWT tier, so the count is the only lookup
+        limit = CONVERSION_LIMITS[tier]
+        tracker = await run_in_threadpool(get_usage_tracker)
+        
+        try:
+            # Redis GET (and Supabase query on a miss) stays off the event loop
+            current_count = await run_in_threadpool(tracker.get_conversion_count, user_id)
+        except Exception as e:
+            logger.error(f"Failed to get usage for user {user_id}: {e}", exc_info=True)
+            # CRITICAL DECISION: Fail open or fail closed?
+            # Failing open (allow upload) risks abuse but maintains availability
+            # Failing closed (block upload) is more secure but impacts UX
+            # For now, fail open with warning
+            logger.warning(f"Usage check failed for user {user_id}, allowing upload (fail-open policy)")
+            return None
+        
+        if limit is not None and current_count >= limit:
+            _cache_exhausted_quota(user_id, current_count, limit)
     
     # Check if user has exceeded their conversion limit
     if limit is not None and current_count >= limit:
-        # Calculate next month reset date
-        now = datetime.now(timezone.utc)
-        if now.month == 12:
-            next_month = now.replace(year=now.year + 1, month=1, day=1)
-        else:
-            next_month = now.replace(month=now.month + 1, day=1)
-        reset_date = next_month.strftime('%Y-%m-%d')
+        reset_date = _next_reset_date(datetime.now(timezone.utc))
         
         logger.warning(
             f"User {user_id} exceeded conversion limit: "
@@ -0,0 +1,84 @@
+"""
+Rate Limit Enforcement Middleware
+
+Fixed-window request limits backed by Redis, used to shed runaway polling
+before it reaches Supabase.
+
+A single Lua script increments the window counter and sets its expiry
+atomically, so concurrent requests from every API worker share one count.
+The script is registered once and invoked by SHA (EVALSHA), so polls don't
+resend its source. Redis failures fail open: the request is served rather
+than rejected.
+"""
+import logging
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, status
+from redis.commands.core import AsyncScript
+from app.core.auth import get_current_user
+from app.schemas.auth import AuthenticatedUser
+from app.core.redis_client import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Progress polls allowed per user and job within one window
+PROGRESS_RATE_LIMIT = 2
+PROGRESS_RATE_WINDOW_MS = 1000
+
+# INCR the window counter and start its expiry on the first hit
+_INCR_WINDOW_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+# _INCR_WINDOW_SCRIPT registered on the shared async client
+_incr_window_script: Optional[AsyncScript] = None
+
+
+def _get_incr_window_script() -> AsyncScript:
+    """Return the registered window script, re-registering if the shared client was rebuilt."""
+    global _incr_window_script
+    client = get_async_redis_client()
+    if _incr_window_script is None or _incr_window_script.registered_client is not client:
+        _incr_window_script = client.register_script(_INCR_WINDOW_SCRIPT)
+    return _incr_window_script
+
+
+def _progress_rate_key(user_id: str, job_id: str) -> str:
+    """Redis key counting progress polls for a user and job in the current window."""
+    return f"rl:prog:{user_id}:{job_id}"
+
+
+async def limit_progress_polling(
+    job_id: UUID,
+    user: AuthenticatedUser = Depends(get_current_user)
+) -> None:
+    """
+    Dependency limiting progress polls to PROGRESS_RATE_LIMIT per window.
+
+    The frontend polls every ~2s, so only misbehaving clients hit the limit.
+
+    Args:
+        job_id: Job identifier from the route path
+        user: Authenticated user from JWT token
+
+    Raises:
+        HTTPException(429): Too many polls in the current window
+    """
+    key = _progress_rate_key(user.user_id, str(job_id))
+    try:
+        count = await _get_incr_window_script()(keys=[key], args=[PROGRESS_RATE_WINDOW_MS])
+    except Exception as e:
+        logger.warning(f"Progress rate limit check failed for user {user.user_id}: {str(e)}")
+        return
+
+    if int(count) > PROGRESS_RATE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={"detail": "Too many progress requests", "code": "RATE_LIMITED"},
+            headers={"Retry-After": "1"}
+        )
@@ -0,0 +1,145 @@
+"""
+Upload Size Middleware
+
+Rejects oversized uploads before the request body is read.
+
+FastAPI parses (and spools) a multipart body before any route dependency
+runs, so check_tier_limits only sees Content-Length once the whole file has
+already been received. This ASGI middleware runs first: it resolves the
+caller's tier from the bearer token and rejects straight from the
+Content-Length header, and for bodies sent without one (chunked transfer)
+it counts bytes as they arrive and stops reading at the cap.
+"""
+import logging
+from typing import Iterable, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.auth import get_current_user
+from app.core.limits import get_file_size_limit
+from app.middleware.limits import file_size_limit_detail
+from app.services.validation import FileValidationService
+
+logger = logging.getLogger(__name__)
+
+# Hard cap for callers without a plan limit (PRO/PREMIUM safety limit)
+MAX_UPLOAD_BYTES = FileValidationService.PRO_TIER_LIMIT
+
+
+class UploadTooLargeError(Exception):
+    """Raised from receive() once a streamed body passes the size cap."""
+    pass
+
+
+async def _resolve_tier(headers: Headers) -> Optional[str]:
+    """Return the caller's tier from the bearer token, or None if unauthenticated."""
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        user = await get_current_user(HTTPAuthorizationCredentials(scheme=scheme, credentials=token))
+    except HTTPException:
+        # Let the route answer 401 as usual
+        return None
+    return user.tier.value.upper() if user.tier else "FREE"
+
+
+def _content_length(headers: Headers) -> Optional[int]:
+    """Parse Content-Length; None if absent or malformed."""
+    try:
+        return int(headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _rejection(tier: Optional[str], size: int, plan_limit: Optional[int]) -> ORJSONResponse:
+    """
+    Build the error response for an oversized upload.
+
+    Plan limits (FREE) answer 403 FILE_SIZE_LIMIT_EXCEEDED exactly like
+    check_tier_limits; the hard cap answers 413 FILE_TOO_LARGE like the
+    file validator.
+    """
+    if plan_limit:
+        return ORJSONResponse(status_code=403, content={"detail": file_size_limit_detail(tier, size, plan_limit)})
+
+    limit_mb = MAX_UPLOAD_BYTES // (1024 * 1024)
+    return ORJSONResponse(
+        status_code=413,
+        content={"detail": {
+            "detail": f"File size ({size / (1024 * 1024):.1f}MB) exceeds {tier or 'upload'} limit ({limit_mb}MB)",
+            "code": "FILE_TOO_LARGE"
+        }}
+    )
+
+
+class UploadSizeLimitMiddleware:
+    """
+    ASGI middleware enforcing per-tier upload size limits on the given paths.
+
+    Example:
+        >>> app.add_middleware(UploadSizeLimitMiddleware, paths={"/api/v1/upload"})
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            paths: Exact request paths whose POST bodies are size-checked
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        tier = await _resolve_tier(headers)
+        plan_limit = get_file_size_limit(tier) if tier else None
+        limit = plan_limit or MAX_UPLOAD_BYTES
+
+        content_length = _content_length(headers)
+        if content_length is not None:
+            if content_length > limit:
+                logger.warning(f"Rejected {content_length}-byte upload before reading body (tier: {tier})")
+                await _rejection(tier, content_length, plan_limit)(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        # No Content-Length: count bytes as the app reads them
+        received = 0
+        exceeded = False
+
+        async def counting_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise UploadTooLargeError(f"Upload exceeded {limit} bytes")
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            # Drop whatever error the app produced for the aborted body
+            if not exceeded:
+                await send(message)
+
+        try:
+            await self.app(scope, counting_receive, guarded_send)
+        except Exception:
+            if not exceeded:
+                raise
+
+        if exceeded:
+            logger.warning(f"Aborted streamed upload after {received} bytes (tier: {tier})")
+            await _rejection(tier, received, plan_limit)(scope, receive, send)
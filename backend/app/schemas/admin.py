@@ -8,6 +8,12 @@ from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
 
+# Allowed query values for GET /admin/users - validated at the route layer
+TierFilter = Literal['ALL', 'FREE', 'PRO', 'PREMIUM']
+UserSortField = Literal['email', 'tier', 'conversions', 'last_login', 'created_at']
+SortOrder = Literal['asc', 'desc']
+
+
 class SystemStats(BaseModel):
     """
     System-wide statistics for admin dashboard.
@@ -7,6 +7,7 @@ Handles user management, system statistics, and tier updates.
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
+from fastapi.concurrency import run_in_threadpool
 from supabase import Client
 
 from app.schemas.auth import SubscriptionTier
@@ -23,6 +24,9 @@ class AdminService:
     - System-wide statistics (users, conversions, active jobs)
     - User list with pagination, search, and filtering
     - User tier management (upgrades/downgrades)
+
+    The supabase-py client is synchronous, so each public coroutine runs its
+    blocking implementation in the threadpool to keep the event loop free.
     """
 
     def __init__(self, supabase_client: Client):
@@ -50,6 +54,45 @@ class AdminService:
         Raises:
             Exception: If database queries fail
         """
+        return await run_in_threadpool(self._get_system_stats)
+
+    def _get_system_stats(self) -> SystemStats:
+        """
+        Blocking implementation of get_system_stats().
+
+        Uses the admin_stats RPC, which computes every counter in a single
+        query. Falls back to one query per counter if the function is not
+        deployed.
+        """
+        try:
+            return self._get_system_stats_via_rpc()
+        except Exception as e:
+            logger.warning(f"Failed to get system stats via RPC, falling back to per-counter queries: {e}")
+
+        return self._get_system_stats_via_queries()
+
+    def _get_system_stats_via_rpc(self) -> SystemStats:
+        """
+        Fetch all system counters in one round-trip.
+
+        Raises:
+            Exception: If the RPC fails or returns an unexpected payload
+        """
+        result = self.supabase.rpc('admin_stats').execute()
+
+        stats = result.data
+        if not isinstance(stats, dict):
+            raise ValueError("Unexpected admin_stats response")
+
+        return SystemStats(
+            total_users=stats['total_users'],
+            total_conversions=stats['total_conversions'],
+            active_jobs=stats['active_jobs'],
+            monthly_conversions=stats['monthly_conversions']
+        )
+
+    def _get_system_stats_via_queries(self) -> SystemStats:
+        """Fallback: query each counter separately."""
         try:
             # Total users from Supabase Auth
             # Use admin.list_users with pagination to get count
@@ -147,6 +190,100 @@ class AdminService:
         Raises:
             Exception: If database queries fail
         """
+        return await run_in_threadpool(
+            self._get_users,
+            page=page,
+            page_size=page_size,
+            search=search,
+            tier_filter=tier_filter,
+            sort_by=sort_by,
+            sort_order=sort_order
+        )
+
+    def _get_users(
+        self,
+        page: int,
+        page_size: int,
+        search: Optional[str],
+        tier_filter: Optional[str],
+        sort_by: str,
+        sort_order: str
+    ) -> Dict[str, Any]:
+        """
+        Blocking implementation of get_users().
+
+        Uses the admin_list_users RPC, which filters, sorts, paginates and
+        counts in a single query. Falls back to paging through the Auth API
+        if the function is not deployed.
+        """
+        try:
+            return self._get_users_via_rpc(page, page_size, search, tier_filter, sort_by, sort_order)
+        except Exception as e:
+            logger.warning(f"Failed to list users via RPC, falling back to auth API: {e}")
+
+        return self._get_users_via_auth_api(page, page_size, search, tier_filter, sort_by, sort_order)
+
+    def _get_users_via_rpc(
+        self,
+        page: int,
+        page_size: int,
+        search: Optional[str],
+        tier_filter: Optional[str],
+        sort_by: str,
+        sort_order: str
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of users and the total match count in one round-trip.
+
+        Raises:
+            Exception: If the RPC fails or returns an unexpected payload
+        """
+        result = self.supabase.rpc('admin_list_users', {
+            'p_search': search or None,
+            'p_tier': tier_filter or None,
+            'p_sort_by': sort_by,
+            'p_sort_order': sort_order,
+            'p_limit': page_size,
+            'p_offset': (page - 1) * page_size
+        }).execute()
+
+        rows = result.data
+        if not isinstance(rows, list):
+            raise ValueError("Unexpected admin_list_users response")
+
+        # Every row carries the unpaginated count; an empty page means no matches
+        # (or a page past the end)
+        total = rows[0]['total_count'] if rows else 0
+        users = [
+            AdminUserInfo(
+                id=row['id'],
+                email=row['email'],
+                tier=row['tier'],
+                total_conversions=row['total_conversions'],
+                last_login=row.get('last_login'),
+                created_at=row['created_at']
+            )
+            for row in rows
+        ]
+
+        return {
+            'users': users,
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'total_pages': (total + page_size - 1) // page_size
+        }
+
+    def _get_users_via_auth_api(
+        self,
+        page: int,
+        page_size: int,
+        search: Optional[str],
+        tier_filter: Optional[str],
+        sort_by: str,
+        sort_order: str
+    ) -> Dict[str, Any]:
+        """Fallback: fetch every auth user and filter/sort/paginate in Python."""
         try:
             # Fetch users from Supabase Auth with pagination
             # Note: Supabase Auth API has limited filtering - we'll filter in Python for MVP
@@ -246,6 +383,10 @@ class AdminService:
             ValueError: If new_tier is invalid
             Exception: If update fails
         """
+        return await run_in_threadpool(self._update_user_tier, user_id, new_tier)
+
+    def _update_user_tier(self, user_id: str, new_tier: str) -> Dict[str, Any]:
+        """Blocking implementation of update_user_tier()."""
         # Validate tier
         valid_tiers = ['FREE', 'PRO', 'PREMIUM']
         if new_tier not in valid_tiers:
@@ -0,0 +1,143 @@
+"""
+Analytics Event Queue
+
+Fire-and-forget writer for conversion_events analytics rows.
+
+Request handlers enqueue events without awaiting any I/O; a single
+background task started from the app lifespan collects them into batches
+and writes each batch as one multi-row insert, flushing when the batch
+reaches ANALYTICS_MAX_BATCH rows or ANALYTICS_FLUSH_INTERVAL_MS after its
+first event, whichever comes first. Pending events are flushed on shutdown.
+
+Analytics is best-effort: when the queue is full, new events are dropped
+and counted rather than slowing down user-facing requests.
+"""
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from supabase import Client
+
+from app.core.config import settings
+from app.core.supabase import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+# Pending events held in memory per process before new ones are dropped
+ANALYTICS_QUEUE_MAX_SIZE = 10_000
+
+
+class AnalyticsQueue:
+    """
+    Bounded in-process queue of conversion_events rows.
+
+    Attributes:
+        dropped_events: Events discarded because the queue was full
+    """
+
+    def __init__(
+        self,
+        supabase: Client,
+        max_size: int = ANALYTICS_QUEUE_MAX_SIZE,
+        max_batch: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            supabase: Supabase client used for the inserts
+            max_size: Max pending events before new ones are dropped
+            max_batch: Max rows per insert (default: settings.ANALYTICS_MAX_BATCH)
+            flush_interval_ms: Max wait for a batch to fill (default: settings.ANALYTICS_FLUSH_INTERVAL_MS)
+        """
+        self.supabase = supabase
+        self.max_batch = max_batch or settings.ANALYTICS_MAX_BATCH
+        self.flush_interval = (flush_interval_ms or settings.ANALYTICS_FLUSH_INTERVAL_MS) / 1000
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._worker: Optional[asyncio.Task] = None
+        self.dropped_events = 0
+
+    def enqueue(self, event: Dict[str, Any]) -> bool:
+        """
+        Queue an event for insertion without blocking.
+
+        Args:
+            event: conversion_events row (job_id, user_id, event_type, event_data)
+
+        Returns:
+            bool: False if the queue was full and the event was dropped
+        """
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            logger.warning(
+                f"Analytics queue full, dropped {event.get('event_type')} event "
+                f"({self.dropped_events} dropped so far)"
+            )
+            return False
+
+    def start(self) -> None:
+        """Start the background drain task (idempotent)."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+    async def stop(self) -> None:
+        """Stop the drain task and flush every event still pending."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._write(batch)
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of events; failures are logged and the batch is discarded."""
+        try:
+            await run_in_threadpool(self.supabase.table("conversion_events").insert(batch).execute)
+        except Exception as e:
+            logger.warning(f"Failed to write {len(batch)} analytics events: {str(e)}")
+
+    async def _drain(self) -> None:
+        """Collect and write batches until cancelled; a partial batch is written on cancel."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            try:
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                await self._write(batch)
+                raise
+            await self._write(batch)
+
+
+@lru_cache(maxsize=1)
+def get_analytics_queue() -> AnalyticsQueue:
+    """
+    Get the process-wide analytics queue.
+
+    Call get_analytics_queue.cache_clear() to rebuild it (e.g. in tests).
+
+    Returns:
+        AnalyticsQueue: Shared queue bound to the shared Supabase client
+    """
+    return AnalyticsQueue(get_supabase_client())
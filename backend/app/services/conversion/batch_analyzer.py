@@ -14,7 +14,7 @@ from pathlib import Path
 from app.services.ai.layout_analyzer import LayoutAnalyzer
 from app.services.ai.claude import ClaudeProvider
 from app.services.conversion.document_loader import load_and_render_pages, PageData
-from app.schemas.layout_analysis import PageAnalysis, TextBlocks
+from app.schemas.layout_analysis import PageAnalysis, TextBlocks, AnalysisMetadata, TokenUsage
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -155,8 +155,6 @@ class BatchAnalyzer:
                         page_num=page_data.page_num,
                     )
                     # Add metadata
-                    from backend.app.schemas.layout_analysis import AnalysisMetadata, TokenUsage
-                    import time
                     result.analysis_metadata = AnalysisMetadata(
                         model_used=self.simple_page_provider.get_model_name(),
                         response_time_ms=0,  # Not tracked for simple pages
@@ -0,0 +1,93 @@
+"""
+Job Ownership Cache
+
+Bounded in-process cache of job_id -> owner user_id.
+
+A job's owner never changes, so JobService.get_job can answer "does this
+job exist and who owns it?" from memory for jobs it has seen recently and
+skip the separate existence query on a job_status cache miss. Entries
+expire after JOB_OWNERSHIP_CACHE_TTL seconds and are dropped when the job
+is deleted.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Max jobs remembered per process
+JOB_OWNERSHIP_CACHE_MAX_SIZE = 10_000
+
+# Seconds an ownership entry is trusted before it is looked up again
+JOB_OWNERSHIP_CACHE_TTL = 60
+
+
+class JobOwnershipCache:
+    """
+    Thread-safe LRU of job owners with a per-entry TTL.
+
+    JobService methods run in the threadpool, so access is serialized with
+    a lock.
+    """
+
+    def __init__(self, max_size: int = JOB_OWNERSHIP_CACHE_MAX_SIZE, ttl: float = JOB_OWNERSHIP_CACHE_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Max entries before the least recently used is evicted
+            ttl: Seconds each entry stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        # job_id -> (owner user_id, expiry timestamp); oldest-used first
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[str]:
+        """
+        Return the cached owner of a job, if known and not expired.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            str: Owner user_id, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return None
+            owner, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[job_id]
+                return None
+            self._entries.move_to_end(job_id)
+            return owner
+
+    def set(self, job_id: str, owner: str) -> None:
+        """
+        Remember a job's owner.
+
+        Args:
+            job_id: Job UUID
+            owner: Owner user_id
+        """
+        with self._lock:
+            self._entries[job_id] = (owner, time.monotonic() + self.ttl)
+            self._entries.move_to_end(job_id)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, job_id: str) -> None:
+        """Forget a job (e.g. after it is deleted)."""
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries (e.g. in tests)."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide instance shared by every JobService
+job_ownership_cache = JobOwnershipCache()
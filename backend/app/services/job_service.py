@@ -5,17 +5,141 @@ Handles all business logic for conversion job operations.
 Separates concerns from API routes following the Service Pattern.
 """
 from typing import List, Optional, Tuple, Dict, Any
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from supabase import Client
+from postgrest.exceptions import APIError
 import logging
 import json
+import orjson
 import redis
 
 from app.schemas.job import JobSummary, JobDetail
+from app.services.job_cache import job_ownership_cache
 from app.services.storage.supabase_storage import SupabaseStorageService
 
 logger = logging.getLogger(__name__)
 
+# Short TTL for cached job list pages - absorbs frontend polling/refreshes
+# while keeping pipeline status changes visible within seconds
+JOB_LIST_CACHE_TTL = 10
+
+
+# Progress polls arrive every ~2s per client; workers invalidate the entry on
+# every status update, so the TTL only bounds staleness if invalidation fails
+PROGRESS_CACHE_TTL = 2
+
+# Terminal states never change again (deletion drops the key), so their
+# payload can be served from cache for much longer
+PROGRESS_TERMINAL_CACHE_TTL = 3600
+TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED", "CANCELLED"})
+
+
+def progress_cache_ttl(status: str, quality_confidence: Optional[int] = None) -> int:
+    """
+    TTL for a cached progress payload.
+
+    generate_epub marks a job COMPLETED before quality scoring writes the
+    report, so a COMPLETED payload without a quality score may still change
+    and keeps the short TTL.
+    """
+    if status not in TERMINAL_STATUSES:
+        return PROGRESS_CACHE_TTL
+    if status == "COMPLETED" and quality_confidence is None:
+        return PROGRESS_CACHE_TTL
+    return PROGRESS_TERMINAL_CACHE_TTL
+
+
+# SQLSTATEs raised by the job activity RPCs (migration 015)
+JOB_NOT_FOUND_SQLSTATE = "P0002"
+JOB_FORBIDDEN_SQLSTATE = "42501"
+
+
+# Only the columns the progress payload needs; quality_report is reduced to
+# three JSONB paths server-side instead of shipping the whole report
+PROGRESS_ROW_COLUMNS = (
+    "id,user_id,status,progress,stage_metadata,"
+    "qr_confidence:quality_report->overall_confidence,"
+    "qr_estimated_cost:quality_report->estimated_cost,"
+    "qr_elements:quality_report->elements"
+)
+
+
+@dataclass
+class ProgressRow:
+    """Narrow view of a conversion_jobs row for progress polling"""
+
+    id: str
+    status: str
+    progress: int
+    stage_metadata: Dict[str, Any]
+    quality_report: Optional[Dict[str, Any]]  # Only overall_confidence, estimated_cost, elements
+
+
+def _progress_row_from_data(row: Dict[str, Any]) -> ProgressRow:
+    """Build a ProgressRow from a PROGRESS_ROW_COLUMNS select result."""
+    quality_report = {
+        key: row[column]
+        for key, column in (
+            ("overall_confidence", "qr_confidence"),
+            ("estimated_cost", "qr_estimated_cost"),
+            ("elements", "qr_elements"),
+        )
+        if row.get(column) is not None
+    }
+
+    return ProgressRow(
+        id=row["id"],
+        status=row["status"],
+        progress=row.get("progress") or 0,
+        stage_metadata=row.get("stage_metadata") or {},
+        quality_report=quality_report or None
+    )
+
+
+def progress_cache_key(job_id: str) -> str:
+    """Redis key holding the cached progress payload for a job."""
+    return f"progress:{job_id}"
+
+
+# Storage signatures are valid for SIGNED_URL_EXPIRY seconds; cached copies
+# expire 5 minutes earlier so a URL served from cache always has time left
+SIGNED_URL_EXPIRY = 3600
+SIGNED_URL_CACHE_TTL = SIGNED_URL_EXPIRY - 300
+
+
+def signed_url_cache_key(job_id: str, kind: str) -> str:
+    """Redis key holding a cached signed URL for a job's input or output file."""
+    return f"dl:{job_id}:{kind}"
+
+
+def _job_list_index_key(user_id: str) -> str:
+    """Redis SET holding every cached job list key for a user."""
+    return f"jobs:list:{user_id}:keys"
+
+
+def invalidate_job_list_cache(redis_client: Optional[redis.Redis], user_id: str) -> None:
+    """
+    Drop all cached job list pages for a user.
+
+    Call after any write that adds or removes one of the user's jobs.
+    Failures are logged and swallowed - the cache TTL bounds staleness.
+
+    Args:
+        redis_client: Redis client, or None if caching is disabled
+        user_id: User's UUID
+    """
+    if not redis_client:
+        return
+
+    try:
+        index_key = _job_list_index_key(user_id)
+        cached_keys = redis_client.smembers(index_key)
+        redis_client.delete(index_key, *cached_keys)
+        logger.info(f"Invalidated job list cache for user {user_id}")
+    except Exception as e:
+        logger.warning(f"Redis job list invalidation failed for user {user_id}: {str(e)}")
+
 
 class JobService:
     """
@@ -56,6 +180,11 @@ class JobService:
         """
         List jobs for a user with pagination and filtering.
 
+        Implements caching strategy:
+        - Cache key format: jobs:list:{user_id}:{limit}:{offset}:{status or ALL}
+        - TTL: JOB_LIST_CACHE_TTL (10 seconds)
+        - Cache invalidated on job creation, deletion and status updates
+
         Args:
             user_id: User's UUID
             limit: Maximum number of jobs to return (1-100)
@@ -70,9 +199,26 @@ class JobService:
         """
         logger.info(f"Listing jobs for user {user_id}, limit={limit}, offset={offset}, status={status}")
 
+        # Try cache first if Redis is available
+        cache_key = f"jobs:list:{user_id}:{limit}:{offset}:{status or 'ALL'}"
+        if self.redis:
+            try:
+                cached_data = self.redis.get(cache_key)
+                if cached_data:
+                    logger.info(f"Cache hit for job list {cache_key}")
+                    page = orjson.loads(cached_data)
+                    jobs = [JobSummary.model_validate(job) for job in page["jobs"]]
+                    return jobs, page["total"]
+            except Exception as e:
+                # Log cache error but continue to database fallback
+                logger.warning(f"Redis cache read failed for job list {cache_key}: {str(e)}")
+
         # Build query with explicit user_id filter for authorization
         query = self.supabase.table("conversion_jobs").select("*", count="exact").eq("user_id", user_id)
 
+        # Jobs awaiting background deletion are already gone from the user's view
+        query = query.neq("status", "DELETING")
+
         # Apply status filter if provided
         if status:
             query = query.eq("status", status)
@@ -110,8 +256,63 @@ class JobService:
             ))
 
         logger.info(f"Found {len(jobs)} jobs for user {user_id} (total: {total})")
+
+        # Store in cache and register the key for per-user invalidation
+        if self.redis:
+            try:
+                cache_data = orjson.dumps({
+                    "jobs": [job.model_dump(mode="json") for job in jobs],
+                    "total": total
+                })
+                index_key = _job_list_index_key(user_id)
+                pipe = self.redis.pipeline()
+                pipe.setex(cache_key, JOB_LIST_CACHE_TTL, cache_data)
+                pipe.sadd(index_key, cache_key)
+                pipe.expire(index_key, JOB_LIST_CACHE_TTL)
+                pipe.execute()
+            except Exception as e:
+                # Log cache write error but don't fail the request
+                logger.warning(f"Redis cache write failed for job list {cache_key}: {str(e)}")
+
         return jobs, total
 
+    def verify_job_owner(self, job_id: str, user_id: str) -> bool:
+        """
+        Check that a job exists and belongs to the user.
+
+        The owner of a recently seen job is answered from job_ownership_cache;
+        otherwise a single id/user_id select is made and its result cached.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID
+
+        Returns:
+            True if the job belongs to user_id, False if it does not exist
+
+        Raises:
+            PermissionError: If the job belongs to another user
+            Exception: If database query fails
+        """
+        owner = job_ownership_cache.get(job_id)
+        if owner is None:
+            job_exists_response = self.supabase.table("conversion_jobs").select("id, user_id").eq("id", job_id).execute()
+
+            if not job_exists_response.data or len(job_exists_response.data) == 0:
+                # Job doesn't exist at all
+                logger.warning(f"Job {job_id} does not exist")
+                return False
+
+            owner = job_exists_response.data[0]["user_id"]
+            job_ownership_cache.set(job_id, owner)
+
+        if owner != user_id:
+            # Job exists but doesn't belong to user - this is a 403 Forbidden case
+            logger.warning(f"Job {job_id} exists but doesn't belong to user {user_id}")
+            raise PermissionError(f"Job {job_id} does not belong to user {user_id}")
+
+        return True
+
     def get_job(self, job_id: str, user_id: str) -> Optional[JobDetail]:
         """
         Get details of a specific job with Redis caching.
@@ -169,20 +370,10 @@ class JobService:
         # Cache miss or Redis unavailable - fetch from database
         logger.info(f"Cache miss for job {job_id}, fetching from database")
 
-        # First, check if job exists at all (without user filter)
-        job_exists_response = self.supabase.table("conversion_jobs").select("id, user_id").eq("id", job_id).execute()
-
-        if not job_exists_response.data or len(job_exists_response.data) == 0:
-            # Job doesn't exist at all
-            logger.warning(f"Job {job_id} does not exist")
+        # First, check if job exists at all and belongs to the user
+        if not self.verify_job_owner(job_id, user_id):
             return None
 
-        # Job exists - check if it belongs to the user
-        if job_exists_response.data[0]["user_id"] != user_id:
-            # Job exists but doesn't belong to user - this is a 403 Forbidden case
-            logger.warning(f"Job {job_id} exists but doesn't belong to user {user_id}")
-            raise PermissionError(f"Job {job_id} does not belong to user {user_id}")
-
         # Query full job data with explicit user_id filter for authorization
         response = self.supabase.table("conversion_jobs").select("*").eq("id", job_id).eq("user_id", user_id).execute()
 
@@ -238,57 +429,201 @@ class JobService:
 
         return job_detail
 
-    def delete_job(self, job_id: str, user_id: str, async_cleanup: bool = False) -> Tuple[bool, Optional[dict]]:
+    def get_progress_row(self, job_id: str, user_id: str) -> Optional[ProgressRow]:
         """
-        Delete a job (hard delete) with optional file cleanup.
+        Get the fields needed for a progress update without loading the full job.
 
         Args:
             job_id: Job UUID
-            user_id: User's UUID (for logging)
-            async_cleanup: If True, schedule async cleanup via Celery
+            user_id: User's UUID (authorization filter)
 
         Returns:
-            Tuple of (success: bool, file_paths: dict with input_path and output_path)
+            ProgressRow if found and owned by user_id, None otherwise
 
         Raises:
-            Exception: If database operations fail
+            Exception: If database query fails
         """
-        logger.info(f"Deleting job {job_id} for user {user_id}, async={async_cleanup}")
+        response = self.supabase.table("conversion_jobs") \
+            .select(PROGRESS_ROW_COLUMNS) \
+            .eq("id", job_id) \
+            .eq("user_id", user_id) \
+            .execute()
 
-        # First, get job details to retrieve file paths before deletion
+        if not response.data:
+            return None
+
+        return _progress_row_from_data(response.data[0])
+
+    def get_progress_rows(self, job_ids: List[str], user_id: str) -> List[ProgressRow]:
+        """
+        Get progress rows for several jobs owned by a user in a single query.
+
+        IDs that do not exist or belong to another user are silently dropped.
+
+        Args:
+            job_ids: Job UUIDs
+            user_id: User's UUID (authorization filter)
+
+        Returns:
+            List of ProgressRow for the user's jobs among job_ids
+
+        Raises:
+            Exception: If database query fails
+        """
+        if not job_ids:
+            return []
+
+        response = self.supabase.table("conversion_jobs") \
+            .select(PROGRESS_ROW_COLUMNS) \
+            .in_("id", job_ids) \
+            .eq("user_id", user_id) \
+            .execute()
+
+        return [_progress_row_from_data(row) for row in response.data or []]
+
+    def get_job_file_paths(self, job_id: str, user_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get storage paths for a job owned by the user.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (ownership filter)
+
+        Returns:
+            dict with input_path and output_path, or None if not found / not owned
+
+        Raises:
+            Exception: If database query fails
+        """
         # IMPORTANT: Filter by user_id to ensure user owns the job
-        response = self.supabase.table("conversion_jobs").select("*").eq("id", job_id).eq("user_id", user_id).execute()
+        response = self.supabase.table("conversion_jobs").select("input_path, output_path").eq("id", job_id).eq("user_id", user_id).execute()
 
         if not response.data or len(response.data) == 0:
             logger.warning(f"Job {job_id} not found for user {user_id}")
-            return False, None
+            return None
 
         job_data = response.data[0]
-        input_path = job_data.get("input_path")
-        output_path = job_data.get("output_path")
+        return {
+            "input_path": job_data.get("input_path"),
+            "output_path": job_data.get("output_path")
+        }
+
+    def mark_for_deletion(self, job_id: str, user_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Mark a job DELETING in a single UPDATE and return its storage paths.
 
+        Also sets deleted_at so a running pipeline stops at its next
+        cancellation check. The row and files are removed later by
+        delete_job_task.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (ownership filter)
+
+        Returns:
+            dict with input_path and output_path, or None if the job was not
+            found or doesn't belong to the user
+
+        Raises:
+            Exception: If database update fails
+        """
+        response = self.supabase.table("conversion_jobs") \
+            .update({"status": "DELETING", "deleted_at": datetime.utcnow().isoformat()}) \
+            .eq("id", job_id) \
+            .eq("user_id", user_id) \
+            .execute()
+
+        if not response.data:
+            logger.warning(f"Job {job_id} not found for user {user_id}")
+            return None
+
+        logger.info(f"Job {job_id} marked for deletion")
+        job_ownership_cache.invalidate(job_id)
+
+        if self.redis:
+            try:
+                # Signed URLs too: a job being deleted must not hand out files
+                self.redis.delete(
+                    f"job_status:{job_id}",
+                    progress_cache_key(job_id),
+                    signed_url_cache_key(job_id, "input"),
+                    signed_url_cache_key(job_id, "output")
+                )
+            except Exception as e:
+                logger.warning(f"Redis cache invalidation failed for job {job_id}: {str(e)}")
+            invalidate_job_list_cache(self.redis, user_id)
+
+        job_data = response.data[0]
+        return {
+            "input_path": job_data.get("input_path"),
+            "output_path": job_data.get("output_path")
+        }
+
+    def delete_job_record(self, job_id: str, user_id: str) -> bool:
+        """
+        Hard delete a job row and invalidate its caches.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (ownership filter)
+
+        Returns:
+            bool: True if a row was deleted
+
+        Raises:
+            Exception: If database operations fail
+        """
         # Hard delete: Permanently remove from database (with user_id filter for security)
         delete_response = self.supabase.table("conversion_jobs").delete().eq("id", job_id).eq("user_id", user_id).execute()
 
         if not delete_response.data or len(delete_response.data) == 0:
             logger.warning(f"Failed to delete job {job_id}")
-            return False, None
+            return False
 
         logger.info(f"Job {job_id} permanently deleted from database")
+        job_ownership_cache.invalidate(job_id)
 
         # Invalidate Redis cache after deletion
         if self.redis:
             try:
                 cache_key = f"job_status:{job_id}"
-                self.redis.delete(cache_key)
+                self.redis.delete(
+                    cache_key,
+                    progress_cache_key(job_id),
+                    signed_url_cache_key(job_id, "input"),
+                    signed_url_cache_key(job_id, "output")
+                )
                 logger.info(f"Invalidated cache for deleted job {job_id}")
             except Exception as e:
                 logger.warning(f"Redis cache invalidation failed for job {job_id}: {str(e)}")
+            invalidate_job_list_cache(self.redis, user_id)
 
-        file_paths = {
-            "input_path": input_path,
-            "output_path": output_path
-        }
+        return True
+
+    def delete_job(self, job_id: str, user_id: str, async_cleanup: bool = False) -> Tuple[bool, Optional[dict]]:
+        """
+        Delete a job (hard delete) with optional file cleanup.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (for logging)
+            async_cleanup: If True, schedule async cleanup via Celery
+
+        Returns:
+            Tuple of (success: bool, file_paths: dict with input_path and output_path)
+
+        Raises:
+            Exception: If database operations fail
+        """
+        logger.info(f"Deleting job {job_id} for user {user_id}, async={async_cleanup}")
+
+        # First, get job details to retrieve file paths before deletion
+        file_paths = self.get_job_file_paths(job_id, user_id)
+        if file_paths is None:
+            return False, None
+
+        if not self.delete_job_record(job_id, user_id):
+            return False, None
 
         return True, file_paths
 
@@ -318,6 +653,43 @@ class JobService:
             # Log cleanup failure but don't fail the operation
             logger.warning(f"File cleanup failed for job {job_id}: {str(e)}")
 
+    def _get_cached_signed_url(self, job_id: str, kind: str, user_id: str) -> Optional[Tuple[str, datetime]]:
+        """
+        Read a cached signed URL for the job owner.
+
+        Returns:
+            (signed_url, expires_at) on a hit owned by user_id, None otherwise
+        """
+        if not self.redis:
+            return None
+
+        try:
+            cached_data = self.redis.get(signed_url_cache_key(job_id, kind))
+            if not cached_data:
+                return None
+            entry = orjson.loads(cached_data)
+            if entry["user_id"] != user_id:
+                return None
+            logger.info(f"Cache hit for {kind} URL of job {job_id}")
+            return entry["url"], datetime.fromisoformat(entry["expires_at"])
+        except Exception as e:
+            logger.warning(f"Redis cache read failed for {kind} URL of job {job_id}: {str(e)}")
+            return None
+
+    def _cache_signed_url(self, job_id: str, kind: str, owner_id: str, signed_url: str, expires_at: datetime) -> None:
+        """Cache a freshly signed URL; failures are logged and ignored."""
+        if not self.redis:
+            return
+
+        try:
+            self.redis.setex(
+                signed_url_cache_key(job_id, kind),
+                SIGNED_URL_CACHE_TTL,
+                orjson.dumps({"url": signed_url, "expires_at": expires_at.isoformat(), "user_id": owner_id})
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache write failed for {kind} URL of job {job_id}: {str(e)}")
+
     def generate_download_url(self, job_id: str, user_id: str) -> Optional[Tuple[str, datetime]]:
         """
         Generate signed download URL for a completed job.
@@ -334,6 +706,10 @@ class JobService:
         """
         logger.info(f"Generating download URL for job {job_id}, user {user_id}")
 
+        cached = self._get_cached_signed_url(job_id, "output", user_id)
+        if cached:
+            return cached
+
         # Query job - RLS automatically enforces user ownership
         response = self.supabase.table("conversion_jobs").select("*").eq("id", job_id).execute()
 
@@ -359,13 +735,15 @@ class JobService:
         signed_url = self.storage.generate_signed_url(
             bucket="downloads",
             path=output_path,
-            expires_in=3600  # 1 hour
+            expires_in=SIGNED_URL_EXPIRY
         )
 
-        expires_at = datetime.utcnow() + timedelta(seconds=3600)
+        expires_at = datetime.utcnow() + timedelta(seconds=SIGNED_URL_EXPIRY)
 
         logger.info(f"Generated download URL for job {job_id}, expires at {expires_at}")
 
+        self._cache_signed_url(job_id, "output", job_data["user_id"], signed_url, expires_at)
+
         return signed_url, expires_at
 
     def generate_input_file_url(self, job_id: str, user_id: str) -> Optional[Tuple[str, datetime]]:
@@ -384,6 +762,10 @@ class JobService:
         """
         logger.info(f"Generating input file URL for job {job_id}, user {user_id}")
 
+        cached = self._get_cached_signed_url(job_id, "input", user_id)
+        if cached:
+            return cached
+
         # Query job - RLS automatically enforces user ownership
         response = self.supabase.table("conversion_jobs").select("*").eq("id", job_id).execute()
 
@@ -403,15 +785,176 @@ class JobService:
         signed_url = self.storage.generate_signed_url(
             bucket="uploads",
             path=input_path,
-            expires_in=3600  # 1 hour
+            expires_in=SIGNED_URL_EXPIRY
         )
 
-        expires_at = datetime.utcnow() + timedelta(seconds=3600)
+        expires_at = datetime.utcnow() + timedelta(seconds=SIGNED_URL_EXPIRY)
 
         logger.info(f"Generated input file URL for job {job_id}, expires at {expires_at}")
 
+        self._cache_signed_url(job_id, "input", job_data["user_id"], signed_url, expires_at)
+
         return signed_url, expires_at
 
+    def submit_feedback(
+        self,
+        job_id: str,
+        user_id: str,
+        rating: str,
+        comment: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Record user feedback and its analytics event in one atomic RPC.
+
+        The RPC checks that the job exists and belongs to user_id, so no
+        separate job lookup is needed.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (from the verified JWT)
+            rating: 'positive' or 'negative'
+            comment: Optional free-text comment
+
+        Returns:
+            dict: The inserted job_feedback row, or None if the job was not
+            found or doesn't belong to the user
+
+        Raises:
+            Exception: If the RPC fails
+        """
+        result = self.supabase.rpc("submit_feedback_rpc", {
+            "p_job_id": job_id,
+            "p_user_id": user_id,
+            "p_rating": rating,
+            "p_comment": comment
+        }).execute()
+
+        if not result.data:
+            logger.warning(f"Feedback not recorded: job {job_id} not found for user {user_id}")
+            return None
+
+        return result.data[0]
+
+    def _owned_job_rpc(self, function: str, params: Dict[str, Any], job_id: str, user_id: str) -> Optional[Any]:
+        """
+        Call a job activity RPC that verifies ownership server-side.
+
+        Returns:
+            The RPC result data, or None if the job doesn't exist
+
+        Raises:
+            PermissionError: If the job belongs to another user
+            Exception: If the RPC fails for any other reason
+        """
+        try:
+            return self.supabase.rpc(function, params).execute().data
+        except APIError as e:
+            if e.code == JOB_NOT_FOUND_SQLSTATE:
+                logger.warning(f"{function}: job {job_id} not found for user {user_id}")
+                return None
+            if e.code == JOB_FORBIDDEN_SQLSTATE:
+                raise PermissionError(f"Job {job_id} does not belong to user {user_id}") from e
+            raise
+
+    def report_issue(
+        self,
+        job_id: str,
+        user_id: str,
+        issue_type: str,
+        page_number: Optional[int],
+        description: str,
+        screenshot_url: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Record an issue report and its analytics event in one atomic RPC.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (from the verified JWT)
+            issue_type: Issue category
+            page_number: Optional page the issue occurs on
+            description: Issue description
+            screenshot_url: Optional screenshot URL
+
+        Returns:
+            dict: The inserted job_issues row, or None if the job was not found
+
+        Raises:
+            PermissionError: If the job belongs to another user
+            Exception: If the RPC fails
+        """
+        data = self._owned_job_rpc("report_issue_tx", {
+            "p_job_id": job_id,
+            "p_user_id": user_id,
+            "p_issue_type": issue_type,
+            "p_page_number": page_number,
+            "p_description": description,
+            "p_screenshot_url": screenshot_url
+        }, job_id, user_id)
+        return data[0] if data else None
+
+    def get_feedback_status(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Check whether the user already rated the job, in one RPC.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (from the verified JWT)
+
+        Returns:
+            dict: {"has_feedback": bool, "feedback_rating": str | None}, or
+            None if the job was not found
+
+        Raises:
+            PermissionError: If the job belongs to another user
+            Exception: If the RPC fails
+        """
+        data = self._owned_job_rpc("check_feedback_tx", {
+            "p_job_id": job_id,
+            "p_user_id": user_id
+        }, job_id, user_id)
+        return data[0] if data else None
+
+    def list_feedback(self, job_id: str, user_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        List the job's feedback rows (newest first) in one RPC.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (from the verified JWT)
+
+        Returns:
+            list: job_feedback rows (empty if none), or None if the job was not found
+
+        Raises:
+            PermissionError: If the job belongs to another user
+            Exception: If the RPC fails
+        """
+        return self._owned_job_rpc("list_job_feedback_tx", {
+            "p_job_id": job_id,
+            "p_user_id": user_id
+        }, job_id, user_id)
+
+    def list_issues(self, job_id: str, user_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        List the job's issue reports (newest first) in one RPC.
+
+        Args:
+            job_id: Job UUID
+            user_id: User's UUID (from the verified JWT)
+
+        Returns:
+            list: job_issues rows (empty if none), or None if the job was not found
+
+        Raises:
+            PermissionError: If the job belongs to another user
+            Exception: If the RPC fails
+        """
+        return self._owned_job_rpc("list_job_issues_tx", {
+            "p_job_id": job_id,
+            "p_user_id": user_id
+        }, job_id, user_id)
+
     def update_job_status(
         self,
         job_id: str,
@@ -469,12 +1012,16 @@ class JobService:
             if self.redis:
                 try:
                     cache_key = f"job_status:{job_id}"
-                    self.redis.delete(cache_key)
+                    self.redis.delete(cache_key, progress_cache_key(job_id))
                     logger.info(f"Invalidated cache for job {job_id}")
                 except Exception as e:
                     # Log cache invalidation error but don't fail the update
                     logger.warning(f"Redis cache invalidation failed for job {job_id}: {str(e)}")
 
+                owner_id = response.data[0].get("user_id")
+                if owner_id:
+                    invalidate_job_list_cache(self.redis, owner_id)
+
             logger.info(f"Successfully updated job {job_id} status to {status}")
             return True
 
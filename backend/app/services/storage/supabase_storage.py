@@ -3,9 +3,21 @@ Supabase Storage Service
 
 Provides file upload, download, and deletion operations using Supabase Storage.
 """
-from typing import Optional
+from typing import BinaryIO, Iterator, List, Optional
+from urllib.parse import quote
+
+import httpx
 from supabase import Client
 
+from app.core.config import settings
+from app.core.supabase import get_supabase_http_client
+
+# Bytes sent per chunk by upload_stream
+UPLOAD_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Page size for folder listings and max keys per remove() request
+STORAGE_BATCH_SIZE = 1000
+
 
 class StorageUploadError(Exception):
     """Raised when file upload to Supabase Storage fails."""
@@ -45,15 +57,18 @@ class SupabaseStorageService:
         ... )
     """
 
-    def __init__(self, supabase_client: Client):
+    def __init__(self, supabase_client: Client, http_client: Optional[httpx.Client] = None):
         """
         Initialize the storage service with a Supabase client.
 
         Args:
             supabase_client: Configured Supabase client instance
+            http_client: HTTP client for streamed uploads (default: the pool
+                shared with the Supabase client, resolved on first use)
         """
         self.client = supabase_client
         self.storage = supabase_client.storage
+        self._http_client = http_client
 
     def upload_file(
         self,
@@ -104,6 +119,60 @@ class SupabaseStorageService:
                 f"Failed to upload file to {bucket}/{path}: {str(e)}"
             )
 
+    def upload_stream(
+        self,
+        bucket: str,
+        path: str,
+        stream: BinaryIO,
+        size: int,
+        content_type: str = "application/pdf"
+    ) -> None:
+        """
+        Upload a file object to Supabase Storage without loading it into memory.
+
+        The Storage REST endpoint is called directly with a chunked request
+        body, so at most UPLOAD_STREAM_CHUNK_SIZE bytes are held at a time
+        (supabase-py's upload() only accepts bytes or real file handles).
+
+        Args:
+            bucket: Bucket name ('uploads' or 'downloads')
+            path: File path within bucket (e.g., 'user_id/job_id/input.pdf')
+            stream: Readable binary file object positioned at the start
+            size: Total bytes to upload (sent as Content-Length)
+            content_type: MIME type (default: 'application/pdf')
+
+        Raises:
+            StorageUploadError: If upload fails due to network, authentication,
+                or storage errors
+
+        Example:
+            >>> with open("/tmp/doc.pdf", "rb") as f:
+            ...     storage_service.upload_stream(
+            ...         "uploads", "550e8400/a1b2c3d4/input.pdf", f, os.path.getsize("/tmp/doc.pdf")
+            ...     )
+        """
+        def chunks() -> Iterator[bytes]:
+            while chunk := stream.read(UPLOAD_STREAM_CHUNK_SIZE):
+                yield chunk
+
+        url = f"{settings.SUPABASE_URL}/storage/v1/object/{bucket}/{quote(path)}"
+        headers = {
+            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY}",
+            "apikey": settings.SUPABASE_SERVICE_KEY,
+            "Content-Type": content_type,
+            "Content-Length": str(size),
+            "x-upsert": "false"
+        }
+
+        try:
+            http_client = self._http_client or get_supabase_http_client()
+            response = http_client.post(url, content=chunks(), headers=headers)
+            response.raise_for_status()
+        except Exception as e:
+            raise StorageUploadError(
+                f"Failed to upload file to {bucket}/{path}: {str(e)}"
+            )
+
     def download_file(
         self,
         bucket: str,
@@ -236,3 +305,53 @@ class SupabaseStorageService:
         """
         response = self.storage.from_(bucket).list(prefix)
         return response
+
+    def _walk_folder(self, bucket: str, prefix: str) -> List[str]:
+        """
+        List every file path under a folder, following pages and subfolders.
+
+        Storage list() is neither recursive nor unbounded: it returns one page
+        of one folder level, with subfolders as entries without an id.
+        """
+        paths = []
+        offset = 0
+        while True:
+            page = self.storage.from_(bucket).list(
+                prefix, {"limit": STORAGE_BATCH_SIZE, "offset": offset}
+            )
+            for entry in page:
+                path = f"{prefix}/{entry['name']}"
+                if entry.get("id") is None:
+                    paths.extend(self._walk_folder(bucket, path))
+                else:
+                    paths.append(path)
+            if len(page) < STORAGE_BATCH_SIZE:
+                return paths
+            offset += len(page)
+
+    def delete_folder(self, bucket: str, prefix: str) -> int:
+        """
+        Delete every file under a folder, including nested subfolders.
+
+        Paths are collected before anything is removed (removing while paging
+        by offset would skip entries), then removed in batches of at most
+        STORAGE_BATCH_SIZE keys.
+
+        Args:
+            bucket: Bucket name ('uploads' or 'downloads')
+            prefix: Folder path without a trailing slash (e.g. 'user_id')
+
+        Returns:
+            Number of files removed
+
+        Raises:
+            Exception: If listing or removal fails (e.g. bucket does not exist)
+
+        Example:
+            >>> storage_service.delete_folder("uploads", "550e8400-e29b-41d4-a716-446655440000")
+            12
+        """
+        file_paths = self._walk_folder(bucket, prefix)
+        for i in range(0, len(file_paths), STORAGE_BATCH_SIZE):
+            self.storage.from_(bucket).remove(file_paths[i:i + STORAGE_BATCH_SIZE])
+        return len(file_paths)
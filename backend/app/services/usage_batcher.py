@@ -0,0 +1,145 @@
+"""
+Usage Increment Batcher
+
+Coalesces per-upload conversion count increments.
+
+Upload handlers record an increment without awaiting any I/O; a single
+background task started from the app lifespan collects increments for
+USAGE_FLUSH_INTERVAL_MS after the first one arrives, sums them per user and
+applies the whole batch through the shared UsageTracker's
+increment_usage_batch (one Supabase upsert plus one Redis pipeline). Pending
+increments are flushed on shutdown.
+
+Usage counts are therefore eventually consistent: a user's counter lags
+their uploads by at most one flush interval.
+"""
+import asyncio
+import logging
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.services.usage_tracker import get_usage_tracker
+
+logger = logging.getLogger(__name__)
+
+
+class UsageIncrementBatcher:
+    """
+    In-process buffer of pending usage increments, keyed by user.
+    """
+
+    def __init__(self, flush_interval_ms: Optional[int] = None):
+        """
+        Initialize the batcher.
+
+        Args:
+            flush_interval_ms: Window over which increments are coalesced
+                (default: settings.USAGE_FLUSH_INTERVAL_MS)
+        """
+        self.flush_interval = (flush_interval_ms or settings.USAGE_FLUSH_INTERVAL_MS) / 1000
+        self._pending: Counter = Counter()
+        self._has_pending = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    def enqueue(self, user_id: str, amount: int = 1) -> int:
+        """
+        Record conversions for a user without blocking.
+
+        Args:
+            user_id: User UUID
+            amount: Conversions to add
+
+        Returns:
+            int: Increments buffered for this user and not yet written
+        """
+        self._pending[user_id] += amount
+        self._has_pending.set()
+        return self._pending[user_id]
+
+    def start(self) -> None:
+        """Start the background flush task (idempotent)."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write every increment still pending."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """Write and clear the pending increments; increments that can't be written are logged and dropped."""
+        if not self._pending:
+            return
+
+        batch, self._pending = dict(self._pending), Counter()
+        self._has_pending.clear()
+
+        try:
+            await run_in_threadpool(_write_increments, batch)
+        except Exception as e:
+            # Usage tracking is non-critical
+            logger.error(f"Failed to write usage increments for users {', '.join(batch)}: {str(e)}")
+
+    async def _drain(self) -> None:
+        """Flush once per interval while increments arrive; pending ones are written on cancel."""
+        while True:
+            await self._has_pending.wait()
+            try:
+                await asyncio.sleep(self.flush_interval)
+            except asyncio.CancelledError:
+                await self._flush()
+                raise
+            await self._flush()
+
+
+def _write_increments(batch: Dict[str, int]) -> None:
+    """
+    Apply one batch through the shared tracker (blocking; run in the threadpool).
+
+    The tracker is looked up per flush, so the batcher writes through the
+    rebuilt tracker once Redis reconnects, and an earlier failure to create
+    the Supabase client is retried.
+
+    The batch is one statement, so a single failing user (e.g. deleted
+    between upload and flush) would fail it for everyone; on error each
+    user is retried on their own and only the failing users' increments
+    are dropped.
+    """
+    tracker = get_usage_tracker()
+    try:
+        tracker.increment_usage_batch(batch)
+        return
+    except Exception as e:
+        if len(batch) == 1:
+            raise
+        logger.warning(f"Usage batch write for {len(batch)} users failed, retrying per user: {str(e)}")
+
+    for user_id, amount in batch.items():
+        try:
+            tracker.increment_usage_batch({user_id: amount})
+        except Exception as e:
+            logger.error(f"Failed to write usage increment of {amount} for user {user_id}: {str(e)}")
+
+
+@lru_cache(maxsize=1)
+def get_usage_batcher() -> UsageIncrementBatcher:
+    """
+    Get the process-wide usage increment batcher.
+
+    Call get_usage_batcher.cache_clear() to rebuild it (e.g. in tests).
+
+    Returns:
+        UsageIncrementBatcher: Shared batcher writing through get_usage_tracker()
+    """
+    return UsageIncrementBatcher()
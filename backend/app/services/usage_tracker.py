@@ -6,10 +6,14 @@ Uses Supabase PostgreSQL for persistence and Redis for caching.
 """
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 from supabase import Client
 import redis
 
+from app.core.limits import get_conversion_limit
+from app.core.redis_client import init_redis_client
+from app.core.supabase import get_supabase_client
 from app.schemas.auth import SubscriptionTier
 
 logger = logging.getLogger(__name__)
@@ -116,32 +120,79 @@ class UsageTracker:
             logger.error(f"Failed to increment usage for user {user_id}: {e}")
             raise
 
-    def get_usage(self, user_id: str) -> dict:
+    def increment_usage_batch(self, increments: Dict[str, int]) -> Dict[str, int]:
         """
-        Get current month's usage statistics for user.
+        Add pending conversion counts for several users in one round-trip.
+
+        Uses a PostgreSQL function that upserts every user's row in a single
+        statement, then refreshes all of their Redis cache entries in one
+        pipeline.
+
+        Args:
+            increments: Conversions to add, keyed by user UUID
+
+        Returns:
+            Dict[str, int]: New conversion count for this month, keyed by user UUID
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if not increments:
+            return {}
+
+        month = self._get_current_month()
+        user_ids = list(increments)
+
+        try:
+            result = self.supabase.rpc(
+                'increment_user_usage_batch',
+                {
+                    'p_month': month,
+                    'p_user_ids': user_ids,
+                    'p_amounts': [increments[user_id] for user_id in user_ids]
+                }
+            ).execute()
+        except Exception as e:
+            logger.error(f"Failed to increment usage for {len(user_ids)} users: {e}")
+            raise
+
+        counts = {row['user_id']: row['conversion_count'] for row in result.data or []}
+
+        if self.redis and counts:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for user_id, count in counts.items():
+                    pipe.set(self._get_redis_key(user_id, month), count, ex=3600)  # TTL: 1 hour
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Redis cache update failed: {e}. Continuing without cache.")
+
+        logger.info(f"Incremented usage for {len(counts)} users (month: {month})")
+        return counts
+
+    def get_conversion_count(self, user_id: str, month: Optional[str] = None) -> int:
+        """
+        Get a user's conversion count for a month.
 
         Checks Redis cache first, falls back to Supabase database if cache miss.
-        Fetches user tier from Supabase Auth metadata to calculate limits.
+        This is the only I/O check_tier_limits needs: the limit itself comes
+        from the tier in the caller's JWT.
 
         Args:
             user_id: User UUID to query usage for
+            month: Month (YYYY-MM-01). Uses current month if not provided.
 
         Returns:
-            dict: Usage statistics with keys:
-                - month (str): Current month (YYYY-MM-01)
-                - conversion_count (int): Number of conversions this month
-                - tier (str): User's subscription tier
-                - tier_limit (int|None): Max conversions allowed (None = unlimited)
-                - remaining (int|None): Conversions remaining (None = unlimited)
+            int: Conversions started in the month
 
         Raises:
             Exception: If database operation fails
 
         Security:
             CRITICAL - Explicitly filters by user_id in database query for defense-in-depth.
-            Never rely solely on RLS policies - always filter by user_id in application code.
         """
-        month = self._get_current_month()
+        if month is None:
+            month = self._get_current_month()
         count = None  # Initialize as None to trigger database query if Redis unavailable
 
         # Try Redis cache first
@@ -187,6 +238,36 @@ class UsageTracker:
                 logger.error(f"Failed to fetch usage from database for user {user_id}: {e}")
                 raise
 
+        return count
+
+    def get_usage(self, user_id: str) -> dict:
+        """
+        Get current month's usage statistics for user.
+
+        Checks Redis cache first, falls back to Supabase database if cache miss.
+        Fetches user tier from Supabase Auth metadata to calculate limits.
+
+        Args:
+            user_id: User UUID to query usage for
+
+        Returns:
+            dict: Usage statistics with keys:
+                - month (str): Current month (YYYY-MM-01)
+                - conversion_count (int): Number of conversions this month
+                - tier (str): User's subscription tier
+                - tier_limit (int|None): Max conversions allowed (None = unlimited)
+                - remaining (int|None): Conversions remaining (None = unlimited)
+
+        Raises:
+            Exception: If database operation fails
+
+        Security:
+            CRITICAL - Explicitly filters by user_id in database query for defense-in-depth.
+            Never rely solely on RLS policies - always filter by user_id in application code.
+        """
+        month = self._get_current_month()
+        count = self.get_conversion_count(user_id, month)
+
         # Fetch user tier from Supabase Auth metadata
         try:
             user_result = self.supabase.auth.admin.get_user_by_id(user_id)
@@ -196,12 +277,7 @@ class UsageTracker:
             tier_str = 'FREE'
 
         # Calculate tier limit and remaining conversions
-        tier_limits = {
-            'FREE': 5,
-            'PRO': None,  # Unlimited
-            'PREMIUM': None  # Unlimited
-        }
-        limit = tier_limits.get(tier_str, 5)  # Default to FREE if unknown tier
+        limit = get_conversion_limit(tier_str)  # Defaults to FREE if unknown tier
 
         # Calculate remaining conversions (None for unlimited)
         if limit is not None:
@@ -216,3 +292,31 @@ class UsageTracker:
             'tier_limit': limit,
             'remaining': remaining
         }
+
+
+def get_usage_tracker() -> UsageTracker:
+    """
+    Get the process-wide UsageTracker.
+
+    The tracker holds no state besides its clients, which are process-wide
+    singletons, so one instance is reused for every request. The instance is
+    keyed on the Redis client, so a tracker built while Redis was down is
+    replaced as soon as init_redis_client() reconnects.
+
+    Blocks on a Redis ping while Redis is unavailable; call it from the
+    threadpool on async paths.
+
+    Returns:
+        UsageTracker: Shared tracker with optional Redis cache
+    """
+    return _usage_tracker_for(init_redis_client())
+
+
+@lru_cache(maxsize=1)
+def _usage_tracker_for(redis_client: Optional[redis.Redis]) -> UsageTracker:
+    """
+    Build the shared UsageTracker bound to redis_client.
+
+    Call _usage_tracker_for.cache_clear() to rebuild it (e.g. in tests).
+    """
+    return UsageTracker(get_supabase_client(), redis_client)
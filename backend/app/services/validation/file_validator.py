@@ -6,6 +6,9 @@ Validates uploaded files for type (PDF via magic bytes) and size (tier-based lim
 import magic
 from app.schemas.auth import SubscriptionTier
 
+# Every PDF starts with this header (ISO 32000-1, section 7.5.2)
+PDF_MAGIC = b"%PDF-"
+
 
 # Custom Exceptions
 class ValidationError(Exception):
@@ -50,12 +53,14 @@ class FileValidationService:
         """
         Validate file is a PDF using magic bytes detection.
 
-        Uses python-magic library to detect MIME type from file content,
-        not just the file extension. This prevents users from renaming
-        non-PDF files to .pdf and uploading them.
+        Compares the first 5 bytes against the %PDF- header, so the cost is
+        constant regardless of how much of the file is passed in. Checking
+        content rather than the extension prevents users from renaming
+        non-PDF files to .pdf and uploading them. Structural checks (page
+        count, encryption) happen later in the conversion pipeline.
 
         Args:
-            file_data: Binary file content to validate
+            file_data: Binary file content (only the leading bytes are needed)
 
         Returns:
             True if file is a valid PDF
@@ -72,10 +77,9 @@ class FileValidationService:
             ...     data = f.read()
             >>> validator.validate_pdf(data)  # Raises InvalidFileTypeError
         """
-        # Detect MIME type from file content using magic bytes
-        mime_type = magic.from_buffer(file_data, mime=True)
-
-        if mime_type != "application/pdf":
+        if file_data[:len(PDF_MAGIC)] != PDF_MAGIC:
+            # libmagic only runs on rejects, to name the type in the error
+            mime_type = magic.from_buffer(file_data, mime=True)
             raise InvalidFileTypeError(
                 f"Invalid file type: {mime_type}. Only PDF files are allowed."
             )
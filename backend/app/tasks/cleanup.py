@@ -4,22 +4,40 @@ Celery Tasks for Background Job Processing
 Handles asynchronous operations like file cleanup.
 """
 from celery import shared_task
+from celery.exceptions import Retry
 import logging
 
 from app.core.supabase import get_supabase_client
+from app.core.redis_client import init_redis_client
 from app.services.storage.supabase_storage import SupabaseStorageService
 from app.services.job_service import JobService
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait before re-checking that a concurrently deleted job row is gone
+RECHECK_DELETE_COUNTDOWN = 5
+
+# Folder holding each user's files, per storage bucket
+USER_STORAGE_PREFIXES = {
+    "uploads": "{user_id}",              # {user_id}/{job_id}/input.pdf
+    "downloads": "downloads/{user_id}"   # downloads/{user_id}/{job_id}/output.epub
+}
+
 
 @shared_task(
     bind=True,
+    name="app.tasks.cleanup.cleanup_job_files_task",  # Dispatched by name from the API
     max_retries=3,
     default_retry_delay=60,  # Retry after 1 minute
     autoretry_for=(Exception,)
 )
-def cleanup_job_files_task(self, job_id: str, input_path: str = None, output_path: str = None):
+def cleanup_job_files_task(
+    self,
+    job_id: str,
+    input_path: str = None,
+    output_path: str = None,
+    require_deleted: bool = False
+):
     """
     Clean up files associated with a deleted job (asynchronous).
 
@@ -30,6 +48,10 @@ def cleanup_job_files_task(self, job_id: str, input_path: str = None, output_pat
         job_id: Job UUID (for logging and tracking)
         input_path: Path to input file in uploads bucket (optional)
         output_path: Path to output file in downloads bucket (optional)
+        require_deleted: Only remove files once the job row is gone. Set when the
+            task is dispatched concurrently with the DB delete; if the row still
+            exists the task retries, and gives up (keeping the files) if the
+            delete never lands.
 
     Retry Policy:
         - Max retries: 3
@@ -51,13 +73,135 @@ def cleanup_job_files_task(self, job_id: str, input_path: str = None, output_pat
         storage_service = SupabaseStorageService(supabase)
         job_service = JobService(supabase, storage_service)
 
+        if require_deleted:
+            response = supabase.table("conversion_jobs").select("id").eq("id", job_id).execute()
+            if response.data:
+                if self.request.retries < self.max_retries:
+                    logger.info(f"[Celery] Job {job_id} not deleted yet, retrying cleanup")
+                    raise self.retry(countdown=RECHECK_DELETE_COUNTDOWN)
+                logger.warning(f"[Celery] Job {job_id} still exists, skipping file cleanup")
+                return {"status": "skipped", "job_id": job_id}
+
         # Perform cleanup
         job_service.cleanup_job_files(input_path, output_path, job_id)
 
         logger.info(f"[Celery] File cleanup completed for job {job_id}")
         return {"status": "success", "job_id": job_id}
 
+    except Retry:
+        raise
     except Exception as e:
         logger.error(f"[Celery] File cleanup failed for job {job_id}: {str(e)}")
         # Celery will automatically retry due to autoretry_for
         raise
+
+
+@shared_task(
+    bind=True,
+    name="app.tasks.cleanup.delete_job_task",  # Dispatched by name from the API
+    max_retries=3,
+    default_retry_delay=60,  # Retry after 1 minute
+    autoretry_for=(Exception,)
+)
+def delete_job_task(
+    self,
+    job_id: str,
+    user_id: str,
+    input_path: str = None,
+    output_path: str = None
+):
+    """
+    Hard delete a job marked DELETING and remove its files (asynchronous).
+
+    The API marks the row DELETING in a single UPDATE and returns 202; this
+    task performs the DELETE (and any cascades) and the Storage cleanup off
+    the request path.
+
+    Args:
+        job_id: Job UUID
+        user_id: Owner's UUID (ownership filter for the DELETE)
+        input_path: Path to input file in uploads bucket (optional)
+        output_path: Path to output file in downloads bucket (optional)
+
+    Retry Policy:
+        - Max retries: 3
+        - Retry delay: 60 seconds
+        - Auto-retry on any Exception; both steps are idempotent
+
+    Example:
+        >>> delete_job_task.delay(
+        ...     job_id="550e8400-e29b-41d4-a716-446655440000",
+        ...     user_id="7c9e6679-7425-40de-944b-e07fc1f90ae7",
+        ...     input_path="uploads/user-id/job-id/input.pdf",
+        ...     output_path="downloads/user-id/job-id/output.epub"
+        ... )
+    """
+    logger.info(f"[Celery] Deleting job {job_id}")
+
+    try:
+        supabase = get_supabase_client()
+        storage_service = SupabaseStorageService(supabase)
+        job_service = JobService(supabase, storage_service, init_redis_client())
+
+        # False means a previous attempt already removed the row
+        if not job_service.delete_job_record(job_id, user_id):
+            logger.info(f"[Celery] Job {job_id} row already deleted")
+
+        job_service.cleanup_job_files(input_path, output_path, job_id)
+
+        logger.info(f"[Celery] Job {job_id} deleted")
+        return {"status": "success", "job_id": job_id}
+
+    except Exception as e:
+        logger.error(f"[Celery] Deleting job {job_id} failed: {str(e)}")
+        # Celery will automatically retry due to autoretry_for
+        raise
+
+
+@shared_task(
+    bind=True,
+    name="app.tasks.cleanup.purge_user_data_task",  # Dispatched by name from the API
+    max_retries=3,
+    default_retry_delay=60,  # Retry after 1 minute
+    autoretry_for=(Exception,)
+)
+def purge_user_data_task(self, user_id: str):
+    """
+    Remove all of a deleted account's data (asynchronous).
+
+    DELETE /users/me deletes the auth user and returns 202; this task wipes
+    the user's conversion jobs and their files in every storage bucket off
+    the request path.
+
+    Args:
+        user_id: UUID of the deleted user
+
+    Retry Policy:
+        - Max retries: 3
+        - Retry delay: 60 seconds
+        - Auto-retry on any Exception; every step is idempotent
+
+    Example:
+        >>> purge_user_data_task.delay(user_id="7c9e6679-7425-40de-944b-e07fc1f90ae7")
+    """
+    logger.info(f"[Celery] Purging data for user {user_id}")
+
+    try:
+        supabase = get_supabase_client()
+        storage_service = SupabaseStorageService(supabase)
+
+        # One server-side DELETE; only the row count comes back
+        deleted = supabase.rpc("purge_user", {"p_user_id": user_id}).execute().data
+        logger.info(f"[Celery] Deleted {deleted or 0} jobs for user {user_id}")
+
+        for bucket, prefix in USER_STORAGE_PREFIXES.items():
+            removed = storage_service.delete_folder(bucket, prefix.format(user_id=user_id))
+            logger.info(f"[Celery] Removed {removed} files from {bucket} for user {user_id}")
+
+        logger.info(f"[Celery] Data purged for user {user_id}")
+        return {"status": "success", "user_id": user_id}
+
+    except Exception as e:
+        logger.error(f"[Celery] Purging data for user {user_id} failed: {str(e)}")
+        # Celery will automatically retry due to autoretry_for
+        raise
@@ -11,14 +11,15 @@ import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional
 from celery import chain
-from supabase import create_client, Client
 import redis
 import httpx
 
 from app.core.celery_app import celery_app
 from app.core.config import settings
+from app.core.supabase import get_supabase_client
 from app.services.stirling.stirling_client import StirlingPDFClient
 from app.services.storage.supabase_storage import SupabaseStorageService
+from app.services.job_service import progress_cache_key
 from app.services.ai.structure_analyzer import StructureAnalyzer
 from app.services.conversion import text_chunker
 from app.services.conversion.heuristic_structure import HeuristicStructureDetector
@@ -33,11 +34,6 @@ logger = logging.getLogger(__name__)
 # Helper Functions
 # ============================================================================
 
-def get_supabase_client() -> Client:
-    """Get Supabase client for database operations."""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
-
-
 def get_redis_client() -> Optional[redis.Redis]:
     """
     Get Redis client for cache invalidation.
@@ -96,26 +92,42 @@ def update_job_status(
         if status == "COMPLETED":
             update_data["completed_at"] = datetime.utcnow().isoformat()
 
-        # Execute update
-        supabase.table("conversion_jobs").update(update_data).eq("id", job_id).execute()
+        # Execute update; a job soft-deleted mid-stage keeps its DELETING status
+        supabase.table("conversion_jobs").update(update_data) \
+            .eq("id", job_id) \
+            .neq("status", "DELETING") \
+            .execute()
 
         logger.info(f"Updated job {job_id}: status={status}, progress={progress}")
 
         # Invalidate Redis cache after successful update
-        redis_client = get_redis_client()
-        if redis_client:
-            try:
-                cache_key = f"job_status:{job_id}"
-                redis_client.delete(cache_key)
-                logger.info(f"Invalidated cache for job {job_id}")
-            except Exception as e:
-                logger.warning(f"Redis cache invalidation failed for job {job_id}: {str(e)}")
+        invalidate_job_cache(job_id)
 
     except Exception as e:
         logger.error(f"Failed to update job {job_id} status: {str(e)}")
         raise
 
 
+def invalidate_job_cache(job_id: str) -> None:
+    """
+    Drop the cached job status and progress payload for a job.
+
+    Must follow every write that changes what those payloads show, including
+    direct conversion_jobs updates that bypass update_job_status.
+
+    Args:
+        job_id: Job UUID
+    """
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            cache_key = f"job_status:{job_id}"
+            redis_client.delete(cache_key, progress_cache_key(job_id))
+            logger.info(f"Invalidated cache for job {job_id}")
+        except Exception as e:
+            logger.warning(f"Redis cache invalidation failed for job {job_id}: {str(e)}")
+
+
 def check_cancellation(job_id: str) -> bool:
     """
     Check if job has been cancelled by checking deleted_at field.
@@ -833,7 +845,8 @@ def generate_epub(self, previous_result: Dict[str, Any]) -> Dict[str, Any]:
                 "download_url": download_url,
                 "completed_at": datetime.utcnow().isoformat()
             }
-        }).eq("id", job_id).execute()
+        }).eq("id", job_id).neq("status", "DELETING").execute()
+        invalidate_job_cache(job_id)
 
         logger.info(f"EPUB generation completed for job {job_id}: {output_path}")
 
@@ -955,6 +968,7 @@ def calculate_quality_score(self, previous_result: Dict[str, Any]) -> Dict[str,
         supabase.table("conversion_jobs").update({
             "quality_report": quality_report
         }).eq("id", job_id).execute()
+        invalidate_job_cache(job_id)
 
         # Update job status to COMPLETED with quality info in message
         confidence_msg = ""
@@ -997,6 +1011,7 @@ def calculate_quality_score(self, previous_result: Dict[str, Any]) -> Dict[str,
             supabase.table("conversion_jobs").update({
                 "quality_report": degraded_report
             }).eq("id", job_id).execute()
+            invalidate_job_cache(job_id)
             logger.info(f"Saved degraded quality report for job {job_id}")
         except Exception as db_error:
             logger.error(f"Failed to save degraded quality report: {db_error}")
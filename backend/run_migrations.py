@@ -29,6 +29,15 @@ migrations = [
     "007_quality_report_column.sql",
     "008_feedback_and_issues_tables.sql",
     "009_user_usage_table.sql",
+    "010_admin_list_users.sql",
+    "011_admin_stats.sql",
+    "012_submit_feedback_rpc.sql",
+    "013_submit_feedback_ownership.sql",
+    "014_deleting_status.sql",
+    "015_job_activity_rpcs.sql",
+    "016_job_children_rpcs.sql",
+    "017_usage_increment_batch.sql",
+    "018_purge_user.sql",
 ]
 
 migrations_dir = Path(__file__).parent / "supabase" / "migrations"
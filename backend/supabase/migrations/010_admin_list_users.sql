@@ -0,0 +1,77 @@
+-- Migration: Single-query paginated user listing for admin dashboard
+-- Description: Returns one page of users joined with usage totals, plus the
+--              total match count via a window function, in a single round-trip
+-- Story: 6.4 - Admin Dashboard (performance)
+
+-- ========================================
+-- 1. Create admin_list_users function
+-- ========================================
+-- Filtering, sorting and pagination run in Postgres instead of fetching every
+-- auth user into the API process. total_count is repeated on every row
+-- (COUNT(*) OVER ()) so callers get (rows, total) from one request.
+CREATE OR REPLACE FUNCTION admin_list_users(
+  p_search TEXT DEFAULT NULL,
+  p_tier TEXT DEFAULT NULL,
+  p_sort_by TEXT DEFAULT 'created_at',
+  p_sort_order TEXT DEFAULT 'desc',
+  p_limit INTEGER DEFAULT 20,
+  p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+  id UUID,
+  email TEXT,
+  tier TEXT,
+  total_conversions BIGINT,
+  last_login TIMESTAMP WITH TIME ZONE,
+  created_at TIMESTAMP WITH TIME ZONE,
+  total_count BIGINT
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH usage_totals AS (
+    SELECT user_id, SUM(conversion_count)::BIGINT AS total_conversions
+    FROM public.user_usage
+    GROUP BY user_id
+  ),
+  filtered AS (
+    SELECT
+      u.id,
+      COALESCE(u.email, '')::TEXT AS email,
+      COALESCE(u.raw_user_meta_data->>'tier', 'FREE') AS tier,
+      COALESCE(ut.total_conversions, 0)::BIGINT AS total_conversions,
+      u.last_sign_in_at AS last_login,
+      u.created_at
+    FROM auth.users u
+    LEFT JOIN usage_totals ut ON ut.user_id = u.id
+    WHERE (p_search IS NULL OR u.email ILIKE '%' || p_search || '%')
+      AND (p_tier IS NULL OR p_tier = 'ALL'
+           OR COALESCE(u.raw_user_meta_data->>'tier', 'FREE') = p_tier)
+  )
+  SELECT f.*, COUNT(*) OVER () AS total_count
+  FROM filtered f
+  ORDER BY
+    CASE WHEN p_sort_order = 'asc'  AND p_sort_by = 'email'       THEN lower(f.email) END ASC,
+    CASE WHEN p_sort_order = 'desc' AND p_sort_by = 'email'       THEN lower(f.email) END DESC,
+    CASE WHEN p_sort_order = 'asc'  AND p_sort_by = 'tier'        THEN f.tier END ASC,
+    CASE WHEN p_sort_order = 'desc' AND p_sort_by = 'tier'        THEN f.tier END DESC,
+    CASE WHEN p_sort_order = 'asc'  AND p_sort_by = 'conversions' THEN f.total_conversions END ASC,
+    CASE WHEN p_sort_order = 'desc' AND p_sort_by = 'conversions' THEN f.total_conversions END DESC,
+    CASE WHEN p_sort_order = 'asc'  AND p_sort_by = 'last_login'  THEN f.last_login END ASC NULLS FIRST,
+    CASE WHEN p_sort_order = 'desc' AND p_sort_by = 'last_login'  THEN f.last_login END DESC NULLS LAST,
+    CASE WHEN p_sort_order = 'asc'  AND p_sort_by = 'created_at'  THEN f.created_at END ASC,
+    CASE WHEN p_sort_order = 'desc' AND p_sort_by = 'created_at'  THEN f.created_at END DESC
+  LIMIT p_limit
+  OFFSET p_offset;
+$$;
+
+-- ========================================
+-- 2. Restrict access to the backend service role
+-- ========================================
+-- Exposes every user's email - never callable by end users
+REVOKE ALL ON FUNCTION admin_list_users(TEXT, TEXT, TEXT, TEXT, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION admin_list_users(TEXT, TEXT, TEXT, TEXT, INTEGER, INTEGER) TO service_role;
+
+COMMENT ON FUNCTION admin_list_users(TEXT, TEXT, TEXT, TEXT, INTEGER, INTEGER) IS 'Paginated admin user list with usage totals; total_count carries the unpaginated match count';
@@ -0,0 +1,39 @@
+-- Migration: Single-query system statistics for admin dashboard
+-- Description: Returns every /admin/stats counter as one JSON object so the
+--              API makes one round-trip instead of four
+-- Story: 6.4 - Admin Dashboard (performance)
+
+-- ========================================
+-- 1. Create admin_stats function
+-- ========================================
+-- Counters match the previous per-query implementation:
+--   total_conversions / monthly_conversions come from user_usage (which is
+--   what tier limits are enforced against), active_jobs from conversion_jobs.
+CREATE OR REPLACE FUNCTION admin_stats()
+RETURNS JSON
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT json_build_object(
+    'total_users', (SELECT COUNT(*) FROM auth.users),
+    'total_conversions', (SELECT COALESCE(SUM(conversion_count), 0) FROM public.user_usage),
+    'active_jobs', (
+      SELECT COUNT(*) FROM public.conversion_jobs
+      WHERE status IN ('PROCESSING', 'PENDING')
+    ),
+    'monthly_conversions', (
+      SELECT COALESCE(SUM(conversion_count), 0) FROM public.user_usage
+      WHERE month = date_trunc('month', now() AT TIME ZONE 'UTC')::DATE
+    )
+  );
+$$;
+
+-- ========================================
+-- 2. Restrict access to the backend service role
+-- ========================================
+REVOKE ALL ON FUNCTION admin_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION admin_stats() TO service_role;
+
+COMMENT ON FUNCTION admin_stats() IS 'System-wide counters for the admin dashboard in a single JSON object';
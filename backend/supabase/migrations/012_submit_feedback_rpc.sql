@@ -0,0 +1,49 @@
+-- Migration: Atomic feedback submission
+-- Description: Inserts the job_feedback row and its conversion_events analytics
+--              row in one transaction and one round-trip
+-- Story: 5.4 - Download & Feedback Flow (performance)
+
+-- ========================================
+-- 1. Create submit_feedback_rpc function
+-- ========================================
+-- Both inserts share the function's transaction, so a failed analytics insert
+-- rolls back the feedback row (and vice versa). Returns the new feedback row.
+CREATE OR REPLACE FUNCTION submit_feedback_rpc(
+  p_job_id UUID,
+  p_user_id UUID,
+  p_rating TEXT,
+  p_comment TEXT DEFAULT NULL
+)
+RETURNS SETOF public.job_feedback
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_feedback public.job_feedback;
+BEGIN
+  INSERT INTO public.job_feedback (job_id, user_id, rating, comment)
+  VALUES (p_job_id, p_user_id, p_rating, p_comment)
+  RETURNING * INTO v_feedback;
+
+  INSERT INTO public.conversion_events (job_id, user_id, event_type, event_data)
+  VALUES (
+    p_job_id,
+    p_user_id,
+    'feedback_' || p_rating,
+    jsonb_build_object('rating', p_rating, 'has_comment', COALESCE(p_comment, '') <> '')
+  );
+
+  RETURN NEXT v_feedback;
+END;
+$$;
+
+-- ========================================
+-- 2. Restrict access to the backend service role
+-- ========================================
+-- p_user_id is trusted input (taken from the verified JWT by the API), so the
+-- function must never be callable directly by end users
+REVOKE ALL ON FUNCTION submit_feedback_rpc(UUID, UUID, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION submit_feedback_rpc(UUID, UUID, TEXT, TEXT) TO service_role;
+
+COMMENT ON FUNCTION submit_feedback_rpc(UUID, UUID, TEXT, TEXT) IS 'Insert job feedback and its analytics event atomically; returns the feedback row';
@@ -0,0 +1,52 @@
+-- Migration: Enforce job ownership inside submit_feedback_rpc
+-- Description: The function now verifies the job exists and belongs to the
+--              caller before inserting, so the API no longer pre-fetches the job
+-- Story: 5.4 - Download & Feedback Flow (performance)
+
+-- ========================================
+-- 1. Replace submit_feedback_rpc with an ownership-checked insert
+-- ========================================
+-- The API runs with the service role (RLS bypassed, auth.uid() is NULL), so
+-- ownership is checked explicitly against p_user_id. When the job is missing
+-- or owned by someone else nothing is inserted and zero rows are returned,
+-- which the API maps to 404. job_feedback.job_id keeps its FK to
+-- conversion_jobs(id) ON DELETE CASCADE from migration 008.
+CREATE OR REPLACE FUNCTION submit_feedback_rpc(
+  p_job_id UUID,
+  p_user_id UUID,
+  p_rating TEXT,
+  p_comment TEXT DEFAULT NULL
+)
+RETURNS SETOF public.job_feedback
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_feedback public.job_feedback;
+BEGIN
+  INSERT INTO public.job_feedback (job_id, user_id, rating, comment)
+  SELECT p_job_id, p_user_id, p_rating, p_comment
+  WHERE EXISTS (
+    SELECT 1 FROM public.conversion_jobs j
+    WHERE j.id = p_job_id AND j.user_id = p_user_id
+  )
+  RETURNING * INTO v_feedback;
+
+  IF NOT FOUND THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO public.conversion_events (job_id, user_id, event_type, event_data)
+  VALUES (
+    p_job_id,
+    p_user_id,
+    'feedback_' || p_rating,
+    jsonb_build_object('rating', p_rating, 'has_comment', COALESCE(p_comment, '') <> '')
+  );
+
+  RETURN NEXT v_feedback;
+END;
+$$;
+
+COMMENT ON FUNCTION submit_feedback_rpc(UUID, UUID, TEXT, TEXT) IS 'Insert job feedback and its analytics event atomically if p_user_id owns the job; returns the feedback row or no rows';
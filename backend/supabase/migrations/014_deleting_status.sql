@@ -0,0 +1,28 @@
+-- Migration: Add DELETING job status
+-- Description: Jobs are marked DELETING by the API and hard-deleted (with their
+--              files) by a background Celery task
+-- Story: 3.4 - Conversion History Backend with Supabase (performance)
+
+-- ========================================
+-- 1. Allow the DELETING status
+-- ========================================
+ALTER TABLE public.conversion_jobs
+DROP CONSTRAINT IF EXISTS conversion_jobs_status_check;
+
+ALTER TABLE public.conversion_jobs
+ADD CONSTRAINT conversion_jobs_status_check
+CHECK (status IN (
+    'UPLOADED',
+    'QUEUED',
+    'PROCESSING',
+    'ANALYZING',
+    'EXTRACTING',
+    'STRUCTURING',
+    'GENERATING',
+    'COMPLETED',
+    'FAILED',
+    'CANCELLED',
+    'DELETING'
+));
+
+COMMENT ON COLUMN public.conversion_jobs.status IS 'Job status; DELETING rows are hidden from listings and removed by the delete_job_task worker';
@@ -0,0 +1,111 @@
+-- Migration: Single round-trip RPCs for issue reports and feedback checks
+-- Description: report_issue and check_existing_feedback each did an ownership
+--              SELECT followed by one or two writes/reads; each is now one
+--              function call that verifies ownership and does the work
+-- Story: 5.4 - Download & Feedback Flow (performance)
+
+-- ========================================
+-- Error contract shared by both functions
+-- ========================================
+-- The API runs with the service role (RLS bypassed, auth.uid() is NULL), so
+-- ownership is checked explicitly against p_user_id:
+--   SQLSTATE P0002 (no_data_found)         -> job does not exist   -> API 404
+--   SQLSTATE 42501 (insufficient_privilege) -> job owned by someone else -> API 403
+
+-- ========================================
+-- 1. report_issue_tx: issue row + analytics event
+-- ========================================
+CREATE OR REPLACE FUNCTION report_issue_tx(
+  p_job_id UUID,
+  p_user_id UUID,
+  p_issue_type TEXT,
+  p_page_number INT,
+  p_description TEXT,
+  p_screenshot_url TEXT DEFAULT NULL
+)
+RETURNS SETOF public.job_issues
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_owner UUID;
+  v_issue public.job_issues;
+BEGIN
+  SELECT user_id INTO v_owner FROM public.conversion_jobs WHERE id = p_job_id;
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Job % not found', p_job_id USING ERRCODE = 'P0002';
+  END IF;
+  IF v_owner <> p_user_id THEN
+    RAISE EXCEPTION 'Job % does not belong to user %', p_job_id, p_user_id USING ERRCODE = '42501';
+  END IF;
+
+  INSERT INTO public.job_issues (job_id, user_id, issue_type, page_number, description, screenshot_url)
+  VALUES (p_job_id, p_user_id, p_issue_type, p_page_number, p_description, p_screenshot_url)
+  RETURNING * INTO v_issue;
+
+  INSERT INTO public.conversion_events (job_id, user_id, event_type, event_data)
+  VALUES (
+    p_job_id,
+    p_user_id,
+    'issue_reported',
+    jsonb_build_object(
+      'issue_type', p_issue_type,
+      'has_page_number', p_page_number IS NOT NULL AND p_page_number <> 0,
+      'description_length', char_length(p_description)
+    )
+  );
+
+  RETURN NEXT v_issue;
+END;
+$$;
+
+COMMENT ON FUNCTION report_issue_tx(UUID, UUID, TEXT, INT, TEXT, TEXT) IS 'Insert a job issue and its analytics event atomically if p_user_id owns the job; returns the issue row';
+
+-- ========================================
+-- 2. check_feedback_tx: existing feedback lookup
+-- ========================================
+CREATE OR REPLACE FUNCTION check_feedback_tx(
+  p_job_id UUID,
+  p_user_id UUID
+)
+RETURNS TABLE (has_feedback BOOLEAN, feedback_rating TEXT)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_owner UUID;
+BEGIN
+  SELECT user_id INTO v_owner FROM public.conversion_jobs WHERE id = p_job_id;
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Job % not found', p_job_id USING ERRCODE = 'P0002';
+  END IF;
+  IF v_owner <> p_user_id THEN
+    RAISE EXCEPTION 'Job % does not belong to user %', p_job_id, p_user_id USING ERRCODE = '42501';
+  END IF;
+
+  RETURN QUERY
+  SELECT f.id IS NOT NULL, f.rating::TEXT
+  FROM (SELECT 1) AS one
+  LEFT JOIN LATERAL (
+    SELECT id, rating FROM public.job_feedback
+    WHERE job_id = p_job_id AND user_id = p_user_id
+    LIMIT 1
+  ) f ON TRUE;
+END;
+$$;
+
+COMMENT ON FUNCTION check_feedback_tx(UUID, UUID) IS 'Return whether p_user_id has rated the job (and the rating) if they own it';
+
+-- ========================================
+-- 3. Restrict access to the backend service role
+-- ========================================
+-- p_user_id is trusted input (taken from the verified JWT by the API), so the
+-- functions must never be callable directly by end users
+REVOKE ALL ON FUNCTION report_issue_tx(UUID, UUID, TEXT, INT, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION report_issue_tx(UUID, UUID, TEXT, INT, TEXT, TEXT) TO service_role;
+
+REVOKE ALL ON FUNCTION check_feedback_tx(UUID, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION check_feedback_tx(UUID, UUID) TO service_role;
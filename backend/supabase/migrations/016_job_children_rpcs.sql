@@ -0,0 +1,85 @@
+-- Migration: Single round-trip listings of a job's feedback and issues
+-- Description: get_job_feedback and get_job_issues fetched the job for an
+--              ownership check and then listed its child rows; each listing is
+--              now one function call that checks ownership and returns the rows
+-- Story: 5.4 - Download & Feedback Flow (performance)
+
+-- Error contract matches 015_job_activity_rpcs.sql:
+--   SQLSTATE P0002 (no_data_found)          -> job does not exist
+--   SQLSTATE 42501 (insufficient_privilege) -> job owned by someone else
+-- An owned job with no child rows returns an empty set.
+
+-- ========================================
+-- 1. list_job_feedback_tx
+-- ========================================
+CREATE OR REPLACE FUNCTION list_job_feedback_tx(
+  p_job_id UUID,
+  p_user_id UUID
+)
+RETURNS SETOF public.job_feedback
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_owner UUID;
+BEGIN
+  SELECT user_id INTO v_owner FROM public.conversion_jobs WHERE id = p_job_id;
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Job % not found', p_job_id USING ERRCODE = 'P0002';
+  END IF;
+  IF v_owner <> p_user_id THEN
+    RAISE EXCEPTION 'Job % does not belong to user %', p_job_id, p_user_id USING ERRCODE = '42501';
+  END IF;
+
+  RETURN QUERY
+  SELECT * FROM public.job_feedback
+  WHERE job_id = p_job_id
+  ORDER BY created_at DESC;
+END;
+$$;
+
+COMMENT ON FUNCTION list_job_feedback_tx(UUID, UUID) IS 'Return all feedback rows for the job, newest first, if p_user_id owns it';
+
+-- ========================================
+-- 2. list_job_issues_tx
+-- ========================================
+CREATE OR REPLACE FUNCTION list_job_issues_tx(
+  p_job_id UUID,
+  p_user_id UUID
+)
+RETURNS SETOF public.job_issues
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_owner UUID;
+BEGIN
+  SELECT user_id INTO v_owner FROM public.conversion_jobs WHERE id = p_job_id;
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Job % not found', p_job_id USING ERRCODE = 'P0002';
+  END IF;
+  IF v_owner <> p_user_id THEN
+    RAISE EXCEPTION 'Job % does not belong to user %', p_job_id, p_user_id USING ERRCODE = '42501';
+  END IF;
+
+  RETURN QUERY
+  SELECT * FROM public.job_issues
+  WHERE job_id = p_job_id
+  ORDER BY created_at DESC;
+END;
+$$;
+
+COMMENT ON FUNCTION list_job_issues_tx(UUID, UUID) IS 'Return all issue reports for the job, newest first, if p_user_id owns it';
+
+-- ========================================
+-- 3. Restrict access to the backend service role
+-- ========================================
+REVOKE ALL ON FUNCTION list_job_feedback_tx(UUID, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION list_job_feedback_tx(UUID, UUID) TO service_role;
+
+REVOKE ALL ON FUNCTION list_job_issues_tx(UUID, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION list_job_issues_tx(UUID, UUID) TO service_role;
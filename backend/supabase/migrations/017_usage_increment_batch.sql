@@ -0,0 +1,41 @@
+-- Migration: Batched usage increment
+-- Description: The API coalesces conversion counts per user over a short
+--              window; this function applies a whole batch (many users, any
+--              amount each) as one multi-row upsert instead of one
+--              increment_user_usage call per upload
+-- Story: 6.1 - Usage Tracking with Supabase PostgreSQL (performance)
+
+-- ========================================
+-- 1. increment_user_usage_batch: multi-user atomic upsert
+-- ========================================
+-- p_user_ids and p_amounts are parallel arrays; each user appears once
+CREATE OR REPLACE FUNCTION increment_user_usage_batch(
+  p_month DATE,
+  p_user_ids UUID[],
+  p_amounts INT[]
+)
+RETURNS TABLE (user_id UUID, conversion_count INTEGER)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  RETURN QUERY
+  INSERT INTO public.user_usage AS u (user_id, month, conversion_count, updated_at)
+  SELECT batch.user_id, p_month, batch.amount, NOW()
+  FROM unnest(p_user_ids, p_amounts) AS batch(user_id, amount)
+  ON CONFLICT ON CONSTRAINT user_usage_pkey
+  DO UPDATE SET
+    conversion_count = u.conversion_count + EXCLUDED.conversion_count,
+    updated_at = NOW()
+  RETURNING u.user_id, u.conversion_count;
+END;
+$$;
+
+COMMENT ON FUNCTION increment_user_usage_batch(DATE, UUID[], INT[]) IS 'Atomically adds p_amounts[i] to the p_month usage of p_user_ids[i], creating rows as needed; returns the new counts';
+
+-- ========================================
+-- 2. Restrict access to the backend service role
+-- ========================================
+REVOKE ALL ON FUNCTION increment_user_usage_batch(DATE, UUID[], INT[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION increment_user_usage_batch(DATE, UUID[], INT[]) TO service_role;
@@ -0,0 +1,37 @@
+-- Migration: Server-side purge of a deleted account's jobs
+-- Description: Account deletion removed conversion_jobs rows through a
+--              PostgREST DELETE ... ?user_id=eq.X, which returns every deleted
+--              row to the caller and can hit gateway timeouts for long
+--              histories; this function does the delete in one statement
+--              inside the database and returns only the row count
+-- Story: 2.4 - Password Reset & User Profile (account deletion, performance)
+
+-- ========================================
+-- 1. purge_user: delete all of a user's conversion jobs
+-- ========================================
+-- Child rows (job_feedback, job_issues, conversion_events) go with their jobs
+-- through the existing ON DELETE CASCADE foreign keys
+CREATE OR REPLACE FUNCTION purge_user(p_user_id UUID)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_deleted INTEGER;
+BEGIN
+  DELETE FROM public.conversion_jobs WHERE user_id = p_user_id;
+  GET DIAGNOSTICS v_deleted = ROW_COUNT;
+  RETURN v_deleted;
+END;
+$$;
+
+COMMENT ON FUNCTION purge_user(UUID) IS 'Delete every conversion job owned by p_user_id in one transaction; returns the number of jobs deleted';
+
+-- ========================================
+-- 2. Restrict access to the backend service role
+-- ========================================
+-- p_user_id is trusted input (taken from the verified JWT by the API), so the
+-- function must never be callable directly by end users
+REVOKE ALL ON FUNCTION purge_user(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION purge_user(UUID) TO service_role;
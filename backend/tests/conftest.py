@@ -7,9 +7,50 @@ import pytest
 from httpx import AsyncClient, ASGITransport
 from app.main import app
 from unittest.mock import Mock
-from jose import jwt
+import jwt
 from datetime import datetime, timedelta
 from app.core.config import settings
+from app.core.supabase import reset_supabase_client
+from app.api.v1.jobs import _job_service_for
+from app.api.v1.upload import get_storage_service
+from app.dependencies.admin import get_admin_service
+from app.services.analytics_queue import get_analytics_queue
+from app.services.usage_batcher import get_usage_batcher
+from app.services.usage_tracker import _usage_tracker_for
+from app.core.auth import clear_token_cache
+from app.services.job_cache import job_ownership_cache
+from app.middleware.limits import clear_quota_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    """
+    Reset process-wide client singletons between tests.
+
+    Tests patch client factories per case, so cached instances must not leak
+    from one test into the next.
+    """
+    reset_supabase_client()
+    _job_service_for.cache_clear()
+    get_admin_service.cache_clear()
+    get_storage_service.cache_clear()
+    get_analytics_queue.cache_clear()
+    get_usage_batcher.cache_clear()
+    _usage_tracker_for.cache_clear()
+    clear_token_cache()
+    job_ownership_cache.clear()
+    clear_quota_cache()
+    yield
+    reset_supabase_client()
+    _job_service_for.cache_clear()
+    get_admin_service.cache_clear()
+    get_storage_service.cache_clear()
+    get_analytics_queue.cache_clear()
+    get_usage_batcher.cache_clear()
+    _usage_tracker_for.cache_clear()
+    clear_token_cache()
+    job_ownership_cache.clear()
+    clear_quota_cache()
 
 
 @pytest.fixture
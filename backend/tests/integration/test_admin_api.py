@@ -8,18 +8,32 @@ Uses FastAPI dependency_overrides pattern for proper dependency injection testin
 """
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
 
 from app.main import app
 from app.schemas.auth import AuthenticatedUser, SubscriptionTier
 from app.core.auth import get_current_user
 from app.core.supabase import get_supabase_client
+from app.schemas.admin import SystemStats
+from app.dependencies.admin import get_admin_service
+from app.services.admin_service import AdminService
 
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def no_superuser_cache():
+    """Force superuser and stats cache misses so every test exercises Supabase."""
+    redis_mock = MagicMock()
+    redis_mock.get = AsyncMock(return_value=None)
+    redis_mock.setex = AsyncMock()
+    with patch("app.dependencies.admin.get_async_redis_client", return_value=redis_mock), \
+            patch("app.api.v1.admin.get_async_redis_client", return_value=redis_mock):
+        yield redis_mock
+
+
 # Mock admin user
 ADMIN_USER = AuthenticatedUser(
     user_id="admin-user-id",
@@ -171,6 +185,7 @@ class TestAdminStatsEndpoint:
         mock_supabase.table = stats_supabase.table
 
         app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
 
         # Make request
         response = client.get(
@@ -186,6 +201,57 @@ class TestAdminStatsEndpoint:
         assert data['active_jobs'] == 5
         assert data['monthly_conversions'] == 89
 
+    def test_get_stats_via_rpc(self, no_superuser_cache):
+        """Test that stats come from a single admin_stats RPC when available"""
+        app.dependency_overrides[get_current_user] = lambda: ADMIN_USER
+
+        mock_supabase = create_mock_supabase_for_superuser_check(True)
+        mock_rpc_result = MagicMock()
+        mock_rpc_result.data = {
+            'total_users': 150,
+            'total_conversions': 1234,
+            'active_jobs': 5,
+            'monthly_conversions': 89
+        }
+        mock_supabase.rpc.return_value.execute.return_value = mock_rpc_result
+
+        app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
+
+        response = client.get(
+            "/api/v1/admin/stats",
+            headers={"Authorization": "Bearer mock-token"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == mock_rpc_result.data
+        mock_supabase.rpc.assert_called_once_with('admin_stats')
+        mock_supabase.table.assert_not_called()
+        no_superuser_cache.setex.assert_any_await(
+            "admin:stats", 30, SystemStats(**mock_rpc_result.data).model_dump_json()
+        )
+
+    def test_get_stats_served_from_cache(self, no_superuser_cache):
+        """Test that cached stats are returned without querying Supabase"""
+        app.dependency_overrides[get_current_user] = lambda: ADMIN_USER
+
+        mock_supabase = create_mock_supabase_for_superuser_check(True)
+        app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
+
+        cached = '{"total_users":150,"total_conversions":1234,"active_jobs":5,"monthly_conversions":89}'
+        no_superuser_cache.get = AsyncMock(side_effect=lambda key: cached if key == "admin:stats" else None)
+
+        response = client.get(
+            "/api/v1/admin/stats",
+            headers={"Authorization": "Bearer mock-token"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()['total_conversions'] == 1234
+        mock_supabase.rpc.assert_not_called()
+        mock_supabase.table.assert_not_called()
+
     def test_get_stats_as_non_admin(self):
         """Test that non-admin is denied access to stats"""
         # Override dependencies
@@ -228,6 +294,7 @@ class TestAdminUsersEndpoint:
         mock_supabase.table = users_supabase.table
 
         app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
 
         # Make request
         response = client.get(
@@ -297,6 +364,7 @@ class TestUpdateUserTierEndpoint:
         mock_supabase.auth.admin.update_user_by_id.return_value = mock_update_response
 
         app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
 
         # Make request
         response = client.patch(
@@ -316,7 +384,9 @@ class TestUpdateUserTierEndpoint:
         """Test that invalid tier is rejected"""
         # Override dependencies
         app.dependency_overrides[get_current_user] = lambda: ADMIN_USER
-        app.dependency_overrides[get_supabase_client] = lambda: create_mock_supabase_for_superuser_check(True)
+        mock_supabase = create_mock_supabase_for_superuser_check(True)
+        app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
 
         # Make request with invalid tier
         response = client.patch(
@@ -346,3 +416,73 @@ class TestUpdateUserTierEndpoint:
         # Assertions
         assert response.status_code == 403
         assert "Admin access required" in response.json()['detail']
+
+
+class TestGetUsersRpcEndpoint:
+    """Tests for GET /admin/users backed by the admin_list_users RPC"""
+
+    def setup_method(self):
+        """Clear dependency overrides before each test"""
+        app.dependency_overrides.clear()
+
+    def teardown_method(self):
+        """Clear dependency overrides after each test"""
+        app.dependency_overrides.clear()
+
+    def test_get_users_via_rpc(self):
+        """Test that a single RPC call returns the page and total count"""
+        app.dependency_overrides[get_current_user] = lambda: ADMIN_USER
+
+        mock_supabase = create_mock_supabase_for_superuser_check(True)
+        mock_rpc_result = MagicMock()
+        mock_rpc_result.data = [
+            {
+                'id': 'user-2',
+                'email': 'user2@test.com',
+                'tier': 'PRO',
+                'total_conversions': 15,
+                'last_login': '2025-12-24T09:00:00Z',
+                'created_at': '2025-02-01T00:00:00Z',
+                'total_count': 42
+            }
+        ]
+        mock_supabase.rpc.return_value.execute.return_value = mock_rpc_result
+
+        app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
+
+        response = client.get(
+            "/api/v1/admin/users?page=3&page_size=1&tier_filter=PRO",
+            headers={"Authorization": "Bearer mock-token"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['total'] == 42
+        assert data['total_pages'] == 42
+        assert len(data['users']) == 1
+        assert data['users'][0]['total_conversions'] == 15
+
+        rpc_name, rpc_params = mock_supabase.rpc.call_args[0]
+        assert rpc_name == 'admin_list_users'
+        assert rpc_params['p_tier'] == 'PRO'
+        assert rpc_params['p_limit'] == 1
+        assert rpc_params['p_offset'] == 2
+        mock_supabase.auth.admin.list_users.assert_not_called()
+
+    def test_get_users_rejects_unknown_sort_field(self):
+        """Test that invalid query values are rejected before the service runs"""
+        app.dependency_overrides[get_current_user] = lambda: ADMIN_USER
+
+        mock_supabase = create_mock_supabase_for_superuser_check(True)
+        app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_admin_service] = lambda: AdminService(mock_supabase)
+
+        response = client.get(
+            "/api/v1/admin/users?sort_by=password&tier_filter=GOLD",
+            headers={"Authorization": "Bearer mock-token"}
+        )
+
+        assert response.status_code == 422
+        mock_supabase.rpc.assert_not_called()
+        mock_supabase.auth.admin.list_users.assert_not_called()
@@ -101,21 +101,17 @@ class TestUploadLimitEnforcement:
         """FREE user with 2/5 conversions and small file should succeed."""
         
         with patch("app.core.auth.get_current_user") as mock_get_user, \
-             patch("app.middleware.limits.UsageTracker") as MockTracker, \
+             patch("app.middleware.limits.get_usage_tracker") as MockTracker, \
              patch("app.api.v1.upload.get_storage_service") as mock_storage, \
-             patch("app.api.v1.upload.get_supabase_client") as mock_supabase:
+             patch("app.api.v1.upload.get_supabase_client") as mock_supabase, \
+             patch("app.api.v1.upload.get_usage_batcher"):
             
             # Mock authentication (patch at core module level)
             mock_get_user.return_value = mock_free_user
             
             # Mock usage tracker (under limit)
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 2,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
-            tracker_instance.increment_usage.return_value = 3
+            tracker_instance.get_conversion_count.return_value = 2
             
             # Mock storage and database
             mock_storage_instance = Mock()
@@ -151,18 +147,14 @@ class TestUploadLimitEnforcement:
         """FREE user with 5/5 conversions should get 403 with CONVERSION_LIMIT_EXCEEDED."""
         
         with patch("app.core.auth.get_current_user") as mock_get_user, \
-             patch("app.middleware.limits.UsageTracker") as MockTracker:
+             patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             
             # Mock authentication
             mock_get_user.return_value = mock_free_user
             
             # Mock usage tracker (at limit)
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 5,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 5
             MockTracker.return_value = tracker_instance
             
             # Make request
@@ -227,7 +219,7 @@ class TestUploadLimitEnforcement:
         with patch("app.core.auth.get_current_user") as mock_get_user, \
              patch("app.api.v1.upload.get_storage_service") as mock_storage, \
              patch("app.api.v1.upload.get_supabase_client") as mock_supabase, \
-             patch("app.api.v1.upload.UsageTracker") as MockTracker:
+             patch("app.api.v1.upload.get_usage_batcher") as mock_get_usage_batcher:
             
             # Mock authentication
             mock_get_user.return_value = mock_pro_user
@@ -241,9 +233,8 @@ class TestUploadLimitEnforcement:
             mock_supabase_instance.table.return_value.insert.return_value.execute.return_value = None
             mock_supabase.return_value = mock_supabase_instance
             
-            # Mock usage tracker
-            tracker_instance = MockTracker.return_value
-            tracker_instance.increment_usage.return_value = 100  # Already has 100 conversions
+            # Mock usage batcher
+            mock_get_usage_batcher.return_value.enqueue.return_value = 1
             
             # Make request
             response = client.post(
@@ -267,7 +258,7 @@ class TestUploadLimitEnforcement:
         with patch("app.core.auth.get_current_user") as mock_get_user, \
              patch("app.api.v1.upload.get_storage_service") as mock_storage, \
              patch("app.api.v1.upload.get_supabase_client") as mock_supabase, \
-             patch("app.api.v1.upload.UsageTracker") as MockTracker:
+             patch("app.api.v1.upload.get_usage_batcher") as mock_get_usage_batcher:
             
             # Mock authentication
             mock_get_user.return_value = mock_pro_user
@@ -281,9 +272,8 @@ class TestUploadLimitEnforcement:
             mock_supabase_instance.table.return_value.insert.return_value.execute.return_value = None
             mock_supabase.return_value = mock_supabase_instance
             
-            # Mock usage tracker
-            tracker_instance = MockTracker.return_value
-            tracker_instance.increment_usage.return_value = 1
+            # Mock usage batcher
+            mock_get_usage_batcher.return_value.enqueue.return_value = 1
             
             # Make request
             response = client.post(
@@ -311,7 +301,7 @@ class TestUploadLimitEnforcement:
         with patch("app.core.auth.get_current_user") as mock_get_user, \
              patch("app.api.v1.upload.get_storage_service") as mock_storage, \
              patch("app.api.v1.upload.get_supabase_client") as mock_supabase, \
-             patch("app.api.v1.upload.UsageTracker") as MockTracker:
+             patch("app.api.v1.upload.get_usage_batcher") as mock_get_usage_batcher:
             
             # Mock authentication
             mock_get_user.return_value = mock_premium_user
@@ -325,9 +315,8 @@ class TestUploadLimitEnforcement:
             mock_supabase_instance.table.return_value.insert.return_value.execute.return_value = None
             mock_supabase.return_value = mock_supabase_instance
             
-            # Mock usage tracker
-            tracker_instance = MockTracker.return_value
-            tracker_instance.increment_usage.return_value = 500  # Many conversions
+            # Mock usage batcher
+            mock_get_usage_batcher.return_value.enqueue.return_value = 1
             
             # Make request
             response = client.post(
@@ -353,18 +342,14 @@ class TestUploadLimitEnforcement:
         """403 error response should match LimitExceededError schema."""
         
         with patch("app.core.auth.get_current_user") as mock_get_user, \
-             patch("app.middleware.limits.UsageTracker") as MockTracker:
+             patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             
             # Mock authentication
             mock_get_user.return_value = mock_free_user
             
             # Mock usage tracker (at limit)
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 5,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 5
             MockTracker.return_value = tracker_instance
             
             # Make request
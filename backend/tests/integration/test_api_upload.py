@@ -13,12 +13,14 @@ from io import BytesIO
 class TestUploadAPI:
     """Integration test suite for PDF upload endpoint"""
 
+    @patch('app.api.v1.upload.get_usage_batcher')
     @patch('app.api.v1.upload.get_supabase_client')
     @patch('app.api.v1.upload.SupabaseStorageService')
     async def test_upload_pdf_success(
         self,
         mock_storage_service_class,
         mock_supabase_client,
+        mock_get_usage_batcher,
         client,
         valid_jwt_token,
         valid_pdf_bytes
@@ -26,7 +28,7 @@ class TestUploadAPI:
         """Test successful PDF upload by authenticated FREE tier user"""
         # Mock storage service
         mock_storage = Mock()
-        mock_storage.upload_file.return_value = "https://storage.supabase.co/signed-url"
+        mock_storage.upload_stream.return_value = None
         mock_storage_service_class.return_value = mock_storage
 
         # Mock Supabase client
@@ -51,16 +53,21 @@ class TestUploadAPI:
         assert "created_at" in data
 
         # Verify storage upload was called
-        mock_storage.upload_file.assert_called_once()
-        call_args = mock_storage.upload_file.call_args
+        mock_storage.upload_stream.assert_called_once()
+        call_args = mock_storage.upload_stream.call_args
         assert call_args[1]["bucket"] == "uploads"
         assert "test-user-id-123" in call_args[1]["path"]
         assert call_args[1]["content_type"] == "application/pdf"
+        assert call_args[1]["size"] == len(valid_pdf_bytes)
 
         # Verify database insert was called
         mock_supabase.table.assert_called_with("conversion_jobs")
         mock_table.insert.assert_called_once()
 
+        # Usage increment is handed to the batcher, not written inline
+        mock_get_usage_batcher.return_value.enqueue.assert_called_once_with("test-user-id-123")
+        mock_supabase.rpc.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_upload_without_auth_token(self, client, valid_pdf_bytes):
         """Test upload without Authorization header returns 401"""
@@ -137,6 +144,7 @@ class TestUploadAPI:
         else:
             assert "60" in data["detail"]
 
+    @patch('app.api.v1.upload.get_usage_batcher')
     @patch('app.api.v1.upload.get_supabase_client')
     @patch('app.api.v1.upload.SupabaseStorageService')
     @pytest.mark.asyncio
@@ -144,6 +152,7 @@ class TestUploadAPI:
         self,
         mock_storage_service_class,
         mock_supabase_client,
+        mock_get_usage_batcher,
         client,
         pro_tier_jwt_token,
         large_pdf_bytes
@@ -151,7 +160,7 @@ class TestUploadAPI:
         """Test upload of 60MB file for PRO tier succeeds"""
         # Mock storage service
         mock_storage = Mock()
-        mock_storage.upload_file.return_value = "https://storage.supabase.co/signed-url"
+        mock_storage.upload_stream.return_value = None
         mock_storage_service_class.return_value = mock_storage
 
         # Mock Supabase client
@@ -197,7 +206,7 @@ class TestUploadAPI:
 
         # Mock storage service to raise error
         mock_storage = Mock()
-        mock_storage.upload_file.side_effect = StorageUploadError("Network timeout")
+        mock_storage.upload_stream.side_effect = StorageUploadError("Network timeout")
         mock_storage_service_class.return_value = mock_storage
 
         files = {"file": ("test.pdf", BytesIO(valid_pdf_bytes), "application/pdf")}
@@ -227,7 +236,7 @@ class TestUploadAPI:
         """Test database insert failure returns 500 DATABASE_ERROR"""
         # Mock storage service (succeeds)
         mock_storage = Mock()
-        mock_storage.upload_file.return_value = "https://storage.supabase.co/signed-url"
+        mock_storage.upload_stream.return_value = None
         mock_storage.delete_file.return_value = True
         mock_storage_service_class.return_value = mock_storage
 
@@ -254,6 +263,7 @@ class TestUploadAPI:
         # Verify cleanup was attempted
         mock_storage.delete_file.assert_called_once()
 
+    @patch('app.api.v1.upload.get_usage_batcher')
     @patch('app.api.v1.upload.get_supabase_client')
     @patch('app.api.v1.upload.SupabaseStorageService')
     @pytest.mark.asyncio
@@ -261,6 +271,7 @@ class TestUploadAPI:
         self,
         mock_storage_service_class,
         mock_supabase_client,
+        mock_get_usage_batcher,
         client,
         valid_jwt_token,
         valid_pdf_bytes
@@ -268,7 +279,7 @@ class TestUploadAPI:
         """Test response contains all required fields in correct format"""
         # Mock storage service
         mock_storage = Mock()
-        mock_storage.upload_file.return_value = "https://storage.supabase.co/signed-url"
+        mock_storage.upload_stream.return_value = None
         mock_storage_service_class.return_value = mock_storage
 
         # Mock Supabase client
@@ -14,7 +14,7 @@ class TestGetUsageEndpoint:
     async def test_get_usage_returns_authenticated_user_data(self, client, valid_jwt_token):
         """Test GET /usage returns 200 OK with authenticated JWT token."""
         # Mock UsageTracker.get_usage
-        with patch('app.api.v1.usage.UsageTracker') as MockTracker:
+        with patch('app.api.v1.usage.get_usage_tracker') as MockTracker:
             mock_tracker_instance = Mock()
             mock_tracker_instance.get_usage.return_value = {
                 'month': '2025-12-01',
@@ -65,7 +65,7 @@ class TestGetUsageEndpoint:
     async def test_get_usage_handles_new_user_with_no_data(self, client, valid_jwt_token):
         """Test GET /usage handles new user with no usage data (returns count=0)."""
         # Mock UsageTracker.get_usage for new user
-        with patch('app.api.v1.usage.UsageTracker') as MockTracker:
+        with patch('app.api.v1.usage.get_usage_tracker') as MockTracker:
             mock_tracker_instance = Mock()
             mock_tracker_instance.get_usage.return_value = {
                 'month': '2025-12-01',
@@ -90,7 +90,7 @@ class TestGetUsageEndpoint:
     async def test_get_usage_returns_unlimited_for_pro_tier(self, client, pro_tier_jwt_token):
         """Test GET /usage returns null limit/remaining for PRO tier."""
         # Mock UsageTracker.get_usage for PRO tier user
-        with patch('app.api.v1.usage.UsageTracker') as MockTracker:
+        with patch('app.api.v1.usage.get_usage_tracker') as MockTracker:
             mock_tracker_instance = Mock()
             mock_tracker_instance.get_usage.return_value = {
                 'month': '2025-12-01',
@@ -116,7 +116,7 @@ class TestGetUsageEndpoint:
     async def test_get_usage_returns_500_on_service_failure(self, client, valid_jwt_token):
         """Test GET /usage returns 500 Internal Server Error when service fails."""
         # Mock UsageTracker to raise exception
-        with patch('app.api.v1.usage.UsageTracker') as MockTracker:
+        with patch('app.api.v1.usage.get_usage_tracker') as MockTracker:
             mock_tracker_instance = Mock()
             mock_tracker_instance.get_usage.side_effect = Exception("Database connection failed")
             MockTracker.return_value = mock_tracker_instance
@@ -1,7 +1,7 @@
 """
-Integration Tests for Health Check Endpoint
+Integration Tests for Health Check Endpoints
 
-Tests the /api/health endpoint to verify:
+Tests the /api/readyz endpoint to verify:
 - API responds with proper status codes
 - Supabase connection is verified
 - Redis connection is verified
@@ -14,11 +14,11 @@ import pytest
 @pytest.mark.asyncio
 async def test_health_endpoint_success(client):
     """
-    Test health endpoint returns 200 when all services available.
+    Test readiness endpoint returns 200 when all services available.
 
     AC#6: Health check endpoint returns 200 OK with Supabase and Redis status
     """
-    response = await client.get("/api/health")
+    response = await client.get("/api/readyz")
 
     assert response.status_code == 200
     data = response.json()
@@ -38,11 +38,11 @@ async def test_health_endpoint_success(client):
 @pytest.mark.asyncio
 async def test_health_endpoint_response_format(client):
     """
-    Test health endpoint returns properly formatted JSON response.
+    Test readiness endpoint returns properly formatted JSON response.
 
     Verifies ISO8601 timestamp format and correct field types.
     """
-    response = await client.get("/api/health")
+    response = await client.get("/api/readyz")
 
     data = response.json()
 
@@ -55,3 +55,14 @@ async def test_health_endpoint_response_format(client):
     # Verify timestamp format (ISO8601 with Z suffix)
     assert data["timestamp"].endswith("Z")
     assert "T" in data["timestamp"]
+
+
+@pytest.mark.asyncio
+async def test_liveness_endpoint(client):
+    """
+    Test liveness endpoint returns a static 200 without dependency checks.
+    """
+    response = await client.get("/api/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
@@ -262,9 +262,9 @@ class TestRLSJobDeletion:
             headers={"Authorization": f"Bearer {alice_data['access_token']}"}
         )
 
-        assert response.status_code == 204
+        assert response.status_code == 202
 
-        # Verify job is soft-deleted (deleted_at is set)
+        # Verify job is soft-deleted (deleted_at is set before the 202 is returned)
         result = test_supabase_client.table("conversion_jobs").select("deleted_at").eq("id", job_id).execute()
         assert len(result.data) > 0
         assert result.data[0]["deleted_at"] is not None
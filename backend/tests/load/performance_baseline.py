@@ -209,7 +209,7 @@ class PerformanceBaseline:
         print("\n📊 Testing database connectivity...")
 
         try:
-            response = requests.get(f"{self.base_url}/api/health", timeout=5)
+            response = requests.get(f"{self.base_url}/api/readyz", timeout=5)
 
             if response.status_code == 200:
                 health_data = response.json()
@@ -0,0 +1,57 @@
+"""
+Unit tests for the health check endpoints (GET /api/health, GET /api/readyz).
+
+Tests the static liveness response, concurrent readiness probe handling
+and the per-probe timeout.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+
+@pytest.mark.asyncio
+async def test_health_reports_redis_timeout(client):
+    """A hung Redis probe is reported as a timeout instead of blocking the endpoint."""
+    async def slow_ping():
+        await asyncio.sleep(5)
+
+    redis_mock = Mock()
+    redis_mock.ping = slow_ping
+
+    with patch("app.api.health.get_supabase_client", return_value=Mock()), \
+         patch("app.api.health.get_async_redis_client", return_value=redis_mock), \
+         patch("app.api.health.PROBE_TIMEOUT_SECONDS", 0.05):
+        response = await client.get("/api/readyz")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "unhealthy"
+    assert data["database"] == "connected"
+    assert data["redis"] == "disconnected: timeout"
+
+
+@pytest.mark.asyncio
+async def test_health_reports_redis_error(client):
+    """A failing Redis ping marks the service unhealthy with the error message."""
+    redis_mock = Mock()
+    redis_mock.ping = AsyncMock(side_effect=ConnectionError("refused"))
+
+    with patch("app.api.health.get_supabase_client", return_value=Mock()), \
+         patch("app.api.health.get_async_redis_client", return_value=redis_mock):
+        response = await client.get("/api/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["redis"] == "disconnected: refused"
+
+
+@pytest.mark.asyncio
+async def test_liveness_skips_dependency_probes(client):
+    """Liveness answers without touching Supabase or Redis."""
+    with patch("app.api.health.get_supabase_client") as mock_supabase, \
+         patch("app.api.health.get_async_redis_client") as mock_redis:
+        response = await client.get("/api/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    mock_supabase.assert_not_called()
+    mock_redis.assert_not_called()
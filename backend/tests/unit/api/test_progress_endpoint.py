@@ -4,17 +4,32 @@ Unit tests for progress endpoint (GET /jobs/{job_id}/progress).
 Tests the real-time progress updates endpoint for polling-based conversion status.
 """
 import pytest
-from unittest.mock import Mock, patch
+import orjson
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 from datetime import datetime
 from app.schemas.job import JobDetail
 from app.schemas.progress import ProgressUpdate, ElementsDetected
 from app.schemas.quality_report import QualityReport
 
 
+@pytest.fixture(autouse=True)
+def progress_cache():
+    """Force progress cache misses so every test exercises the database path."""
+    redis_mock = MagicMock()
+    redis_mock.get = AsyncMock(return_value=None)
+    redis_mock.setex = AsyncMock()
+    redis_mock.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+    redis_mock.pipeline.return_value.execute = AsyncMock()
+    redis_mock.eval = AsyncMock(return_value=1)  # progress rate limit window count
+    with patch("app.api.v1.jobs.get_async_redis_client", return_value=redis_mock), \
+         patch("app.middleware.rate_limit.get_async_redis_client", return_value=redis_mock):
+        yield redis_mock
+
+
 @pytest.mark.asyncio
 async def test_get_job_progress_success(client, valid_jwt_token):
     """Test successful progress retrieval for PROCESSING job."""
-    job_id = "test-job-123"
+    job_id = "00000000-0000-4000-8000-000000000001"
 
     # Mock job data with progress metadata
     mock_job = Mock(spec=JobDetail)
@@ -41,7 +56,7 @@ async def test_get_job_progress_success(client, valid_jwt_token):
 
     with patch('app.api.v1.jobs.JobService') as MockJobService:
         mock_service = MockJobService.return_value
-        mock_service.get_job.return_value = mock_job
+        mock_service.get_progress_row.return_value = mock_job
 
         response = await client.get(
             f"/api/v1/jobs/{job_id}/progress",
@@ -74,7 +89,7 @@ async def test_get_job_progress_success(client, valid_jwt_token):
 @pytest.mark.asyncio
 async def test_get_job_progress_queued(client, valid_jwt_token):
     """Test progress for QUEUED job (minimal metadata)."""
-    job_id = "queued-job-456"
+    job_id = "00000000-0000-4000-8000-000000000002"
 
     mock_job = Mock(spec=JobDetail)
     mock_job.id = job_id
@@ -85,7 +100,7 @@ async def test_get_job_progress_queued(client, valid_jwt_token):
 
     with patch('app.api.v1.jobs.JobService') as MockJobService:
         mock_service = MockJobService.return_value
-        mock_service.get_job.return_value = mock_job
+        mock_service.get_progress_row.return_value = mock_job
 
         response = await client.get(
             f"/api/v1/jobs/{job_id}/progress",
@@ -107,7 +122,7 @@ async def test_get_job_progress_queued(client, valid_jwt_token):
 @pytest.mark.asyncio
 async def test_get_job_progress_completed(client, valid_jwt_token):
     """Test progress for COMPLETED job with quality report."""
-    job_id = "completed-job-789"
+    job_id = "00000000-0000-4000-8000-000000000003"
 
     mock_job = Mock(spec=JobDetail)
     mock_job.id = job_id
@@ -131,7 +146,7 @@ async def test_get_job_progress_completed(client, valid_jwt_token):
 
     with patch('app.api.v1.jobs.JobService') as MockJobService:
         mock_service = MockJobService.return_value
-        mock_service.get_job.return_value = mock_job
+        mock_service.get_progress_row.return_value = mock_job
 
         response = await client.get(
             f"/api/v1/jobs/{job_id}/progress",
@@ -157,11 +172,11 @@ async def test_get_job_progress_completed(client, valid_jwt_token):
 @pytest.mark.asyncio
 async def test_get_job_progress_not_found(client, valid_jwt_token):
     """Test 404 when job doesn't exist or user doesn't own it."""
-    job_id = "nonexistent-job"
+    job_id = "00000000-0000-4000-8000-000000000004"
 
     with patch('app.api.v1.jobs.JobService') as MockJobService:
         mock_service = MockJobService.return_value
-        mock_service.get_job.return_value = None  # Job not found
+        mock_service.get_progress_row.return_value = None  # Job not found
 
         response = await client.get(
             f"/api/v1/jobs/{job_id}/progress",
@@ -176,7 +191,7 @@ async def test_get_job_progress_not_found(client, valid_jwt_token):
 @pytest.mark.asyncio
 async def test_get_job_progress_unauthorized(client):
     """Test 401 when JWT token is missing."""
-    job_id = "test-job-123"
+    job_id = "00000000-0000-4000-8000-000000000001"
 
     response = await client.get(f"/api/v1/jobs/{job_id}/progress")
 
@@ -186,7 +201,7 @@ async def test_get_job_progress_unauthorized(client):
 @pytest.mark.asyncio
 async def test_get_job_progress_failed_job(client, valid_jwt_token):
     """Test progress for FAILED job shows error state."""
-    job_id = "failed-job-999"
+    job_id = "00000000-0000-4000-8000-000000000005"
 
     mock_job = Mock(spec=JobDetail)
     mock_job.id = job_id
@@ -201,7 +216,7 @@ async def test_get_job_progress_failed_job(client, valid_jwt_token):
 
     with patch('app.api.v1.jobs.JobService') as MockJobService:
         mock_service = MockJobService.return_value
-        mock_service.get_job.return_value = mock_job
+        mock_service.get_progress_row.return_value = mock_job
 
         response = await client.get(
             f"/api/v1/jobs/{job_id}/progress",
@@ -219,7 +234,7 @@ async def test_get_job_progress_failed_job(client, valid_jwt_token):
 @pytest.mark.asyncio
 async def test_get_job_progress_cost_priority(client, valid_jwt_token):
     """Test that stage_metadata cost takes priority over quality_report cost."""
-    job_id = "cost-priority-job"
+    job_id = "00000000-0000-4000-8000-000000000006"
 
     mock_job = Mock(spec=JobDetail)
     mock_job.id = job_id
@@ -237,7 +252,7 @@ async def test_get_job_progress_cost_priority(client, valid_jwt_token):
 
     with patch('app.api.v1.jobs.JobService') as MockJobService:
         mock_service = MockJobService.return_value
-        mock_service.get_job.return_value = mock_job
+        mock_service.get_progress_row.return_value = mock_job
 
         response = await client.get(
             f"/api/v1/jobs/{job_id}/progress",
@@ -254,7 +269,7 @@ async def test_get_job_progress_cost_priority(client, valid_jwt_token):
 @pytest.mark.asyncio
 async def test_get_job_progress_minimal_data(client, valid_jwt_token):
     """Test progress endpoint with absolute minimal job data."""
-    job_id = "minimal-job"
+    job_id = "00000000-0000-4000-8000-000000000007"
 
     mock_job = Mock(spec=JobDetail)
     mock_job.id = job_id
@@ -265,7 +280,7 @@ async def test_get_job_progress_minimal_data(client, valid_jwt_token):
 
     with patch('app.api.v1.jobs.JobService') as MockJobService:
         mock_service = MockJobService.return_value
-        mock_service.get_job.return_value = mock_job
+        mock_service.get_progress_row.return_value = mock_job
 
         response = await client.get(
             f"/api/v1/jobs/{job_id}/progress",
@@ -283,3 +298,331 @@ async def test_get_job_progress_minimal_data(client, valid_jwt_token):
     assert data["elements_detected"]["tables"] == 0
     assert data["estimated_cost"] is None
     assert data["quality_confidence"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_served_from_cache(client, valid_jwt_token, progress_cache):
+    """Test that a cached payload owned by the caller skips the database."""
+    job_id = "00000000-0000-4000-8000-000000000008"
+    cached = ProgressUpdate(
+        job_id=job_id,
+        status="PROCESSING",
+        progress_percentage=40,
+        current_stage="extracting",
+        stage_description="Extracting content...",
+        timestamp=datetime.utcnow()
+    )
+    progress_cache.get = AsyncMock(return_value=orjson.dumps({
+        "user_id": "test-user-id-123",
+        "progress": cached.model_dump(mode="json")
+    }))
+
+    with patch('app.api.v1.jobs.JobService') as MockJobService:
+        mock_service = MockJobService.return_value
+
+        response = await client.get(
+            f"/api/v1/jobs/{job_id}/progress",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["progress_percentage"] == 40
+    progress_cache.get.assert_awaited_once_with(f"progress:{job_id}")
+    mock_service.get_progress_row.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_ignores_foreign_cache_entry(client, valid_jwt_token, progress_cache):
+    """Test that a cached payload for another user falls through to the ownership check."""
+    job_id = "00000000-0000-4000-8000-000000000009"
+    progress_cache.get = AsyncMock(return_value=orjson.dumps({
+        "user_id": "someone-else",
+        "progress": {"job_id": job_id}
+    }))
+
+    with patch('app.api.v1.jobs.JobService') as MockJobService:
+        mock_service = MockJobService.return_value
+        mock_service.get_progress_row.return_value = None
+
+        response = await client.get(
+            f"/api/v1/jobs/{job_id}/progress",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 404
+    mock_service.get_progress_row.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_caches_result(client, valid_jwt_token, progress_cache):
+    """Test that a database read is cached briefly with its owner."""
+    job_id = "00000000-0000-4000-8000-000000000010"
+
+    mock_job = Mock(spec=JobDetail)
+    mock_job.id = job_id
+    mock_job.status = "QUEUED"
+    mock_job.progress = 0
+    mock_job.stage_metadata = None
+    mock_job.quality_report = None
+
+    with patch('app.api.v1.jobs.JobService') as MockJobService:
+        mock_service = MockJobService.return_value
+        mock_service.get_progress_row.return_value = mock_job
+
+        response = await client.get(
+            f"/api/v1/jobs/{job_id}/progress",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 200
+    key, ttl, payload = progress_cache.setex.await_args.args
+    assert key == f"progress:{job_id}"
+    assert ttl == 2
+    entry = orjson.loads(payload)
+    assert entry["user_id"] == "test-user-id-123"
+    assert entry["progress"]["job_id"] == job_id
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_progress_mixes_cache_hits_and_db(client, valid_jwt_token, progress_cache):
+    """Test batch progress: hits come from one MGET, misses from one DB query."""
+    cached = ProgressUpdate(
+        job_id="aaaaaaaa-0000-4000-8000-000000000001",
+        status="PROCESSING",
+        progress_percentage=40,
+        current_stage="extracting",
+        stage_description="Extracting content...",
+        timestamp=datetime.utcnow()
+    )
+    cached_entry = orjson.dumps({"user_id": "test-user-id-123", "progress": cached.model_dump(mode="json")})
+    progress_cache.mget = AsyncMock(return_value=[cached_entry, None, None])
+
+    mock_job = Mock(spec=JobDetail)
+    mock_job.id = "bbbbbbbb-0000-4000-8000-000000000002"
+    mock_job.status = "QUEUED"
+    mock_job.progress = 0
+    mock_job.stage_metadata = None
+    mock_job.quality_report = None
+
+    with patch('app.api.v1.jobs.JobService') as MockJobService:
+        mock_service = MockJobService.return_value
+        mock_service.get_progress_rows.return_value = [mock_job]  # cccccccc-0000-4000-8000-000000000003 not owned
+
+        response = await client.get(
+            "/api/v1/jobs/progress?ids=aaaaaaaa-0000-4000-8000-000000000001,bbbbbbbb-0000-4000-8000-000000000002,cccccccc-0000-4000-8000-000000000003,aaaaaaaa-0000-4000-8000-000000000001",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"aaaaaaaa-0000-4000-8000-000000000001", "bbbbbbbb-0000-4000-8000-000000000002"}
+    assert data["aaaaaaaa-0000-4000-8000-000000000001"]["progress_percentage"] == 40
+    assert data["bbbbbbbb-0000-4000-8000-000000000002"]["status"] == "QUEUED"
+
+    progress_cache.mget.assert_awaited_once_with(["progress:aaaaaaaa-0000-4000-8000-000000000001", "progress:bbbbbbbb-0000-4000-8000-000000000002", "progress:cccccccc-0000-4000-8000-000000000003"])
+    mock_service.get_progress_rows.assert_called_once_with(["bbbbbbbb-0000-4000-8000-000000000002", "cccccccc-0000-4000-8000-000000000003"], "test-user-id-123")
+    pipe = progress_cache.pipeline.return_value
+    pipe.setex.assert_called_once()
+    assert pipe.setex.call_args.args[0] == "progress:bbbbbbbb-0000-4000-8000-000000000002"
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_progress_rejects_oversized_batch(client, valid_jwt_token):
+    """Test that more than 50 job IDs are rejected."""
+    ids = ",".join(f"00000000-0000-4000-8000-{i:012d}" for i in range(51))
+
+    response = await client.get(
+        f"/api/v1/jobs/progress?ids={ids}",
+        headers={"Authorization": f"Bearer {valid_jwt_token}"}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["code"] == "INVALID_JOB_IDS"
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_job_service_override(client, valid_jwt_token):
+    """Test that overriding get_job_service also applies to the polling endpoints."""
+    from app.api.v1.jobs import get_job_service
+    from app.main import app
+
+    mock_service = MagicMock()
+    mock_service.get_progress_row.return_value = None
+    app.dependency_overrides[get_job_service] = lambda: mock_service
+
+    try:
+        response = await client.get(
+            "/api/v1/jobs/dddddddd-0000-4000-8000-000000000004/progress",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+    finally:
+        app.dependency_overrides.pop(get_job_service, None)
+
+    assert response.status_code == 404
+    mock_service.get_progress_row.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_rejects_malformed_id(client, valid_jwt_token):
+    """Test that a non-UUID job ID is rejected before any service call."""
+    with patch('app.api.v1.jobs.JobService') as MockJobService:
+        response = await client.get(
+            "/api/v1/jobs/not-a-uuid/progress",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 422
+    MockJobService.return_value.get_progress_row.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_progress_rejects_malformed_id(client, valid_jwt_token):
+    """Test that one non-UUID entry rejects the whole batch."""
+    response = await client.get(
+        "/api/v1/jobs/progress?ids=aaaaaaaa-0000-4000-8000-000000000001,not-a-uuid",
+        headers={"Authorization": f"Bearer {valid_jwt_token}"}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["code"] == "INVALID_JOB_IDS"
+
+
+def test_build_progress_update_matches_validated_model():
+    """Test that the unvalidated hot-path payload is identical to a validated one."""
+    from app.api.v1.jobs import _build_progress_update
+    from app.services.job_service import ProgressRow
+
+    row = ProgressRow(
+        id="00000000-0000-4000-8000-000000000042",
+        status="PROCESSING",
+        progress=35,
+        stage_metadata={
+            "current_stage": "layout_analysis",
+            "elements_detected": {"tables": 3, "images": 1.0, "equations": 0, "chapters": 2},
+            "estimated_time_remaining": 12.0,
+            "timestamp": "2025-12-14T10:30:00"
+        },
+        quality_report={"overall_confidence": 91.5, "estimated_cost": 0.08}
+    )
+
+    progress_update = _build_progress_update(row)
+    dumped = progress_update.model_dump()
+
+    assert ProgressUpdate.model_validate(dumped).model_dump() == dumped
+    assert isinstance(progress_update.timestamp, datetime)
+    assert progress_update.elements_detected.images == 1
+    assert progress_update.estimated_time_remaining == 12
+    assert progress_update.quality_confidence == 91
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_etag_not_modified(client, valid_jwt_token, progress_cache):
+    """Test that a repeat poll with the returned ETag gets an empty 304."""
+    job_id = "00000000-0000-4000-8000-000000000043"
+    cached = ProgressUpdate(
+        job_id=job_id,
+        status="PROCESSING",
+        progress_percentage=60,
+        current_stage="structure",
+        stage_description="Identifying document structure...",
+        timestamp=datetime.utcnow()
+    )
+    progress_cache.get = AsyncMock(return_value=orjson.dumps({
+        "user_id": "test-user-id-123",
+        "progress": cached.model_dump(mode="json")
+    }))
+
+    first = await client.get(
+        f"/api/v1/jobs/{job_id}/progress",
+        headers={"Authorization": f"Bearer {valid_jwt_token}"}
+    )
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+
+    second = await client.get(
+        f"/api/v1/jobs/{job_id}/progress",
+        headers={"Authorization": f"Bearer {valid_jwt_token}", "If-None-Match": etag}
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_etag_changes_with_progress(client, valid_jwt_token, progress_cache):
+    """Test that a stale ETag still gets the full payload once progress moves."""
+    job_id = "00000000-0000-4000-8000-000000000044"
+    cached = ProgressUpdate(
+        job_id=job_id,
+        status="PROCESSING",
+        progress_percentage=70,
+        current_stage="structure",
+        stage_description="Identifying document structure...",
+        timestamp=datetime.utcnow()
+    )
+    progress_cache.get = AsyncMock(return_value=orjson.dumps({
+        "user_id": "test-user-id-123",
+        "progress": cached.model_dump(mode="json")
+    }))
+
+    response = await client.get(
+        f"/api/v1/jobs/{job_id}/progress",
+        headers={"Authorization": f"Bearer {valid_jwt_token}", "If-None-Match": 'W/"0000000000000000"'}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["progress_percentage"] == 70
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_terminal_state_cached_longer(client, valid_jwt_token, progress_cache):
+    """Test that scored COMPLETED payloads are cached with the long terminal TTL."""
+    job_id = "00000000-0000-4000-8000-000000000045"
+
+    mock_job = Mock(spec=JobDetail)
+    mock_job.id = job_id
+    mock_job.status = "COMPLETED"
+    mock_job.progress = 100
+    mock_job.stage_metadata = None
+    mock_job.quality_report = {"overall_confidence": 92}
+
+    with patch('app.api.v1.jobs.JobService') as MockJobService:
+        MockJobService.return_value.get_progress_row.return_value = mock_job
+
+        response = await client.get(
+            f"/api/v1/jobs/{job_id}/progress",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 200
+    key, ttl, payload = progress_cache.setex.await_args.args
+    assert key == f"progress:{job_id}"
+    assert ttl == 3600
+    assert orjson.loads(payload)["progress"] == response.json()
+
+
+@pytest.mark.asyncio
+async def test_get_job_progress_completed_without_quality_uses_short_ttl(client, valid_jwt_token, progress_cache):
+    """Test that COMPLETED payloads still awaiting the quality report keep the short TTL."""
+    job_id = "00000000-0000-4000-8000-000000000046"
+
+    mock_job = Mock(spec=JobDetail)
+    mock_job.id = job_id
+    mock_job.status = "COMPLETED"
+    mock_job.progress = 100
+    mock_job.stage_metadata = None
+    mock_job.quality_report = None
+
+    with patch('app.api.v1.jobs.JobService') as MockJobService:
+        MockJobService.return_value.get_progress_row.return_value = mock_job
+
+        response = await client.get(
+            f"/api/v1/jobs/{job_id}/progress",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 200
+    _, ttl, _ = progress_cache.setex.await_args.args
+    assert ttl == 2
@@ -0,0 +1,65 @@
+"""
+Unit Tests for Test AI Task Status Long Polling
+
+Tests that waiting for a task polls the result backend from the event loop
+instead of blocking a threadpool slot for the whole wait.
+"""
+import pytest
+from unittest.mock import AsyncMock, PropertyMock, MagicMock, patch
+
+from app.api.v1.test_ai import _wait_for_task
+
+
+def make_task_result(*states):
+    """AsyncResult stand-in whose state walks through `states`."""
+    task_result = MagicMock()
+    type(task_result).state = PropertyMock(side_effect=list(states))
+    return task_result
+
+
+@pytest.mark.asyncio
+async def test_wait_zero_reads_state_once():
+    """wait=0 answers with a single backend read."""
+    task_result = make_task_result("PENDING")
+
+    assert await _wait_for_task(task_result, 0) == "PENDING"
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_when_task_finishes():
+    """Polling stops as soon as the task reaches a final state."""
+    task_result = make_task_result("PENDING", "STARTED", "SUCCESS")
+
+    with patch("app.api.v1.test_ai.STATUS_POLL_INTERVAL_SECONDS", 0):
+        assert await _wait_for_task(task_result, 5) == "SUCCESS"
+
+
+@pytest.mark.asyncio
+async def test_wait_gives_up_after_timeout():
+    """An unfinished task is reported as-is once the wait elapses."""
+    task_result = MagicMock()
+    type(task_result).state = PropertyMock(return_value="PENDING")
+
+    with patch("app.api.v1.test_ai.STATUS_POLL_INTERVAL_SECONDS", 0.01):
+        assert await _wait_for_task(task_result, 0.05) == "PENDING"
+
+
+@pytest.mark.asyncio
+async def test_long_poll_backs_off_between_reads():
+    """A full 25s poll of a pending task makes ten backend reads, not fifty."""
+    clock = MagicMock()
+    clock.time.return_value = 0.0
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock.time.return_value += delay
+
+    read_state = AsyncMock(return_value="PENDING")
+    with patch("app.api.v1.test_ai._read_state", read_state), \
+            patch("app.api.v1.test_ai.asyncio.get_running_loop", return_value=clock), \
+            patch("app.api.v1.test_ai.asyncio.sleep", side_effect=fake_sleep):
+        assert await _wait_for_task(MagicMock(), 25) == "PENDING"
+
+    assert sleeps == [0.5, 1.0, 2.0, 4.0, 4.0, 4.0, 4.0, 4.0, 1.5]
+    assert read_state.await_count == 10
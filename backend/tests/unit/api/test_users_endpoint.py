@@ -0,0 +1,51 @@
+"""
+Unit tests for account deletion (DELETE /api/v1/users/me).
+
+Tests that the data wipe is handed to Celery and the auth user is deleted
+before the 202 response.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture
+def mock_supabase():
+    """Create mock Supabase client."""
+    return MagicMock()
+
+
+@pytest.mark.asyncio
+async def test_delete_schedules_purge_and_deletes_auth_user(client, valid_jwt_token, mock_supabase):
+    """The data wipe is queued, the auth user deleted, and 202 returned."""
+    with patch("app.api.v1.users.get_supabase_client", return_value=mock_supabase), \
+         patch("app.api.v1.users.celery_app") as mock_celery:
+        response = await client.delete(
+            "/api/v1/users/me",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 202
+    assert response.json()["user_id"] == "test-user-id-123"
+    mock_celery.send_task.assert_called_once_with(
+        "app.tasks.cleanup.purge_user_data_task",
+        kwargs={"user_id": "test-user-id-123"}
+    )
+    mock_supabase.auth.admin.delete_user.assert_called_once_with("test-user-id-123")
+    # No table or storage work on the request path
+    mock_supabase.table.assert_not_called()
+    mock_supabase.storage.from_.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_auth_failure_returns_500(client, valid_jwt_token, mock_supabase):
+    """Failing to delete the auth user is reported as a 500."""
+    mock_supabase.auth.admin.delete_user.side_effect = Exception("GoTrue unavailable")
+
+    with patch("app.api.v1.users.get_supabase_client", return_value=mock_supabase), \
+         patch("app.api.v1.users.celery_app"):
+        response = await client.delete(
+            "/api/v1/users/me",
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+    assert response.status_code == 500
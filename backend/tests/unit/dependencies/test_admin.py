@@ -3,14 +3,40 @@ Unit Tests for Admin Dependency
 
 Tests the require_superuser dependency for admin route protection.
 """
+import hashlib
+import time
+
+import jwt
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 
 from app.dependencies.admin import require_superuser
 from app.schemas.auth import AuthenticatedUser, SubscriptionTier
 
 
+def make_credentials(expires_in: int = 3600) -> HTTPAuthorizationCredentials:
+    """Bearer credentials for a token expiring expires_in seconds from now."""
+    token = jwt.encode({"sub": "test-user-id", "exp": int(time.time()) + expires_in}, "test-secret", algorithm="HS256")
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def cache_key(credentials: HTTPAuthorizationCredentials) -> str:
+    """Expected Redis key for a token's superuser grant."""
+    return f"superuser:{hashlib.sha256(credentials.credentials.encode()).hexdigest()}"
+
+
+@pytest.fixture(autouse=True)
+def mock_superuser_cache():
+    """Isolate tests from Redis: superuser cache always misses by default."""
+    redis_mock = MagicMock()
+    redis_mock.get = AsyncMock(return_value=None)
+    redis_mock.setex = AsyncMock()
+    with patch("app.dependencies.admin.get_async_redis_client", return_value=redis_mock):
+        yield redis_mock
+
+
 @pytest.mark.asyncio
 async def test_require_superuser_with_superuser():
     """Test that superuser can access protected routes"""
@@ -33,7 +59,7 @@ async def test_require_superuser_with_superuser():
     mock_supabase.auth.admin.get_user_by_id.return_value = mock_response
 
     # Call dependency with both parameters
-    result = await require_superuser(mock_user, mock_supabase)
+    result = await require_superuser(mock_user, mock_supabase, make_credentials())
 
     # Assertions
     assert result == mock_user
@@ -63,7 +89,7 @@ async def test_require_superuser_without_superuser():
 
     # Call dependency - should raise 403
     with pytest.raises(HTTPException) as exc_info:
-        await require_superuser(mock_user, mock_supabase)
+        await require_superuser(mock_user, mock_supabase, make_credentials())
 
     # Assertions
     assert exc_info.value.status_code == 403
@@ -93,7 +119,7 @@ async def test_require_superuser_with_false_flag():
 
     # Call dependency - should raise 403
     with pytest.raises(HTTPException) as exc_info:
-        await require_superuser(mock_user, mock_supabase)
+        await require_superuser(mock_user, mock_supabase, make_credentials())
 
     # Assertions
     assert exc_info.value.status_code == 403
@@ -120,8 +146,86 @@ async def test_require_superuser_user_not_found():
 
     # Call dependency - should raise 403
     with pytest.raises(HTTPException) as exc_info:
-        await require_superuser(mock_user, mock_supabase)
+        await require_superuser(mock_user, mock_supabase, make_credentials())
 
     # Assertions
     assert exc_info.value.status_code == 403
     assert exc_info.value.detail == "Admin access required"
+
+
+@pytest.mark.asyncio
+async def test_require_superuser_cache_hit_skips_supabase(mock_superuser_cache):
+    """Test that a cached grant for the token avoids the Supabase Admin API call"""
+    mock_user = AuthenticatedUser(
+        user_id="test-user-id",
+        email="admin@test.com",
+        tier=SubscriptionTier.FREE
+    )
+    credentials = make_credentials()
+    mock_superuser_cache.get.return_value = "1"
+    mock_supabase = MagicMock()
+
+    result = await require_superuser(mock_user, mock_supabase, credentials)
+
+    assert result == mock_user
+    mock_superuser_cache.get.assert_awaited_once_with(cache_key(credentials))
+    mock_supabase.auth.admin.get_user_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_require_superuser_denial_not_cached(mock_superuser_cache):
+    """Test that a non-superuser decision is never written to the cache"""
+    mock_user = AuthenticatedUser(
+        user_id="test-user-id",
+        email="user@test.com",
+        tier=SubscriptionTier.FREE
+    )
+    mock_response = MagicMock()
+    mock_response.user.user_metadata = {'is_superuser': False}
+    mock_supabase = MagicMock()
+    mock_supabase.auth.admin.get_user_by_id.return_value = mock_response
+
+    with pytest.raises(HTTPException) as exc_info:
+        await require_superuser(mock_user, mock_supabase, make_credentials())
+
+    assert exc_info.value.status_code == 403
+    mock_superuser_cache.setex.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_require_superuser_cache_miss_stores_grant(mock_superuser_cache):
+    """Test that a superuser grant is cached under the token for the full TTL"""
+    mock_user = AuthenticatedUser(
+        user_id="test-user-id",
+        email="admin@test.com",
+        tier=SubscriptionTier.FREE
+    )
+    credentials = make_credentials(expires_in=3600)
+    mock_response = MagicMock()
+    mock_response.user.user_metadata = {'is_superuser': True}
+    mock_supabase = MagicMock()
+    mock_supabase.auth.admin.get_user_by_id.return_value = mock_response
+
+    await require_superuser(mock_user, mock_supabase, credentials)
+
+    mock_superuser_cache.setex.assert_awaited_once_with(cache_key(credentials), 300, "1")
+
+
+@pytest.mark.asyncio
+async def test_require_superuser_grant_ttl_bounded_by_token_exp(mock_superuser_cache):
+    """Test that a grant never outlives the token it was cached for"""
+    mock_user = AuthenticatedUser(
+        user_id="test-user-id",
+        email="admin@test.com",
+        tier=SubscriptionTier.FREE
+    )
+    credentials = make_credentials(expires_in=60)
+    mock_response = MagicMock()
+    mock_response.user.user_metadata = {'is_superuser': True}
+    mock_supabase = MagicMock()
+    mock_supabase.auth.admin.get_user_by_id.return_value = mock_response
+
+    await require_superuser(mock_user, mock_supabase, credentials)
+
+    _, ttl, _ = mock_superuser_cache.setex.await_args.args
+    assert 0 < ttl <= 60
@@ -0,0 +1,50 @@
+"""
+Unit Tests for Log Context Dependency
+
+Tests that request identifiers are bound to the structlog context.
+"""
+import pytest
+import structlog
+from unittest.mock import MagicMock
+
+from app.dependencies.log_context import bind_log_context
+from app.schemas.auth import AuthenticatedUser, SubscriptionTier
+
+
+@pytest.fixture
+def user():
+    """Authenticated FREE tier user."""
+    return AuthenticatedUser(user_id="test-user-id", email="user@test.com", tier=SubscriptionTier.FREE)
+
+
+@pytest.fixture(autouse=True)
+def clean_context():
+    """Keep bound context from leaking between tests."""
+    yield
+    structlog.contextvars.clear_contextvars()
+
+
+@pytest.mark.asyncio
+async def test_binds_user_and_job_id(user):
+    """Test that job routes get both user_id and job_id bound"""
+    request = MagicMock()
+    request.path_params = {"job_id": "11111111-1111-4111-8111-111111111111"}
+
+    await bind_log_context(request, user)
+
+    assert structlog.contextvars.get_contextvars() == {
+        "user_id": "test-user-id",
+        "job_id": "11111111-1111-4111-8111-111111111111"
+    }
+
+
+@pytest.mark.asyncio
+async def test_replaces_previous_request_context(user):
+    """Test that fields from an earlier request are cleared"""
+    structlog.contextvars.bind_contextvars(job_id="stale-job")
+    request = MagicMock()
+    request.path_params = {}
+
+    await bind_log_context(request, user)
+
+    assert structlog.contextvars.get_contextvars() == {"user_id": "test-user-id"}
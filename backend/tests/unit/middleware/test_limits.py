@@ -8,9 +8,9 @@ from unittest.mock import Mock, AsyncMock, patch
 from fastapi import HTTPException, Request
 from datetime import datetime, timezone
 
-from app.middleware.limits import check_tier_limits
+from app.middleware.limits import _next_reset_date, check_tier_limits
 from app.schemas.auth import AuthenticatedUser, SubscriptionTier
-from app.core.limits import get_file_size_limit, get_conversion_limit
+from app.core.limits import CONVERSION_LIMITS, FILE_SIZE_LIMITS, get_file_size_limit, get_conversion_limit
 
 
 # ============================================================================
@@ -60,6 +60,30 @@ class TestLimitHelpers:
         """Unrecognized tier should default to FREE conversion limit."""
         assert get_conversion_limit("UNKNOWN") == 5
         assert get_conversion_limit(None) == 5
+    
+    def test_precomputed_tables_match_getters(self):
+        """Module-level limit tables should agree with the getter functions."""
+        for tier in ("FREE", "PRO", "PREMIUM"):
+            assert FILE_SIZE_LIMITS[tier] == get_file_size_limit(tier)
+            assert CONVERSION_LIMITS[tier] == get_conversion_limit(tier)
+
+
+class TestNextResetDate:
+    """Test _next_reset_date helper."""
+    
+    def test_regular_month(self):
+        """Mid-year months reset on the 1st of the next month."""
+        assert _next_reset_date(datetime(2025, 3, 20, tzinfo=timezone.utc)) == "2025-04-01"
+    
+    def test_december_rolls_over_year(self):
+        """December resets on January 1st of the next year."""
+        assert _next_reset_date(datetime(2025, 12, 15, tzinfo=timezone.utc)) == "2026-01-01"
+    
+    def test_recomputed_when_month_changes(self):
+        """A cached date must not be reused for a different month."""
+        assert _next_reset_date(datetime(2025, 6, 1, tzinfo=timezone.utc)) == "2025-07-01"
+        assert _next_reset_date(datetime(2025, 6, 30, tzinfo=timezone.utc)) == "2025-07-01"
+        assert _next_reset_date(datetime(2025, 7, 1, tzinfo=timezone.utc)) == "2025-08-01"
 
 
 # ============================================================================
@@ -113,14 +137,10 @@ class TestCheckTierLimits:
         # Even with large file and high usage, PRO users pass
         mock_request.headers = {"content-length": str(100 * 1024 * 1024)}  # 100MB
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             # Mock shows user has already used 1000 conversions (way over limit)
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 1000,
-                "tier_limit": None,
-                "tier": "PRO"
-            }
+            tracker_instance.get_conversion_count.return_value = 1000
             
             # Should not raise exception
             result = await check_tier_limits(mock_request, pro_user)
@@ -134,7 +154,7 @@ class TestCheckTierLimits:
         """PREMIUM users should bypass all limit checks."""
         mock_request.headers = {"content-length": str(200 * 1024 * 1024)}  # 200MB
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             # Should not raise exception
             result = await check_tier_limits(mock_request, premium_user)
             assert result is None
@@ -152,13 +172,9 @@ class TestCheckTierLimits:
         # 30MB file (under 50MB limit)
         mock_request.headers = {"content-length": str(30 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 2,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 2
             
             # Should not raise exception
             result = await check_tier_limits(mock_request, free_user)
@@ -170,13 +186,9 @@ class TestCheckTierLimits:
         # Exactly 50MB (boundary case)
         mock_request.headers = {"content-length": str(50 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 0,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 0
             
             # Should not raise exception (at limit is OK)
             result = await check_tier_limits(mock_request, free_user)
@@ -205,13 +217,9 @@ class TestCheckTierLimits:
         # No Content-Length header
         mock_request.headers = {}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 1,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 1
             
             # Should not raise exception (can't check file size without header)
             result = await check_tier_limits(mock_request, free_user)
@@ -221,18 +229,28 @@ class TestCheckTierLimits:
     # Conversion Limit Tests
     # ------------------------------------------------------------------------
     
+    @pytest.mark.asyncio
+    async def test_usage_lookup_runs_in_threadpool(self, mock_request, free_user):
+        """The blocking usage lookup should be offloaded from the event loop."""
+        mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
+        
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker, \
+                patch("app.middleware.limits.run_in_threadpool", new_callable=AsyncMock) as mock_threadpool:
+            mock_threadpool.return_value = 1
+            
+            result = await check_tier_limits(mock_request, free_user)
+            
+            assert result is None
+            mock_threadpool.assert_awaited_once_with(MockTracker.return_value.get_conversion_count, "user-123")
+    
     @pytest.mark.asyncio
     async def test_free_user_under_conversion_limit(self, mock_request, free_user):
         """FREE user with 2/5 conversions should pass."""
         mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 2,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 2
             MockTracker.return_value = tracker_instance
             
             # Should not raise exception
@@ -244,13 +262,9 @@ class TestCheckTierLimits:
         """FREE user at 5/5 conversions should be rejected."""
         mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 5,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 5
             MockTracker.return_value = tracker_instance
             
             with pytest.raises(HTTPException) as exc_info:
@@ -269,13 +283,9 @@ class TestCheckTierLimits:
         """FREE user with 6/5 conversions should be rejected."""
         mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 6,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 6
             MockTracker.return_value = tracker_instance
             
             with pytest.raises(HTTPException) as exc_info:
@@ -285,6 +295,37 @@ class TestCheckTierLimits:
             detail = exc_info.value.detail
             assert detail["code"] == "CONVERSION_LIMIT_EXCEEDED"
     
+    @pytest.mark.asyncio
+    async def test_repeat_rejection_served_from_quota_cache(self, mock_request, free_user):
+        """A user retrying after hitting the limit should not trigger another usage lookup."""
+        mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
+        
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
+            tracker_instance = MockTracker.return_value
+            tracker_instance.get_conversion_count.return_value = 5
+            
+            for _ in range(2):
+                with pytest.raises(HTTPException) as exc_info:
+                    await check_tier_limits(mock_request, free_user)
+                assert exc_info.value.detail["code"] == "CONVERSION_LIMIT_EXCEEDED"
+                assert exc_info.value.detail["current_count"] == 5
+            
+            tracker_instance.get_conversion_count.assert_called_once_with("user-123")
+    
+    @pytest.mark.asyncio
+    async def test_under_limit_usage_not_cached(self, mock_request, free_user):
+        """Counts below the limit should be looked up on every upload."""
+        mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
+        
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
+            tracker_instance = MockTracker.return_value
+            tracker_instance.get_conversion_count.return_value = 4
+            
+            await check_tier_limits(mock_request, free_user)
+            await check_tier_limits(mock_request, free_user)
+            
+            assert tracker_instance.get_conversion_count.call_count == 2
+    
     # ------------------------------------------------------------------------
     # Edge Cases and Error Handling
     # ------------------------------------------------------------------------
@@ -315,9 +356,9 @@ class TestCheckTierLimits:
         """If UsageTracker fails, allow upload (fail-open policy)."""
         mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.side_effect = Exception("Database connection failed")
+            tracker_instance.get_conversion_count.side_effect = Exception("Database connection failed")
             MockTracker.return_value = tracker_instance
             
             # Should NOT raise exception (fail-open for availability)
@@ -329,13 +370,9 @@ class TestCheckTierLimits:
         """Reset date should handle year rollover in December."""
         mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 5,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 5
             MockTracker.return_value = tracker_instance
             
             # Mock datetime to December
@@ -354,13 +391,9 @@ class TestCheckTierLimits:
         """Reset date should correctly calculate next month."""
         mock_request.headers = {"content-length": str(10 * 1024 * 1024)}
         
-        with patch("app.middleware.limits.UsageTracker") as MockTracker:
+        with patch("app.middleware.limits.get_usage_tracker") as MockTracker:
             tracker_instance = MockTracker.return_value
-            tracker_instance.get_usage.return_value = {
-                "conversion_count": 5,
-                "tier_limit": 5,
-                "tier": "FREE"
-            }
+            tracker_instance.get_conversion_count.return_value = 5
             MockTracker.return_value = tracker_instance
             
             # Mock datetime to March
@@ -0,0 +1,80 @@
+"""
+Unit Tests for Rate Limit Enforcement Middleware
+
+Tests the per-user, per-job progress polling limit.
+"""
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+from uuid import UUID
+from fastapi import HTTPException
+
+from app.middleware.rate_limit import _INCR_WINDOW_SCRIPT, limit_progress_polling, PROGRESS_RATE_WINDOW_MS
+from app.schemas.auth import AuthenticatedUser
+
+JOB_ID = UUID("00000000-0000-4000-8000-000000000001")
+
+
+@pytest.fixture
+def user():
+    """Authenticated test user."""
+    return AuthenticatedUser(user_id="user-1", email="user@test.com")
+
+
+@pytest.fixture
+def redis_mock():
+    """Async Redis client mock whose registered window script returns a controllable count."""
+    mock = MagicMock()
+    script = AsyncMock(return_value=1)
+    script.registered_client = mock
+    mock.register_script.return_value = script
+    with patch("app.middleware.rate_limit.get_async_redis_client", return_value=mock), \
+            patch("app.middleware.rate_limit._incr_window_script", None):
+        yield mock
+
+
+@pytest.fixture
+def window_script(redis_mock):
+    """The registered window script mock."""
+    return redis_mock.register_script.return_value
+
+
+@pytest.mark.asyncio
+async def test_within_limit_passes(user, window_script):
+    """Polls within the window limit are allowed."""
+    window_script.return_value = 2
+
+    assert await limit_progress_polling(JOB_ID, user) is None
+
+    window_script.assert_awaited_once_with(keys=[f"rl:prog:user-1:{JOB_ID}"], args=[PROGRESS_RATE_WINDOW_MS])
+
+
+@pytest.mark.asyncio
+async def test_script_registered_once(user, redis_mock, window_script):
+    """The Lua source is registered once and reused (EVALSHA) for later polls."""
+    await limit_progress_polling(JOB_ID, user)
+    await limit_progress_polling(JOB_ID, user)
+
+    redis_mock.register_script.assert_called_once_with(_INCR_WINDOW_SCRIPT)
+    assert window_script.await_count == 2
+    redis_mock.eval.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_over_limit_rejected(user, window_script):
+    """The third poll in one window gets 429 with Retry-After."""
+    window_script.return_value = 3
+
+    with pytest.raises(HTTPException) as exc_info:
+        await limit_progress_polling(JOB_ID, user)
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.detail["code"] == "RATE_LIMITED"
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_fails_open(user, window_script):
+    """A Redis outage never blocks polling."""
+    window_script.side_effect = ConnectionError("Redis down")
+
+    assert await limit_progress_polling(JOB_ID, user) is None
@@ -0,0 +1,108 @@
+"""
+Unit Tests for Upload Size Middleware
+
+Tests that oversized uploads are rejected before the route reads the body,
+both from Content-Length and while counting a chunked body.
+"""
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI, Request
+from httpx import AsyncClient, ASGITransport
+
+from app.middleware.upload_size import UploadSizeLimitMiddleware
+
+FREE_LIMIT = 1024
+HARD_LIMIT = 4096
+
+
+@pytest.fixture
+def body_reads():
+    """Records how many bodies the route actually consumed."""
+    return []
+
+
+@pytest.fixture
+async def upload_client(body_reads):
+    """Client for a minimal app whose /upload route reads the whole body."""
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        body = await request.body()
+        body_reads.append(len(body))
+        return {"size": len(body)}
+
+    app.add_middleware(UploadSizeLimitMiddleware, paths={"/upload"})
+
+    with patch("app.middleware.upload_size.get_file_size_limit",
+               side_effect=lambda tier: FREE_LIMIT if tier == "FREE" else None), \
+         patch("app.middleware.upload_size.MAX_UPLOAD_BYTES", HARD_LIMIT):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+
+
+def chunks(total: int, size: int = 256):
+    """Yield a body of `total` bytes without a Content-Length."""
+    async def gen():
+        sent = 0
+        while sent < total:
+            yield b"x" * min(size, total - sent)
+            sent += size
+    return gen()
+
+
+@pytest.mark.asyncio
+class TestUploadSizeLimitMiddleware:
+    """Test UploadSizeLimitMiddleware."""
+
+    async def test_free_tier_rejected_from_content_length(self, upload_client, body_reads, valid_jwt_token):
+        """FREE uploads over the plan limit get 403 without the route running"""
+        response = await upload_client.post(
+            "/upload",
+            content=b"x" * (FREE_LIMIT + 1),
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+        assert response.status_code == 403
+        assert response.json()["detail"]["code"] == "FILE_SIZE_LIMIT_EXCEEDED"
+        assert body_reads == []
+
+    async def test_within_limit_passes_through(self, upload_client, body_reads, valid_jwt_token):
+        """Uploads within the limit reach the route unchanged"""
+        response = await upload_client.post(
+            "/upload",
+            content=b"x" * FREE_LIMIT,
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+        assert response.status_code == 200
+        assert body_reads == [FREE_LIMIT]
+
+    async def test_pro_tier_uses_hard_cap(self, upload_client, pro_tier_jwt_token):
+        """PRO uploads are only bounded by the hard cap, answered with 413"""
+        headers = {"Authorization": f"Bearer {pro_tier_jwt_token}"}
+
+        ok = await upload_client.post("/upload", content=b"x" * (FREE_LIMIT + 1), headers=headers)
+        too_large = await upload_client.post("/upload", content=b"x" * (HARD_LIMIT + 1), headers=headers)
+
+        assert ok.status_code == 200
+        assert too_large.status_code == 413
+        assert too_large.json()["detail"]["code"] == "FILE_TOO_LARGE"
+
+    async def test_chunked_body_aborted_at_cap(self, upload_client, body_reads, valid_jwt_token):
+        """Bodies without Content-Length are cut off once they pass the limit"""
+        response = await upload_client.post(
+            "/upload",
+            content=chunks(FREE_LIMIT * 4),
+            headers={"Authorization": f"Bearer {valid_jwt_token}"}
+        )
+
+        assert response.status_code == 403
+        assert response.json()["detail"]["code"] == "FILE_SIZE_LIMIT_EXCEEDED"
+        assert body_reads == []
+
+    async def test_other_paths_untouched(self, upload_client):
+        """Requests to other paths are not inspected"""
+        response = await upload_client.post("/elsewhere", content=b"x" * (HARD_LIMIT + 1))
+
+        assert response.status_code == 404
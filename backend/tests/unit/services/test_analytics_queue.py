@@ -0,0 +1,117 @@
+"""
+Unit Tests for the analytics event queue
+
+Tests non-blocking enqueue, bounded drops, size/interval batching and the
+shutdown flush.
+"""
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.analytics_queue import AnalyticsQueue
+
+
+def make_event(i: int) -> dict:
+    """Build a conversion_events row."""
+    return {"job_id": f"job-{i}", "user_id": "user-1", "event_type": "download", "event_data": {}}
+
+
+@pytest.fixture
+def mock_supabase():
+    """Create mock Supabase client."""
+    return MagicMock()
+
+
+def inserted_batches(mock_supabase) -> list:
+    """Return the row lists passed to each insert call."""
+    return [c.args[0] for c in mock_supabase.table.return_value.insert.call_args_list]
+
+
+class TestEnqueue:
+    """Test AnalyticsQueue.enqueue."""
+
+    def test_enqueue_drops_when_full(self, mock_supabase):
+        """Test that a full queue drops and counts new events instead of blocking."""
+        queue = AnalyticsQueue(mock_supabase, max_size=2)
+
+        assert queue.enqueue(make_event(1)) is True
+        assert queue.enqueue(make_event(2)) is True
+        assert queue.enqueue(make_event(3)) is False
+        assert queue.dropped_events == 1
+        mock_supabase.table.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestDrain:
+    """Test the background drain task."""
+
+    async def test_pending_events_written_as_one_insert(self, mock_supabase):
+        """Test that events queued together go out in a single multi-row insert."""
+        queue = AnalyticsQueue(mock_supabase, flush_interval_ms=10)
+        events = [make_event(i) for i in range(3)]
+        for event in events:
+            queue.enqueue(event)
+
+        queue.start()
+        await asyncio.sleep(0.05)
+        await queue.stop()
+
+        mock_supabase.table.assert_called_once_with("conversion_events")
+        mock_supabase.table.return_value.insert.assert_called_once_with(events)
+
+    async def test_batches_capped(self, mock_supabase):
+        """Test that a backlog is split into inserts of at most max_batch rows."""
+        queue = AnalyticsQueue(mock_supabase, max_batch=4, flush_interval_ms=10)
+        for i in range(queue.max_batch + 1):
+            queue.enqueue(make_event(i))
+
+        queue.start()
+        await asyncio.sleep(0.05)
+        await queue.stop()
+
+        assert [len(b) for b in inserted_batches(mock_supabase)] == [4, 1]
+
+    async def test_events_within_interval_share_insert(self, mock_supabase):
+        """Test that events arriving inside the flush interval are batched together."""
+        queue = AnalyticsQueue(mock_supabase, flush_interval_ms=100)
+
+        queue.start()
+        queue.enqueue(make_event(1))
+        await asyncio.sleep(0.01)
+        queue.enqueue(make_event(2))
+        await asyncio.sleep(0.2)
+        await queue.stop()
+
+        assert [len(b) for b in inserted_batches(mock_supabase)] == [2]
+
+    async def test_stop_flushes_pending_events(self, mock_supabase):
+        """Test that shutdown writes events the worker has not flushed yet."""
+        queue = AnalyticsQueue(mock_supabase, max_batch=2, flush_interval_ms=10_000)
+        events = [make_event(i) for i in range(5)]
+
+        queue.start()
+        for event in events:
+            queue.enqueue(event)
+        await asyncio.sleep(0.01)
+        await queue.stop()
+
+        batches = inserted_batches(mock_supabase)
+        assert [row for batch in batches for row in batch] == events
+        assert all(len(b) <= 2 for b in batches)
+
+    async def test_write_failure_does_not_stop_worker(self, mock_supabase):
+        """Test that a failed insert is logged and later events are still written."""
+        mock_supabase.table.return_value.insert.return_value.execute.side_effect = [
+            Exception("database unavailable"),
+            MagicMock()
+        ]
+        queue = AnalyticsQueue(mock_supabase, flush_interval_ms=10)
+
+        queue.start()
+        queue.enqueue(make_event(1))
+        await asyncio.sleep(0.05)
+        queue.enqueue(make_event(2))
+        await asyncio.sleep(0.05)
+        await queue.stop()
+
+        assert mock_supabase.table.return_value.insert.call_count == 2
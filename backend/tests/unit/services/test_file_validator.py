@@ -39,6 +39,20 @@ class TestFileValidationService:
             validator.validate_pdf(html_data)
         assert "text/html" in str(exc_info.value)
 
+    def test_validate_pdf_header_only(self, validator):
+        """Test that the 5-byte header alone is enough to pass"""
+        assert validator.validate_pdf(b"%PDF-") is True
+
+    def test_validate_pdf_magic_not_at_start(self, validator):
+        """Test that %PDF- appearing after leading bytes is rejected"""
+        with pytest.raises(InvalidFileTypeError):
+            validator.validate_pdf(b"\x00%PDF-1.4\n")
+
+    def test_validate_pdf_empty(self, validator):
+        """Test that an empty upload fails PDF validation"""
+        with pytest.raises(InvalidFileTypeError):
+            validator.validate_pdf(b"")
+
     def test_validate_file_size_free_tier_within_limit(self, validator):
         """Test that file under 50MB passes for FREE tier"""
         # 40MB file
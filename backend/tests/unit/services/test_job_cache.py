@@ -0,0 +1,84 @@
+"""
+Unit Tests for the job ownership cache
+
+Tests TTL expiry, LRU eviction, and that JobService.get_job skips the
+existence query for jobs whose owner is cached.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.services.job_cache import JobOwnershipCache, job_ownership_cache
+from app.services.job_service import JobService
+
+
+class TestJobOwnershipCache:
+    """Test JobOwnershipCache."""
+
+    def test_get_returns_cached_owner(self):
+        """Test that a stored owner is returned until invalidated."""
+        cache = JobOwnershipCache()
+        cache.set("job-1", "user-1")
+
+        assert cache.get("job-1") == "user-1"
+        cache.invalidate("job-1")
+        assert cache.get("job-1") is None
+
+    def test_entries_expire(self):
+        """Test that entries past their TTL are misses."""
+        cache = JobOwnershipCache(ttl=60)
+        with patch("app.services.job_cache.time.monotonic", return_value=1000.0):
+            cache.set("job-1", "user-1")
+        with patch("app.services.job_cache.time.monotonic", return_value=1061.0):
+            assert cache.get("job-1") is None
+
+    def test_least_recently_used_evicted(self):
+        """Test that the cache stays within max_size."""
+        cache = JobOwnershipCache(max_size=2)
+        cache.set("job-1", "user-1")
+        cache.set("job-2", "user-1")
+        cache.get("job-1")
+        cache.set("job-3", "user-1")
+
+        assert cache.get("job-2") is None
+        assert cache.get("job-1") == "user-1"
+        assert cache.get("job-3") == "user-1"
+
+
+class TestGetJobOwnership:
+    """Test JobService.get_job with the ownership cache."""
+
+    @pytest.fixture
+    def mock_supabase(self):
+        """Create mock Supabase client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def job_service(self, mock_supabase):
+        """Create JobService without Redis so every call reaches the database path."""
+        return JobService(mock_supabase, MagicMock(), None)
+
+    def test_known_foreign_job_rejected_without_query(self, job_service, mock_supabase):
+        """Test that a cached owner mismatch raises PermissionError with no DB call."""
+        job_ownership_cache.set("job-1", "owner-id")
+
+        with pytest.raises(PermissionError):
+            job_service.get_job("job-1", "other-user")
+
+        mock_supabase.table.assert_not_called()
+
+    def test_existence_query_skipped_for_known_job(self, job_service, mock_supabase):
+        """Test that only the full-row query runs when the owner is cached."""
+        job_ownership_cache.set("job-1", "user-1")
+        mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value \
+            .execute.return_value.data = [{
+                "id": "job-1",
+                "user_id": "user-1",
+                "status": "COMPLETED",
+                "input_path": "uploads/test.pdf",
+                "created_at": "2025-12-13T10:00:00Z"
+            }]
+
+        result = job_service.get_job("job-1", "user-1")
+
+        assert result.id == "job-1"
+        mock_supabase.table.return_value.select.assert_called_once_with("*")
@@ -0,0 +1,139 @@
+"""
+Unit Tests for JobService job activity RPCs
+
+Tests issue reports, feedback checks and feedback/issue listings, which
+each verify job ownership inside a single RPC call.
+"""
+import pytest
+from unittest.mock import MagicMock
+from postgrest.exceptions import APIError
+
+from app.services.job_cache import job_ownership_cache
+from app.services.job_service import JobService
+
+
+@pytest.fixture
+def mock_supabase():
+    """Create mock Supabase client."""
+    return MagicMock()
+
+
+@pytest.fixture
+def job_service(mock_supabase):
+    """Create JobService instance with mocked dependencies."""
+    return JobService(mock_supabase, MagicMock())
+
+
+class TestReportIssue:
+    """Test JobService.report_issue."""
+
+    def test_report_issue_single_rpc(self, job_service, mock_supabase):
+        """Test that the issue is recorded with one RPC and no table calls."""
+        issue_row = {"id": "issue-1", "job_id": "job-1", "created_at": "2025-12-15T10:35:00Z"}
+        mock_supabase.rpc.return_value.execute.return_value.data = [issue_row]
+
+        result = job_service.report_issue("job-1", "user-1", "other", 3, "Broken layout", None)
+
+        assert result == issue_row
+        mock_supabase.rpc.assert_called_once_with("report_issue_tx", {
+            "p_job_id": "job-1",
+            "p_user_id": "user-1",
+            "p_issue_type": "other",
+            "p_page_number": 3,
+            "p_description": "Broken layout",
+            "p_screenshot_url": None
+        })
+        mock_supabase.table.assert_not_called()
+
+    def test_report_issue_job_not_found(self, job_service, mock_supabase):
+        """Test that the not-found SQLSTATE maps to None."""
+        mock_supabase.rpc.return_value.execute.side_effect = APIError({"code": "P0002", "message": "not found"})
+
+        assert job_service.report_issue("job-1", "user-1", "other", None, "Broken layout", None) is None
+
+    def test_report_issue_foreign_job(self, job_service, mock_supabase):
+        """Test that the ownership SQLSTATE maps to PermissionError."""
+        mock_supabase.rpc.return_value.execute.side_effect = APIError({"code": "42501", "message": "forbidden"})
+
+        with pytest.raises(PermissionError):
+            job_service.report_issue("job-1", "user-1", "other", None, "Broken layout", None)
+
+    def test_report_issue_other_errors_propagate(self, job_service, mock_supabase):
+        """Test that unrelated database errors are not swallowed."""
+        mock_supabase.rpc.return_value.execute.side_effect = APIError({"code": "23514", "message": "check"})
+
+        with pytest.raises(APIError):
+            job_service.report_issue("job-1", "user-1", "other", None, "Broken layout", None)
+
+
+class TestGetFeedbackStatus:
+    """Test JobService.get_feedback_status."""
+
+    def test_get_feedback_status(self, job_service, mock_supabase):
+        """Test that the single status row is returned."""
+        mock_supabase.rpc.return_value.execute.return_value.data = [
+            {"has_feedback": True, "feedback_rating": "positive"}
+        ]
+
+        assert job_service.get_feedback_status("job-1", "user-1") == {
+            "has_feedback": True,
+            "feedback_rating": "positive"
+        }
+        mock_supabase.rpc.assert_called_once_with("check_feedback_tx", {"p_job_id": "job-1", "p_user_id": "user-1"})
+
+
+class TestListChildren:
+    """Test JobService.list_feedback and JobService.list_issues."""
+
+    def test_list_feedback(self, job_service, mock_supabase):
+        """Test that feedback rows come from one RPC."""
+        rows = [{"id": "feedback-1", "rating": "positive"}]
+        mock_supabase.rpc.return_value.execute.return_value.data = rows
+
+        assert job_service.list_feedback("job-1", "user-1") == rows
+        mock_supabase.rpc.assert_called_once_with("list_job_feedback_tx", {"p_job_id": "job-1", "p_user_id": "user-1"})
+        mock_supabase.table.assert_not_called()
+
+    def test_list_issues_empty_is_not_missing(self, job_service, mock_supabase):
+        """Test that an owned job without issues returns [] rather than None."""
+        mock_supabase.rpc.return_value.execute.return_value.data = []
+
+        assert job_service.list_issues("job-1", "user-1") == []
+
+    def test_list_issues_job_not_found(self, job_service, mock_supabase):
+        """Test that the not-found SQLSTATE maps to None."""
+        mock_supabase.rpc.return_value.execute.side_effect = APIError({"code": "P0002", "message": "not found"})
+
+        assert job_service.list_issues("job-1", "user-1") is None
+
+
+class TestVerifyJobOwner:
+    """Test JobService.verify_job_owner (download event ownership check)."""
+
+    def test_cached_owner_skips_database(self, job_service, mock_supabase):
+        """Test that a known owner is answered from the ownership cache."""
+        job_ownership_cache.set("job-1", "user-1")
+
+        assert job_service.verify_job_owner("job-1", "user-1") is True
+        mock_supabase.table.assert_not_called()
+
+    def test_cache_miss_single_narrow_select(self, job_service, mock_supabase):
+        """Test that a miss costs one id/user_id select and fills the cache."""
+        mock_supabase.table().select().eq().execute.return_value.data = [{"id": "job-1", "user_id": "user-1"}]
+
+        assert job_service.verify_job_owner("job-1", "user-1") is True
+        mock_supabase.table().select.assert_called_with("id, user_id")
+        assert job_ownership_cache.get("job-1") == "user-1"
+
+    def test_missing_job(self, job_service, mock_supabase):
+        """Test that a job that doesn't exist returns False."""
+        mock_supabase.table().select().eq().execute.return_value.data = []
+
+        assert job_service.verify_job_owner("job-1", "user-1") is False
+
+    def test_foreign_job(self, job_service, mock_supabase):
+        """Test that another user's job raises PermissionError."""
+        job_ownership_cache.set("job-1", "someone-else")
+
+        with pytest.raises(PermissionError):
+            job_service.verify_job_owner("job-1", "user-1")
@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch, call
 from datetime import datetime
 import json
 
-from app.services.job_service import JobService
+from app.services.job_service import JobService, PROGRESS_ROW_COLUMNS
 from app.schemas.job import JobDetail
 
 
@@ -108,6 +108,61 @@ class TestRedisJobCaching:
         assert result.status == "EXTRACTING"
         assert result.progress == 50
 
+    def test_get_progress_row_selects_narrow_columns(self, job_service, mock_supabase, mock_redis):
+        """Test that get_progress_row fetches only progress fields for the owner."""
+        row = {
+            "id": "job-1",
+            "user_id": "test-user-id",
+            "status": "EXTRACTING",
+            "progress": 40,
+            "stage_metadata": None,
+            "qr_confidence": 92,
+            "qr_estimated_cost": None,
+            "qr_elements": None
+        }
+        query = mock_supabase.table.return_value.select.return_value
+        query.eq.return_value.eq.return_value.execute.return_value.data = [row]
+
+        result = job_service.get_progress_row("job-1", "test-user-id")
+
+        mock_supabase.table.return_value.select.assert_called_once_with(PROGRESS_ROW_COLUMNS)
+        query.eq.assert_called_once_with("id", "job-1")
+        query.eq.return_value.eq.assert_called_once_with("user_id", "test-user-id")
+        assert result.status == "EXTRACTING"
+        assert result.progress == 40
+        assert result.stage_metadata == {}
+        assert result.quality_report == {"overall_confidence": 92}
+
+    def test_get_progress_row_not_owned(self, job_service, mock_supabase):
+        """Test that get_progress_row returns None when the owner filter matches nothing."""
+        query = mock_supabase.table.return_value.select.return_value
+        query.eq.return_value.eq.return_value.execute.return_value.data = []
+
+        assert job_service.get_progress_row("job-1", "other-user") is None
+
+    def test_get_progress_rows_single_query(self, job_service, mock_supabase, mock_redis):
+        """Test that get_progress_rows loads every requested job in one filtered query."""
+        row = {
+            "id": "job-1",
+            "user_id": "test-user-id",
+            "status": "EXTRACTING",
+            "progress": 40,
+            "stage_metadata": {"current_stage": "extracting"},
+            "qr_confidence": None,
+            "qr_estimated_cost": None,
+            "qr_elements": None
+        }
+        query = mock_supabase.table.return_value.select.return_value
+        query.in_.return_value.eq.return_value.execute.return_value.data = [row]
+
+        result = job_service.get_progress_rows(["job-1", "job-2"], "test-user-id")
+
+        query.in_.assert_called_once_with("id", ["job-1", "job-2"])
+        query.in_.return_value.eq.assert_called_once_with("user_id", "test-user-id")
+        assert [job.id for job in result] == ["job-1"]
+        assert result[0].quality_report is None
+        mock_redis.get.assert_not_called()
+
     def test_update_job_status_invalidates_cache(self, job_service, mock_supabase, mock_redis):
         """Test that update_job_status invalidates Redis cache."""
         # Setup: Mock successful update
@@ -124,8 +179,8 @@ class TestRedisJobCaching:
         mock_supabase.table.assert_called_with("conversion_jobs")
         assert result is True
 
-        # Verify: Cache was invalidated
-        mock_redis.delete.assert_called_once_with("job_status:test-job-id")
+        # Verify: Job and progress caches were invalidated
+        mock_redis.delete.assert_called_once_with("job_status:test-job-id", "progress:test-job-id")
 
     def test_cache_graceful_failure(self, job_service, mock_supabase, mock_redis):
         """Test that cache failures don't break the application."""
@@ -182,3 +237,144 @@ class TestRedisJobCaching:
         # Verify: JobDetail returned
         assert result.id == "test-job-id"
         assert result.status == "ANALYZING"
+
+    def test_list_jobs_cache_miss_populates_cache(self, job_service, mock_supabase, mock_redis):
+        """Test that list_jobs caches the page and registers the key for invalidation."""
+        query = mock_supabase.table().select().eq().neq().order().range()
+        query.execute.return_value.data = [{
+            "id": "test-job-id",
+            "status": "COMPLETED",
+            "input_path": "user/test-job-id/input.pdf",
+            "created_at": "2025-12-13T10:00:00Z",
+            "completed_at": None,
+            "quality_report": None
+        }]
+        query.execute.return_value.count = 1
+        pipe = mock_redis.pipeline.return_value
+
+        jobs, total = job_service.list_jobs("test-user-id", limit=20, offset=0)
+
+        assert total == 1
+        assert jobs[0].input_file == "input.pdf"
+        mock_redis.get.assert_called_once_with("jobs:list:test-user-id:20:0:ALL")
+        pipe.setex.assert_called_once()
+        assert pipe.setex.call_args[0][:2] == ("jobs:list:test-user-id:20:0:ALL", 10)
+        pipe.sadd.assert_called_once_with("jobs:list:test-user-id:keys", "jobs:list:test-user-id:20:0:ALL")
+        mock_supabase.table().select().eq().neq.assert_called_with("status", "DELETING")
+
+    def test_list_jobs_cache_hit(self, job_service, mock_supabase, mock_redis):
+        """Test that a cached job list page is returned without querying the database."""
+        mock_redis.get.return_value = json.dumps({
+            "jobs": [{
+                "id": "test-job-id",
+                "status": "PROCESSING",
+                "input_file": "input.pdf",
+                "created_at": "2025-12-13T10:00:00Z",
+                "completed_at": None,
+                "overall_confidence": None
+            }],
+            "total": 1
+        })
+        mock_supabase.reset_mock()
+
+        jobs, total = job_service.list_jobs("test-user-id", limit=20, offset=0, status="PROCESSING")
+
+        assert total == 1
+        assert jobs[0].status == "PROCESSING"
+        mock_redis.get.assert_called_once_with("jobs:list:test-user-id:20:0:PROCESSING")
+        mock_supabase.table.assert_not_called()
+
+    def test_delete_job_invalidates_list_cache(self, job_service, mock_supabase, mock_redis):
+        """Test that deleting a job drops every cached list page for the user."""
+        mock_supabase.table().select().eq().eq().execute.return_value.data = [{
+            "id": "test-job-id",
+            "input_path": "uploads/test.pdf",
+            "output_path": None
+        }]
+        mock_supabase.table().delete().eq().eq().execute.return_value.data = [{"id": "test-job-id"}]
+        mock_redis.smembers.return_value = {"jobs:list:test-user-id:20:0:ALL"}
+
+        success, _ = job_service.delete_job("test-job-id", "test-user-id")
+
+        assert success is True
+        mock_redis.smembers.assert_called_once_with("jobs:list:test-user-id:keys")
+        mock_redis.delete.assert_any_call("jobs:list:test-user-id:keys", "jobs:list:test-user-id:20:0:ALL")
+        mock_redis.delete.assert_any_call(
+            "job_status:test-job-id",
+            "progress:test-job-id",
+            "dl:test-job-id:input",
+            "dl:test-job-id:output"
+        )
+
+    def test_mark_for_deletion_invalidates_signed_urls(self, job_service, mock_supabase, mock_redis):
+        """Test that soft-deleting a job drops its cached signed URLs with the status caches."""
+        mock_supabase.table().update().eq().eq().execute.return_value.data = [{
+            "id": "test-job-id",
+            "input_path": "uploads/test.pdf",
+            "output_path": "downloads/test.epub"
+        }]
+
+        paths = job_service.mark_for_deletion("test-job-id", "test-user-id")
+
+        assert paths == {"input_path": "uploads/test.pdf", "output_path": "downloads/test.epub"}
+        mock_redis.delete.assert_any_call(
+            "job_status:test-job-id",
+            "progress:test-job-id",
+            "dl:test-job-id:input",
+            "dl:test-job-id:output"
+        )
+
+    def test_download_url_cache_miss_signs_and_caches(self, job_service, mock_supabase, mock_storage, mock_redis):
+        """Test that a signed download URL is cached for reuse by the owner."""
+        mock_supabase.table().select().eq().execute.return_value.data = [{
+            "id": "test-job-id",
+            "user_id": "test-user-id",
+            "status": "COMPLETED",
+            "output_path": "downloads/test.epub"
+        }]
+        mock_storage.generate_signed_url.return_value = "https://storage/signed"
+
+        url, expires_at = job_service.generate_download_url("test-job-id", "test-user-id")
+
+        assert url == "https://storage/signed"
+        mock_redis.get.assert_called_once_with("dl:test-job-id:output")
+        key, ttl, payload = mock_redis.setex.call_args[0]
+        assert key == "dl:test-job-id:output"
+        assert ttl == 3300  # 55 minutes
+        entry = json.loads(payload)
+        assert entry["url"] == "https://storage/signed"
+        assert entry["user_id"] == "test-user-id"
+
+    def test_download_url_cache_hit(self, job_service, mock_supabase, mock_storage, mock_redis):
+        """Test that a cached signed URL skips the database and Storage signing."""
+        mock_redis.get.return_value = json.dumps({
+            "url": "https://storage/cached",
+            "expires_at": "2025-12-13T11:00:00",
+            "user_id": "test-user-id"
+        })
+
+        url, expires_at = job_service.generate_input_file_url("test-job-id", "test-user-id")
+
+        assert url == "https://storage/cached"
+        assert expires_at == datetime(2025, 12, 13, 11, 0, 0)
+        mock_redis.get.assert_called_once_with("dl:test-job-id:input")
+        mock_supabase.table.assert_not_called()
+        mock_storage.generate_signed_url.assert_not_called()
+
+
+    def test_download_url_cache_hit_for_other_user_ignored(self, job_service, mock_supabase, mock_storage, mock_redis):
+        """Test that a signed URL cached for another user is never returned."""
+        mock_redis.get.return_value = json.dumps({
+            "url": "https://storage/cached-for-owner",
+            "expires_at": "2025-12-13T11:00:00",
+            "user_id": "owner-user-id"
+        })
+        mock_supabase.table().select().eq().execute.return_value.data = []
+
+        result = job_service.generate_download_url("test-job-id", "test-user-id")
+
+        # Falls through to the RLS-scoped query, which hides the job
+        assert result is None
+        mock_supabase.table.assert_called_with("conversion_jobs")
+        mock_storage.generate_signed_url.assert_not_called()
+        mock_redis.setex.assert_not_called()
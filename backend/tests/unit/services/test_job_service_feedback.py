@@ -0,0 +1,52 @@
+"""
+Unit Tests for JobService feedback submission
+
+Tests that feedback and its analytics event are written through one RPC.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.job_service import JobService
+
+
+class TestSubmitFeedback:
+    """Test JobService.submit_feedback."""
+
+    @pytest.fixture
+    def mock_supabase(self):
+        """Create mock Supabase client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def job_service(self, mock_supabase):
+        """Create JobService instance with mocked dependencies."""
+        return JobService(mock_supabase, MagicMock())
+
+    def test_submit_feedback_single_rpc(self, job_service, mock_supabase):
+        """Test that feedback is recorded with one RPC and no table inserts."""
+        feedback_row = {
+            "id": "feedback-1",
+            "job_id": "job-1",
+            "user_id": "user-1",
+            "rating": "negative",
+            "comment": "Tables were broken",
+            "created_at": "2025-12-15T10:00:00Z"
+        }
+        mock_supabase.rpc.return_value.execute.return_value.data = [feedback_row]
+
+        result = job_service.submit_feedback("job-1", "user-1", "negative", "Tables were broken")
+
+        assert result == feedback_row
+        mock_supabase.rpc.assert_called_once_with("submit_feedback_rpc", {
+            "p_job_id": "job-1",
+            "p_user_id": "user-1",
+            "p_rating": "negative",
+            "p_comment": "Tables were broken"
+        })
+        mock_supabase.table.assert_not_called()
+
+    def test_submit_feedback_job_not_owned(self, job_service, mock_supabase):
+        """Test that an empty RPC result (missing or foreign job) returns None."""
+        mock_supabase.rpc.return_value.execute.return_value.data = []
+
+        assert job_service.submit_feedback("job-1", "user-1", "positive", None) is None
@@ -4,9 +4,12 @@ Unit Tests for Supabase Storage Service
 Tests file upload, download, deletion, and signed URL generation operations.
 """
 import pytest
+from io import BytesIO
 from unittest.mock import Mock, MagicMock, patch
 from app.services.storage.supabase_storage import (
     SupabaseStorageService,
+    UPLOAD_STREAM_CHUNK_SIZE,
+    STORAGE_BATCH_SIZE,
     StorageUploadError,
     StorageDeleteError,
 )
@@ -109,6 +112,40 @@ class TestUploadFile:
         assert "Network timeout" in str(exc_info.value)
 
 
+class TestUploadStream:
+    """Test cases for upload_stream method."""
+
+    def test_upload_stream_sends_chunks(self, mock_supabase_client):
+        """Test that the file object is posted in bounded chunks with its size."""
+        http_client = Mock()
+        sent = []
+        http_client.post.side_effect = lambda url, content, headers: sent.extend(content) or Mock()
+        service = SupabaseStorageService(mock_supabase_client, http_client)
+        data = b"%PDF-1.4" + b"0" * UPLOAD_STREAM_CHUNK_SIZE
+
+        service.upload_stream("uploads", "user/job/input.pdf", BytesIO(data), len(data))
+
+        url = http_client.post.call_args.args[0]
+        headers = http_client.post.call_args.kwargs["headers"]
+        assert url.endswith("/storage/v1/object/uploads/user/job/input.pdf")
+        assert headers["Content-Length"] == str(len(data))
+        assert headers["Content-Type"] == "application/pdf"
+        assert [len(c) for c in sent] == [UPLOAD_STREAM_CHUNK_SIZE, 8]
+        assert b"".join(sent) == data
+        mock_supabase_client.storage.from_.assert_not_called()
+
+    def test_upload_stream_http_error(self, mock_supabase_client):
+        """Test that a rejected upload raises StorageUploadError."""
+        http_client = Mock()
+        http_client.post.return_value.raise_for_status.side_effect = Exception("409 Duplicate")
+        service = SupabaseStorageService(mock_supabase_client, http_client)
+
+        with pytest.raises(StorageUploadError) as exc_info:
+            service.upload_stream("uploads", "user/job/input.pdf", BytesIO(b"data"), 4)
+
+        assert "409 Duplicate" in str(exc_info.value)
+
+
 class TestGenerateSignedUrl:
     """Test cases for generate_signed_url method."""
 
@@ -300,3 +337,47 @@ class TestListFiles:
         # Verify
         assert len(result) == 2
         mock_bucket.list.assert_called_once_with("")
+
+
+class TestDeleteFolder:
+    """Test cases for delete_folder method."""
+
+    def test_delete_folder_walks_subfolders(self, storage_service, mock_supabase_client):
+        """Test that files inside nested job folders are found and removed."""
+        def fake_list(path, options):
+            if path == "user123":
+                return [{"name": "job1", "id": None}]
+            return [{"name": "input.pdf", "id": "object-1"}]
+
+        mock_bucket = Mock()
+        mock_bucket.list.side_effect = fake_list
+        mock_supabase_client.storage.from_.return_value = mock_bucket
+
+        assert storage_service.delete_folder("uploads", "user123") == 1
+        mock_bucket.remove.assert_called_once_with(["user123/job1/input.pdf"])
+
+    def test_delete_folder_pages_and_chunks_removes(self, storage_service, mock_supabase_client):
+        """Test that listings past one page are followed and removes are capped per request."""
+        files = [{"name": f"f{i}", "id": f"object-{i}"} for i in range(STORAGE_BATCH_SIZE + 1)]
+
+        mock_bucket = Mock()
+        mock_bucket.list.side_effect = (
+            lambda path, options: files[options["offset"]:options["offset"] + options["limit"]]
+        )
+        mock_supabase_client.storage.from_.return_value = mock_bucket
+
+        assert storage_service.delete_folder("uploads", "user123") == STORAGE_BATCH_SIZE + 1
+        assert mock_bucket.list.call_count == 2
+        removed = [c.args[0] for c in mock_bucket.remove.call_args_list]
+        assert [len(batch) for batch in removed] == [STORAGE_BATCH_SIZE, 1]
+        assert removed[1] == [f"user123/f{STORAGE_BATCH_SIZE}"]
+
+    def test_delete_folder_empty(self, storage_service, mock_supabase_client):
+        """Test that an empty folder makes no remove calls."""
+        mock_bucket = Mock()
+        mock_bucket.list.return_value = []
+        mock_supabase_client.storage.from_.return_value = mock_bucket
+
+        assert storage_service.delete_folder("downloads", "downloads/user123") == 0
+        mock_bucket.remove.assert_not_called()
+
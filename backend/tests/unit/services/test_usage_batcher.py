@@ -0,0 +1,119 @@
+"""
+Unit Tests for the usage increment batcher
+
+Tests per-user coalescing, one write per flush interval and the shutdown
+flush.
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.services.usage_batcher import UsageIncrementBatcher
+
+
+@pytest.fixture
+def mock_tracker():
+    """Patch the shared UsageTracker the batcher writes through."""
+    with patch("app.services.usage_batcher.get_usage_tracker") as mock_get_tracker:
+        yield mock_get_tracker.return_value
+
+
+def written_batches(mock_tracker) -> list:
+    """Return the increments passed to each increment_usage_batch call."""
+    return [c.args[0] for c in mock_tracker.increment_usage_batch.call_args_list]
+
+
+class TestEnqueue:
+    """Test UsageIncrementBatcher.enqueue."""
+
+    def test_enqueue_coalesces_per_user(self, mock_tracker):
+        """Test that repeated increments for a user are summed without any I/O."""
+        batcher = UsageIncrementBatcher()
+
+        assert batcher.enqueue("user-1") == 1
+        assert batcher.enqueue("user-1") == 2
+        assert batcher.enqueue("user-2", 3) == 3
+        mock_tracker.increment_usage_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestDrain:
+    """Test the background flush task."""
+
+    async def test_increments_within_interval_share_write(self, mock_tracker):
+        """Test that increments arriving inside one interval are written together."""
+        batcher = UsageIncrementBatcher(flush_interval_ms=50)
+
+        batcher.start()
+        batcher.enqueue("user-1")
+        await asyncio.sleep(0.01)
+        batcher.enqueue("user-1")
+        batcher.enqueue("user-2")
+        await asyncio.sleep(0.1)
+        await batcher.stop()
+
+        assert written_batches(mock_tracker) == [{"user-1": 2, "user-2": 1}]
+
+    async def test_stop_flushes_pending(self, mock_tracker):
+        """Test that increments still buffered at shutdown are written."""
+        batcher = UsageIncrementBatcher(flush_interval_ms=10_000)
+
+        batcher.start()
+        batcher.enqueue("user-1")
+        await asyncio.sleep(0)
+        await batcher.stop()
+
+        assert written_batches(mock_tracker) == [{"user-1": 1}]
+
+    async def test_write_failure_logged_and_dropped(self, mock_tracker):
+        """Test that a failed write does not stop later flushes."""
+        mock_tracker.increment_usage_batch.side_effect = [Exception("DB down"), {}]
+        batcher = UsageIncrementBatcher(flush_interval_ms=10)
+
+        batcher.start()
+        batcher.enqueue("user-1")
+        await asyncio.sleep(0.05)
+        batcher.enqueue("user-2")
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+
+        assert written_batches(mock_tracker) == [{"user-1": 1}, {"user-2": 1}]
+
+    async def test_failed_batch_retried_per_user(self, mock_tracker, caplog):
+        """Test that one failing user only loses their own increment."""
+        def increment_usage_batch(increments):
+            if "deleted-user" in increments:
+                raise Exception("violates foreign key constraint")
+            return dict(increments)
+
+        mock_tracker.increment_usage_batch.side_effect = increment_usage_batch
+        batcher = UsageIncrementBatcher(flush_interval_ms=10_000)
+
+        batcher.start()
+        batcher.enqueue("user-1")
+        batcher.enqueue("deleted-user")
+        batcher.enqueue("user-2", 2)
+        await asyncio.sleep(0)
+        await batcher.stop()
+
+        assert written_batches(mock_tracker) == [
+            {"user-1": 1, "deleted-user": 1, "user-2": 2},
+            {"user-1": 1},
+            {"deleted-user": 1},
+            {"user-2": 2},
+        ]
+        lost = [r.getMessage() for r in caplog.records if r.levelname == "ERROR"]
+        assert len(lost) == 1
+        assert "deleted-user" in lost[0]
+
+    async def test_tracker_unavailable_logged_and_dropped(self):
+        """Test that a flush while Supabase can't be reached doesn't kill the worker."""
+        with patch("app.services.usage_batcher.get_usage_tracker", side_effect=Exception("Supabase down")):
+            batcher = UsageIncrementBatcher(flush_interval_ms=10)
+
+            batcher.start()
+            batcher.enqueue("user-1")
+            await asyncio.sleep(0.05)
+
+            assert not batcher._worker.done()
+            await batcher.stop()
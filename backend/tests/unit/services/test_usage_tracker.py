@@ -6,7 +6,7 @@ Tests usage tracking logic including increment, get_usage, caching, and edge cas
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime, timezone
-from app.services.usage_tracker import UsageTracker
+from app.services.usage_tracker import UsageTracker, get_usage_tracker
 
 
 class TestUsageTrackerIncrementUsage:
@@ -120,6 +120,88 @@ class TestUsageTrackerIncrementUsage:
         assert count == 3
 
 
+class TestUsageTrackerIncrementUsageBatch:
+    """Test increment_usage_batch method."""
+
+    def test_batch_single_rpc_and_pipeline(self):
+        """Test that a batch is one RPC and one Redis pipeline for all users."""
+        mock_supabase = Mock()
+        mock_redis = Mock()
+        mock_supabase.rpc.return_value.execute.return_value.data = [
+            {'user_id': 'user-1', 'conversion_count': 3},
+            {'user_id': 'user-2', 'conversion_count': 1}
+        ]
+
+        tracker = UsageTracker(mock_supabase, mock_redis)
+        counts = tracker.increment_usage_batch({'user-1': 2, 'user-2': 1})
+
+        assert counts == {'user-1': 3, 'user-2': 1}
+        mock_supabase.rpc.assert_called_once()
+        name, params = mock_supabase.rpc.call_args[0]
+        assert name == 'increment_user_usage_batch'
+        assert params['p_user_ids'] == ['user-1', 'user-2']
+        assert params['p_amounts'] == [2, 1]
+        assert params['p_month'].endswith('-01')
+
+        pipe = mock_redis.pipeline.return_value
+        assert pipe.set.call_count == 2
+        pipe.execute.assert_called_once()
+        mock_redis.set.assert_not_called()
+
+    def test_batch_empty_is_noop(self):
+        """Test that an empty batch makes no calls."""
+        mock_supabase = Mock()
+
+        assert UsageTracker(mock_supabase, Mock()).increment_usage_batch({}) == {}
+        mock_supabase.rpc.assert_not_called()
+
+    def test_batch_redis_failure_continues(self):
+        """Test that a Redis pipeline failure does not fail the batch."""
+        mock_supabase = Mock()
+        mock_redis = Mock()
+        mock_supabase.rpc.return_value.execute.return_value.data = [
+            {'user_id': 'user-1', 'conversion_count': 1}
+        ]
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis down")
+
+        counts = UsageTracker(mock_supabase, mock_redis).increment_usage_batch({'user-1': 1})
+
+        assert counts == {'user-1': 1}
+
+
+class TestUsageTrackerGetConversionCount:
+    """Test get_conversion_count method."""
+
+    def test_cache_hit_needs_no_supabase_calls(self):
+        """A cached count should be returned without touching the database or Auth."""
+        mock_supabase = Mock()
+        mock_redis = Mock()
+        mock_redis.get.return_value = '4'
+
+        tracker = UsageTracker(mock_supabase, mock_redis)
+        count = tracker.get_conversion_count('user-123')
+
+        assert count == 4
+        mock_supabase.table.assert_not_called()
+        mock_supabase.auth.admin.get_user_by_id.assert_not_called()
+
+    def test_cache_miss_reads_and_caches_database_count(self):
+        """On a cache miss the count comes from user_usage and is written back to Redis."""
+        mock_supabase = Mock()
+        mock_redis = Mock()
+        mock_redis.get.return_value = None
+
+        mock_result = Mock()
+        mock_result.data = [{'conversion_count': 2}]
+        mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_result
+
+        tracker = UsageTracker(mock_supabase, mock_redis)
+        count = tracker.get_conversion_count('user-123', '2025-12-01')
+
+        assert count == 2
+        mock_redis.set.assert_called_once_with('usage:user-123:2025-12', 2, ex=3600)
+
+
 class TestUsageTrackerGetUsage:
     """Test get_usage method."""
 
@@ -319,3 +401,34 @@ class TestUsageTrackerHelperMethods:
 
         # Should strip day and use only YYYY-MM
         assert key == 'usage:user-456:2025-11'
+
+
+class TestGetUsageTracker:
+    """Test the shared UsageTracker accessor."""
+
+    def test_returns_single_shared_instance(self):
+        """get_usage_tracker should build one tracker bound to the shared clients."""
+        mock_supabase = Mock()
+        mock_redis = Mock()
+
+        with patch('app.services.usage_tracker.get_supabase_client', return_value=mock_supabase), \
+                patch('app.services.usage_tracker.init_redis_client', return_value=mock_redis):
+            first = get_usage_tracker()
+            second = get_usage_tracker()
+
+        assert first is second
+        assert first.supabase is mock_supabase
+        assert first.redis is mock_redis
+
+    def test_rebuilds_tracker_once_redis_recovers(self):
+        """A tracker built while Redis was down should not stay uncached."""
+        mock_redis = Mock()
+
+        with patch('app.services.usage_tracker.get_supabase_client', return_value=Mock()), \
+                patch('app.services.usage_tracker.init_redis_client', side_effect=[None, mock_redis]):
+            degraded = get_usage_tracker()
+            recovered = get_usage_tracker()
+
+        assert degraded.redis is None
+        assert recovered is not degraded
+        assert recovered.redis is mock_redis
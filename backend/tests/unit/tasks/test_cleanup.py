@@ -0,0 +1,118 @@
+"""
+Unit Tests for Job Cleanup Tasks
+
+Tests the require_deleted guard used when cleanup is dispatched
+concurrently with the job row delete, the background job delete and the
+account data purge.
+"""
+from unittest.mock import MagicMock, patch
+
+from app.tasks.cleanup import cleanup_job_files_task, delete_job_task, purge_user_data_task
+
+
+class TestCleanupJobFilesTask:
+    """Test cleanup_job_files_task."""
+
+    @patch('app.tasks.cleanup.JobService')
+    @patch('app.tasks.cleanup.SupabaseStorageService')
+    @patch('app.tasks.cleanup.get_supabase_client')
+    def test_cleanup_runs_once_row_is_deleted(self, mock_get_supabase, mock_storage_cls, mock_job_service_cls):
+        """Files are removed when the job row no longer exists."""
+        mock_supabase = MagicMock()
+        mock_supabase.table().select().eq().execute.return_value.data = []
+        mock_get_supabase.return_value = mock_supabase
+
+        result = cleanup_job_files_task.run(
+            job_id="job-1",
+            input_path="user/job-1/input.pdf",
+            output_path=None,
+            require_deleted=True
+        )
+
+        assert result["status"] == "success"
+        mock_job_service_cls.return_value.cleanup_job_files.assert_called_once_with(
+            "user/job-1/input.pdf", None, "job-1"
+        )
+
+    @patch('app.tasks.cleanup.JobService')
+    @patch('app.tasks.cleanup.SupabaseStorageService')
+    @patch('app.tasks.cleanup.get_supabase_client')
+    def test_cleanup_skipped_when_row_still_exists(self, mock_get_supabase, mock_storage_cls, mock_job_service_cls):
+        """Files are kept if the delete never landed and retries are exhausted."""
+        mock_supabase = MagicMock()
+        mock_supabase.table().select().eq().execute.return_value.data = [{"id": "job-1"}]
+        mock_get_supabase.return_value = mock_supabase
+
+        with patch.object(cleanup_job_files_task, "max_retries", 0):
+            result = cleanup_job_files_task.run(
+                job_id="job-1",
+                input_path="user/job-1/input.pdf",
+                output_path=None,
+                require_deleted=True
+            )
+
+        assert result["status"] == "skipped"
+        mock_job_service_cls.return_value.cleanup_job_files.assert_not_called()
+
+
+class TestDeleteJobTask:
+    """Test delete_job_task."""
+
+    @patch('app.tasks.cleanup.init_redis_client', return_value=None)
+    @patch('app.tasks.cleanup.JobService')
+    @patch('app.tasks.cleanup.SupabaseStorageService')
+    @patch('app.tasks.cleanup.get_supabase_client')
+    def test_deletes_row_then_files(self, mock_get_supabase, mock_storage_cls, mock_job_service_cls, _):
+        """The row is hard deleted for its owner, then the files are removed."""
+        job_service = mock_job_service_cls.return_value
+        job_service.delete_job_record.return_value = True
+
+        result = delete_job_task.run(
+            job_id="job-1",
+            user_id="user-1",
+            input_path="user/job-1/input.pdf",
+            output_path="user/job-1/output.epub"
+        )
+
+        assert result["status"] == "success"
+        job_service.delete_job_record.assert_called_once_with("job-1", "user-1")
+        job_service.cleanup_job_files.assert_called_once_with(
+            "user/job-1/input.pdf", "user/job-1/output.epub", "job-1"
+        )
+
+    @patch('app.tasks.cleanup.init_redis_client', return_value=None)
+    @patch('app.tasks.cleanup.JobService')
+    @patch('app.tasks.cleanup.SupabaseStorageService')
+    @patch('app.tasks.cleanup.get_supabase_client')
+    def test_retry_after_row_deleted_still_cleans_files(self, mock_get_supabase, mock_storage_cls, mock_job_service_cls, _):
+        """A retry whose row is already gone still finishes the file cleanup."""
+        job_service = mock_job_service_cls.return_value
+        job_service.delete_job_record.return_value = False
+
+        result = delete_job_task.run(job_id="job-1", user_id="user-1", input_path="user/job-1/input.pdf")
+
+        assert result["status"] == "success"
+        job_service.cleanup_job_files.assert_called_once_with("user/job-1/input.pdf", None, "job-1")
+
+
+class TestPurgeUserDataTask:
+    """Test purge_user_data_task."""
+
+    @patch('app.tasks.cleanup.SupabaseStorageService')
+    @patch('app.tasks.cleanup.get_supabase_client')
+    def test_purges_jobs_and_both_buckets(self, mock_get_supabase, mock_storage_cls):
+        """Job rows are deleted and each bucket's user folder is removed."""
+        mock_supabase = mock_get_supabase.return_value
+        storage_service = mock_storage_cls.return_value
+        storage_service.delete_folder.return_value = 2
+
+        result = purge_user_data_task.run(user_id="user-1")
+
+        assert result["status"] == "success"
+        mock_supabase.rpc.assert_called_once_with("purge_user", {"p_user_id": "user-1"})
+        mock_supabase.table.assert_not_called()
+        assert [c.args for c in storage_service.delete_folder.call_args_list] == [
+            ("uploads", "user-1"),
+            ("downloads", "downloads/user-1")
+        ]
+
@@ -61,6 +61,19 @@ class TestUpdateJobStatus:
         assert update_data["progress"] == 100
 
 
+    @patch('app.tasks.conversion_pipeline.get_redis_client', return_value=None)
+    @patch('app.tasks.conversion_pipeline.get_supabase_client')
+    def test_update_job_status_skips_deleting_jobs(self, mock_get_supabase, mock_get_redis):
+        """A stage finishing after a soft delete must not overwrite DELETING."""
+        mock_supabase = MagicMock()
+        mock_get_supabase.return_value = mock_supabase
+
+        update_job_status("job-id", "CONVERTING", progress=40)
+
+        mock_supabase.table().update().eq.assert_called_with("id", "job-id")
+        mock_supabase.table().update().eq().neq.assert_called_with("status", "DELETING")
+
+
 class TestCheckCancellation:
     """Test the check_cancellation helper function."""
 
@@ -53,7 +53,7 @@ class TestListJobs:
             mock_response = Mock()
             mock_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
                     "user_id": "test-user-id-123",
                     "status": "COMPLETED",
                     "input_path": "uploads/user-id/job-id/document.pdf",
@@ -81,7 +81,7 @@ class TestListJobs:
             assert "limit" in data
             assert "offset" in data
             assert len(data["jobs"]) == 1
-            assert data["jobs"][0]["id"] == "job-1"
+            assert data["jobs"][0]["id"] == "11111111-1111-4111-8111-111111111111"
             assert data["jobs"][0]["status"] == "COMPLETED"
             assert data["jobs"][0]["input_file"] == "document.pdf"
 
@@ -172,7 +172,7 @@ class TestGetJob:
             mock_response = Mock()
             mock_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
                     "user_id": "test-user-id-123",
                     "status": "COMPLETED",
                     "input_path": "uploads/user/job/input.pdf",
@@ -190,13 +190,13 @@ class TestGetJob:
             mock_get_client.return_value = mock_client
 
             response = await client.get(
-                "/api/v1/jobs/job-1",
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
             assert response.status_code == 200
             data = response.json()
-            assert data["id"] == "job-1"
+            assert data["id"] == "11111111-1111-4111-8111-111111111111"
             assert data["status"] == "COMPLETED"
             assert data["quality_report"]["overall_confidence"] == 95
 
@@ -211,7 +211,7 @@ class TestGetJob:
             mock_get_client.return_value = mock_client
 
             response = await client.get(
-                "/api/v1/jobs/non-existent-id",
+                "/api/v1/jobs/99999999-9999-4999-8999-999999999999",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
@@ -221,117 +221,120 @@ class TestGetJob:
 
     async def test_get_job_unauthorized(self, client: AsyncClient):
         """Test getting job without authentication"""
-        response = await client.get("/api/v1/jobs/job-1")
+        response = await client.get("/api/v1/jobs/11111111-1111-4111-8111-111111111111")
         assert response.status_code == 401
 
+    async def test_get_job_malformed_id(self, client: AsyncClient, valid_jwt_token):
+        """Test that a non-UUID job ID is rejected without querying Supabase"""
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+            response = await client.get(
+                "/api/v1/jobs/not-a-uuid",
+                headers={"Authorization": f"Bearer {valid_jwt_token}"}
+            )
+
+            assert response.status_code == 422
+            mock_get_client.return_value.table.assert_not_called()
+
 
 @pytest.mark.asyncio
 class TestDeleteJob:
     """Tests for DELETE /api/v1/jobs/{job_id} endpoint"""
 
     async def test_delete_job_success(self, client: AsyncClient, valid_jwt_token):
-        """Test deleting job with file cleanup"""
+        """Test deleting job marks it and schedules the background delete"""
         with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client, \
              patch("app.api.v1.jobs.SupabaseStorageService") as mock_storage_cls, \
-             patch("app.tasks.cleanup.cleanup_job_files_task") as mock_celery_task:
+             patch("app.api.v1.jobs.celery_app") as mock_celery_app:
 
-            # Mock database responses
             mock_client = Mock()
 
-            # Mock SELECT response (job exists)
-            select_response = Mock()
-            select_response.data = [
+            # Mock UPDATE response (marked DELETING, row returned)
+            update_response = Mock()
+            update_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
                     "user_id": "test-user-id-123",
-                    "status": "COMPLETED",
+                    "status": "DELETING",
                     "input_path": "uploads/user/job/input.pdf",
                     "output_path": "downloads/user/job/output.epub"
                 }
             ]
-
-            # Mock UPDATE response (soft delete)
-            update_response = Mock()
-            update_response.data = [{"id": "job-1"}]
-
-            # Configure mock chains
-            mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = select_response
-            mock_client.table.return_value.update.return_value.eq.return_value.execute.return_value = update_response
+            update_mock = mock_client.table.return_value.update
+            update_mock.return_value.eq.return_value.eq.return_value.execute.return_value = update_response
 
             mock_get_client.return_value = mock_client
+            mock_storage_cls.return_value = Mock()
 
-            # Mock storage service
-            mock_storage = Mock()
-            mock_storage.delete_file.return_value = None
-            mock_storage_cls.return_value = mock_storage
-
-            # Mock Celery task
-            mock_celery_task.delay.return_value = Mock()
+            # Mock Celery dispatch
+            mock_celery_app.send_task.return_value = Mock()
 
             response = await client.delete(
-                "/api/v1/jobs/job-1",
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
-            assert response.status_code == 204
-            # Verify Celery task was scheduled
-            mock_celery_task.delay.assert_called_once()
+            assert response.status_code == 202
+            assert update_mock.call_args[0][0]["status"] == "DELETING"
+            # Row is never deleted on the request path
+            mock_client.table.return_value.delete.assert_not_called()
+            # Verify the delete task was scheduled by name with the file paths
+            mock_celery_app.send_task.assert_called_once()
+            assert mock_celery_app.send_task.call_args[0][0] == "app.tasks.cleanup.delete_job_task"
+            assert mock_celery_app.send_task.call_args[1]["kwargs"] == {
+                "job_id": "11111111-1111-4111-8111-111111111111",
+                "user_id": "test-user-id-123",
+                "input_path": "uploads/user/job/input.pdf",
+                "output_path": "downloads/user/job/output.epub"
+            }
 
     async def test_delete_job_not_found(self, client: AsyncClient, valid_jwt_token):
         """Test deleting non-existent job"""
-        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client, \
+             patch("app.api.v1.jobs.celery_app") as mock_celery_app:
             mock_client = Mock()
             mock_response = Mock()
-            mock_response.data = []  # No job found
+            mock_response.data = []  # No job updated
 
-            mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_response
+            mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = mock_response
             mock_get_client.return_value = mock_client
 
             response = await client.delete(
-                "/api/v1/jobs/non-existent-id",
+                "/api/v1/jobs/99999999-9999-4999-8999-999999999999",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
             assert response.status_code == 404
+            mock_celery_app.send_task.assert_not_called()
 
-    async def test_delete_job_cleanup_failure(self, client: AsyncClient, valid_jwt_token):
-        """Test deleting job when file cleanup fails"""
+    async def test_delete_job_without_output_file(self, client: AsyncClient, valid_jwt_token):
+        """Test deleting job that never produced an output file"""
         with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client, \
              patch("app.api.v1.jobs.SupabaseStorageService") as mock_storage_cls, \
-             patch("app.tasks.cleanup.cleanup_job_files_task") as mock_celery_task:
+             patch("app.api.v1.jobs.celery_app") as mock_celery_app:
 
-            # Mock database responses
             mock_client = Mock()
-            select_response = Mock()
-            select_response.data = [
+            update_response = Mock()
+            update_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
                     "input_path": "uploads/user/job/input.pdf",
                     "output_path": None
                 }
             ]
-
-            update_response = Mock()
-            update_response.data = [{"id": "job-1"}]
-
-            mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = select_response
-            mock_client.table.return_value.update.return_value.eq.return_value.execute.return_value = update_response
+            mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = update_response
             mock_get_client.return_value = mock_client
+            mock_storage_cls.return_value = Mock()
 
-            # Mock storage service
-            mock_storage = Mock()
-            mock_storage_cls.return_value = mock_storage
-
-            # Mock Celery task (cleanup happens async, so delete succeeds)
-            mock_celery_task.delay.return_value = Mock()
+            # Cleanup happens async, so the request succeeds regardless of storage
+            mock_celery_app.send_task.return_value = Mock()
 
-            # Delete should succeed even if cleanup fails later
             response = await client.delete(
-                "/api/v1/jobs/job-1",
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
-            assert response.status_code == 204
+            assert response.status_code == 202
+            assert mock_celery_app.send_task.call_args[1]["kwargs"]["output_path"] is None
 
 
 @pytest.mark.asyncio
@@ -348,7 +351,8 @@ class TestDownloadJob:
             mock_response = Mock()
             mock_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
+                    "user_id": "test-user-id-123",
                     "status": "COMPLETED",
                     "output_path": "downloads/user/job/output.epub"
                 }
@@ -363,7 +367,7 @@ class TestDownloadJob:
             mock_storage_cls.return_value = mock_storage
 
             response = await client.get(
-                "/api/v1/jobs/job-1/download",
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/download",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
@@ -380,7 +384,7 @@ class TestDownloadJob:
             mock_response = Mock()
             mock_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
                     "status": "PROCESSING",  # Not completed
                     "output_path": None
                 }
@@ -390,7 +394,7 @@ class TestDownloadJob:
             mock_get_client.return_value = mock_client
 
             response = await client.get(
-                "/api/v1/jobs/job-1/download",
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/download",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
@@ -406,7 +410,7 @@ class TestDownloadJob:
             mock_response = Mock()
             mock_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
                     "status": "COMPLETED",
                     "output_path": None  # No output file
                 }
@@ -416,7 +420,7 @@ class TestDownloadJob:
             mock_get_client.return_value = mock_client
 
             response = await client.get(
-                "/api/v1/jobs/job-1/download",
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/download",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
@@ -436,7 +440,7 @@ class TestDownloadJob:
             mock_response = Mock()
             mock_response.data = [
                 {
-                    "id": "job-1",
+                    "id": "11111111-1111-4111-8111-111111111111",
                     "status": "COMPLETED",
                     "output_path": "downloads/user/job/output.epub"
                 }
@@ -451,7 +455,7 @@ class TestDownloadJob:
             mock_storage_cls.return_value = mock_storage
 
             response = await client.get(
-                "/api/v1/jobs/job-1/download",
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/download",
                 headers={"Authorization": f"Bearer {valid_jwt_token}"}
             )
 
@@ -459,3 +463,200 @@ class TestDownloadJob:
             data = response.json()
             detail = data["detail"]
             assert "storage error" in detail["detail"].lower()
+
+
+@pytest.mark.asyncio
+class TestDownloadJobRedirect:
+    """Tests for GET /api/v1/jobs/{job_id}/download/redirect endpoint"""
+
+    async def test_download_redirect_success(self, client: AsyncClient, valid_jwt_token):
+        """Test that a completed job redirects to the signed URL"""
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client, \
+             patch("app.api.v1.jobs.SupabaseStorageService") as mock_storage_cls:
+
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.data = [
+                {
+                    "id": "11111111-1111-4111-8111-111111111111",
+                    "user_id": "test-user-id-123",
+                    "status": "COMPLETED",
+                    "output_path": "downloads/user/job/output.epub"
+                }
+            ]
+
+            mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_response
+            mock_get_client.return_value = mock_client
+
+            mock_storage = Mock()
+            mock_storage.generate_signed_url.return_value = "https://supabase.co/signed-url"
+            mock_storage_cls.return_value = mock_storage
+
+            response = await client.get(
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/download/redirect",
+                headers={"Authorization": f"Bearer {valid_jwt_token}"},
+                follow_redirects=False
+            )
+
+            assert response.status_code == 307
+            assert response.headers["location"] == "https://supabase.co/signed-url"
+            assert response.headers["cache-control"].startswith("private, max-age=")
+
+    async def test_download_redirect_not_completed(self, client: AsyncClient, valid_jwt_token):
+        """Test that an unfinished job returns 404 instead of redirecting"""
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.data = [
+                {
+                    "id": "11111111-1111-4111-8111-111111111111",
+                    "status": "PROCESSING",
+                    "output_path": None
+                }
+            ]
+
+            mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_response
+            mock_get_client.return_value = mock_client
+
+            response = await client.get(
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/download/redirect",
+                headers={"Authorization": f"Bearer {valid_jwt_token}"},
+                follow_redirects=False
+            )
+
+            assert response.status_code == 404
+            assert response.json()["detail"]["code"] == "NOT_READY"
+
+
+@pytest.mark.asyncio
+class TestReportIssue:
+    """Tests for POST /api/v1/jobs/{job_id}/issues endpoint"""
+
+    async def test_report_issue_single_rpc(self, client: AsyncClient, valid_jwt_token):
+        """Test that the issue and its analytics event are written by one RPC"""
+        job_id = "11111111-1111-4111-8111-111111111111"
+
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
+            mock_client.rpc.return_value.execute.return_value = Mock(data=[{
+                "id": "issue-1",
+                "created_at": "2025-12-15T10:35:00Z"
+            }])
+
+            response = await client.post(
+                f"/api/v1/jobs/{job_id}/issues",
+                json={"issue_type": "table_formatting", "description": "Table on page 3 is split"},
+                headers={"Authorization": f"Bearer {valid_jwt_token}"}
+            )
+
+            assert response.status_code == 201
+            assert response.json()["issue_id"] == "issue-1"
+            mock_client.rpc.assert_called_once()
+            assert mock_client.rpc.call_args[0][0] == "report_issue_tx"
+            mock_client.table.assert_not_called()
+
+    async def test_report_issue_foreign_job_is_not_found(self, client: AsyncClient, valid_jwt_token):
+        """Test that another user's job is reported as 404"""
+        from postgrest.exceptions import APIError
+
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+            mock_get_client.return_value.rpc.return_value.execute.side_effect = APIError(
+                {"code": "42501", "message": "Job does not belong to user"}
+            )
+
+            response = await client.post(
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/issues",
+                json={"issue_type": "other", "description": "Something looks wrong"},
+                headers={"Authorization": f"Bearer {valid_jwt_token}"}
+            )
+
+            assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestGetJobFeedback:
+    """Tests for GET /api/v1/jobs/{job_id}/feedback endpoint"""
+
+    async def test_get_job_feedback_foreign_job_is_not_found(self, client: AsyncClient, valid_jwt_token):
+        """Test that another user's job is reported as 404 without listing rows"""
+        from postgrest.exceptions import APIError
+
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+            mock_get_client.return_value.rpc.return_value.execute.side_effect = APIError(
+                {"code": "42501", "message": "Job does not belong to user"}
+            )
+
+            response = await client.get(
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/feedback",
+                headers={"Authorization": f"Bearer {valid_jwt_token}"}
+            )
+
+            assert response.status_code == 404
+            assert response.json()["detail"]["code"] == "NOT_FOUND"
+
+    async def test_get_job_feedback_single_rpc(self, client: AsyncClient, valid_jwt_token):
+        """Test listing feedback for an owned job with one RPC and no table reads"""
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
+            mock_client.rpc.return_value.execute.return_value = Mock(data=[{
+                "id": "feedback-1",
+                "job_id": "11111111-1111-4111-8111-111111111111",
+                "user_id": "test-user-id-123",
+                "rating": "positive",
+                "comment": None,
+                "created_at": "2025-12-15T10:00:00Z"
+            }])
+
+            response = await client.get(
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/feedback",
+                headers={"Authorization": f"Bearer {valid_jwt_token}"}
+            )
+
+            assert response.status_code == 200
+            assert response.json()["total"] == 1
+            assert mock_client.rpc.call_args[0][0] == "list_job_feedback_tx"
+            mock_client.table.assert_not_called()
+
+    async def test_get_job_issues_empty(self, client: AsyncClient, valid_jwt_token):
+        """Test that an owned job without issues returns an empty list, not 404"""
+        with patch("app.api.v1.jobs.get_supabase_client") as mock_get_client:
+            mock_get_client.return_value.rpc.return_value.execute.return_value = Mock(data=[])
+
+            response = await client.get(
+                "/api/v1/jobs/11111111-1111-4111-8111-111111111111/issues",
+                headers={"Authorization": f"Bearer {valid_jwt_token}"}
+            )
+
+            assert response.status_code == 200
+            assert response.json() == {"issues": [], "total": 0}
+
+
+class TestGetJobService:
+    """Tests for the shared JobService dependency"""
+
+    def test_reuses_service_while_redis_client_unchanged(self):
+        """Test that one JobService is built and reused across requests"""
+        from app.api.v1.jobs import get_job_service
+
+        mock_redis = Mock()
+        with patch("app.api.v1.jobs.get_supabase_client"), \
+             patch("app.api.v1.jobs.init_redis_client", return_value=mock_redis):
+            first = get_job_service()
+            second = get_job_service()
+
+        assert first is second
+        assert first.redis is mock_redis
+
+    def test_rebuilds_service_once_redis_recovers(self):
+        """Test that a service built while Redis was down does not stay uncached"""
+        from app.api.v1.jobs import get_job_service
+
+        mock_redis = Mock()
+        with patch("app.api.v1.jobs.get_supabase_client"), \
+             patch("app.api.v1.jobs.init_redis_client", side_effect=[None, mock_redis]):
+            degraded = get_job_service()
+            recovered = get_job_service()
+
+        assert degraded.redis is None
+        assert recovered is not degraded
+        assert recovered.redis is mock_redis
@@ -3,11 +3,13 @@ Unit Tests for Authentication Middleware
 
 Tests for JWT validation and user extraction from Supabase tokens.
 """
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
-from jose import jwt
+import jwt
 
 from app.core.auth import get_current_user
 from app.schemas.auth import AuthenticatedUser, SubscriptionTier
@@ -194,3 +196,78 @@ async def test_get_current_user_missing_tier_defaults_to_free():
         user = await get_current_user(credentials)
         
         assert user.tier == SubscriptionTier.FREE
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_memoizes_verified_token():
+    """Test that a repeat request with the same token skips JWT decoding."""
+    token = create_test_token()
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch("app.core.auth.settings") as mock_settings:
+        mock_settings.SUPABASE_JWT_SECRET = TEST_JWT_SECRET
+        first = await get_current_user(credentials)
+
+    with patch("app.core.auth.jwt.decode") as mock_decode:
+        second = await get_current_user(credentials)
+
+    assert second == first
+    mock_decode.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_respects_expiry():
+    """Test that a memoized token is re-verified once its exp has passed."""
+    token = create_test_token()
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch("app.core.auth.settings") as mock_settings:
+        mock_settings.SUPABASE_JWT_SECRET = TEST_JWT_SECRET
+        await get_current_user(credentials)
+
+        # Jump past the token's exp - cache entry is stale and PyJWT rejects the token
+        with patch("app.core.auth.time.time", return_value=9_999_999_999):
+            with pytest.raises(HTTPException) as exc_info:
+                with patch("app.core.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError("expired")):
+                    await get_current_user(credentials)
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_capped_by_ttl():
+    """Test that a memoized token is re-verified after TOKEN_CACHE_TTL even before exp."""
+    token = create_test_token()
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch("app.core.auth.settings") as mock_settings, \
+         patch("app.core.auth.TOKEN_CACHE_TTL", 30):
+        mock_settings.SUPABASE_JWT_SECRET = TEST_JWT_SECRET
+        await get_current_user(credentials)
+
+        # 60s later the token is still valid (exp is +1h) but the cache entry is not
+        with patch("app.core.auth.time.time", return_value=time.time() + 60), \
+             patch("app.core.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+            await get_current_user(credentials)
+
+    mock_decode.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_token_without_exp():
+    """Test that a token without an expiry claim is rejected in the single decode."""
+    payload = {
+        "sub": TEST_USER_ID,
+        "email": TEST_EMAIL,
+        "aud": "authenticated",
+    }
+    token = jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch("app.core.auth.settings") as mock_settings:
+        mock_settings.SUPABASE_JWT_SECRET = TEST_JWT_SECRET
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials)
+
+        assert exc_info.value.status_code == 401
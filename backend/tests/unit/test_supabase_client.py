@@ -0,0 +1,42 @@
+"""
+Unit tests for the shared Supabase client factory.
+"""
+from unittest.mock import patch
+
+from app.core.supabase import get_supabase_client, reset_supabase_client
+
+
+def test_get_supabase_client_returns_singleton():
+    """Repeated calls reuse the same client instead of rebuilding it."""
+    with patch("app.core.supabase.create_client") as mock_create:
+        first = get_supabase_client()
+        second = get_supabase_client()
+
+    assert first is second
+    mock_create.assert_called_once()
+
+
+def test_reset_supabase_client_rebuilds_client():
+    """reset_supabase_client() forces the next call to create a new client."""
+    with patch("app.core.supabase.create_client") as mock_create:
+        mock_create.side_effect = [object(), object()]
+        first = get_supabase_client()
+        reset_supabase_client()
+        second = get_supabase_client()
+
+    assert first is not second
+    assert mock_create.call_count == 2
+
+
+def test_supabase_client_uses_shared_http2_pool():
+    """The client is built on the shared HTTP/2 transport, closed on reset."""
+    with patch("app.core.supabase.create_client") as mock_create, \
+         patch("app.core.supabase._build_http_client") as mock_build:
+        get_supabase_client()
+        http_client = mock_build.return_value
+
+        options = mock_create.call_args.kwargs["options"]
+        assert options.httpx_client is http_client
+
+        reset_supabase_client()
+        http_client.close.assert_called_once()
@@ -27,7 +27,7 @@ import requests
 # Production URLs
 FRONTEND_URL = "https://transfer2read.app"
 BACKEND_API_URL = "https://api.transfer2read.app"
-HEALTH_ENDPOINT = f"{BACKEND_API_URL}/api/health"
+HEALTH_ENDPOINT = f"{BACKEND_API_URL}/api/readyz"  # Readiness probe reports database/redis status
 
 class Colors:
     """ANSI color codes for terminal output"""